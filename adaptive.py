@@ -0,0 +1,97 @@
+#Adaptive sampling: solve instances in rounds until the distribution is known well enough.
+#
+#After every round we compute, for every number of real solutions seen so far, a Wilson score
+#confidence interval for its proportion among the instances. The run stops as soon as
+#	every interval has half-width at most precision (if a precision is given), and
+#	the target number of real solutions has been seen at least target_hits times (if a target is given),
+#or when the maximal number of instances is reached.
+#
+#The size of the next round is estimated from the current proportions: the number of instances
+#still needed to reach the precision (z^2*p*(1-p)/precision^2 for the least certain proportion p)
+#and the target (target_hits/p_target more hits), but at least min_round and at most as many
+#instances as were solved so far, so the number of instances at most doubles per round.
+#
+
+import math
+import sys
+
+#Output: The z value of a two-sided confidence interval with the given confidence, eg. 1.96 for 0.95.
+def z_value(confidence):
+	lo, hi = 0.0, 10.0
+	for it in range(100):
+		mid = (lo+hi)/2
+		if math.erf(mid/math.sqrt(2)) < confidence:
+			lo = mid
+		else:
+			hi = mid
+	return (lo+hi)/2
+
+#Input: The number of hits k among N instances, and the z value of the confidence level.
+#Output: The Wilson score interval (lower, upper) for the proportion k/N.
+def wilson_interval(k,N,z):
+	if N == 0:
+		return 0.0, 1.0
+	p = float(k)/N
+	center = (p+z*z/(2*N))/(1+z*z/N)
+	half = z*math.sqrt(p*(1-p)/N+z*z/(4.0*N*N))/(1+z*z/N)
+	return max(0.0,center-half), min(1.0,center+half)
+
+class StoppingRule(object):
+	#precision is the largest allowed half-width of the confidence intervals (None to ignore it),
+	#target a number of real solutions that must be seen at least target_hits times (None to ignore it).
+	def __init__(self,precision=None,target=None,target_hits=0,confidence=0.95,min_round=100):
+		self.precision = precision
+		self.target = target
+		self.target_hits = target_hits
+		self.z = z_value(confidence)
+		self.min_round = min_round
+
+	#Output: A dictionary {number of real solutions : (lower, upper)} of confidence intervals.
+	def intervals(self,freq_count):
+		N = sum(freq_count.values())
+		return dict((k,wilson_interval(v,N,self.z)) for k, v in freq_count.items())
+
+	#Output: True if the distribution in freq_count satisfies the rule.
+	def satisfied(self,freq_count):
+		N = sum(freq_count.values())
+		if N == 0:
+			return False
+		if self.precision is not None:
+			if any((hi-lo)/2 > self.precision for lo, hi in self.intervals(freq_count).values()):
+				return False
+		if self.target is not None and freq_count.get(self.target,0) < self.target_hits:
+			return False
+		return True
+
+	#Output: The number of instances to solve in the next round.
+	def next_round(self,freq_count):
+		N = sum(freq_count.values())
+		needed = self.min_round
+		if N > 0:
+			if self.precision is not None:
+				p_var = max([float(v)/N*(1-float(v)/N) for v in freq_count.values()])
+				needed = max(needed,int(math.ceil(self.z**2*p_var/self.precision**2))-N)
+			if self.target is not None:
+				hits = freq_count.get(self.target,0)
+				if hits > 0:
+					needed = max(needed,int(math.ceil((self.target_hits-hits)*float(N)/hits)))
+				else:
+					needed = max(needed,N)
+		return max(self.min_round,min(needed,max(N,self.min_round)))
+
+#Solves rounds of instances until rule is satisfied or max_iters instances were solved.
+#solve_round(start,stop) must solve the instances in range(start,stop) and return their frequency count.
+#freq_count holds the instances counted before the first round (eg. from a resumed log).
+#Output: The merged frequency count and the number of instances solved.
+def run_adaptive(solve_round,rule,max_iters,freq_count=None,verbose=False):
+	freq_count = dict(freq_count) if freq_count is not None else {}
+	done = 0
+	while done < max_iters and not rule.satisfied(freq_count):
+		size = min(rule.next_round(freq_count),max_iters-done)
+		for k, v in solve_round(done,done+size).items():
+			freq_count[k] = freq_count.get(k,0) + v
+		done += size
+		if verbose:
+			widths = [(hi-lo)/2 for lo, hi in rule.intervals(freq_count).values()]
+			sys.stdout.write(str(done)+' instances solved, largest interval half-width '+('%.4f' % max(widths) if widths else '-')+'\n')
+	return freq_count, done
@@ -0,0 +1,238 @@
+#An archive of the full solution sets of the instances of a run, for analysis after the run.
+#
+#The drivers keep only the number of real solutions of every instance. With -archive [FOLDER] (bertini_solve.py, or
+#plan -archive in shards.py) the susceptances and all finite solutions of every instance are kept as well, so that
+#later questions (which buses have real angles, how close to the real axis the solutions come, ...) do not need the
+#instances to be solved again.
+#
+#The archive is a folder holding
+#	(folder)/meta.json		the graph, its graph-id and the seed of the run,
+#	(folder)/chunk_(tag)_(k).npz	up to CHUNK_SIZE instances solved by one writer (see numpy.savez_compressed),
+#					in blocks j = 0, 1, ... of up to BLOCK_SIZE instances:
+#		index_j		the indices of the instances (as in the run log),
+#		b_j		their susceptances, one row per instance,
+#		offsets_j	the solutions of the k-th instance are the rows offsets_j[k]:offsets_j[k+1] of solutions_j,
+#		solutions_j	all finite solutions, one row (x1,...,x(n-1),y1,...,y(n-1)) per solution, complex.
+#Every writer writes its own chunks, whose tag starts with the time the writer was made, so runs, resumed runs and
+#the workers of a pool all append to the same archive. A worker process has one writer (see process_writer), which
+#appends a block to its current chunk whenever it is flushed (eg. at the end of every pool chunk), so a run writes a
+#few large chunks. The chunk is copied, extended and renamed back, so readers never see it half written. If an
+#instance was solved more than once (a resumed or requeued run), the latest block holding it is used.
+#
+#Reading is lazy: the archive opens one chunk at a time, and only the members of a chunk that are used are read, so
+#archives of millions of instances are read without loading everything into memory.
+#
+#Usage:
+#	archive = Archive('Data/archive_K5')
+#	for i, b, sols in archive.instances():
+#		...
+#	b, sols = archive.get(17)
+#
+#To see what is in an archive, or the solutions of some of its instances:
+#python archive.py info -archive [FOLDER]
+#python archive.py show -archive [FOLDER] -instances [I,J,...]
+#
+
+import numpy as np
+import argparse
+import zipfile
+import socket
+import shutil
+import json
+import time
+import io
+import os
+
+CHUNK_SIZE = 10000 #Instances per chunk, a writer starts a new chunk when its chunk is full
+BLOCK_SIZE = 2000 #Instances a writer holds before appending them to its chunk, this bounds its memory
+
+_writers = [0]#Number of writers made by this process, part of their tag
+_process_writers = {}#The writer of this process for every archive folder, see process_writer
+
+#Writes obj as JSON to path, through a temporary file in the same folder, so readers never see it half written.
+def _write_json(path,obj):
+	folder, name = os.path.split(path)
+	tmp = os.path.join(folder,'.'+name+'.'+socket.gethostname()+'_'+str(os.getpid()))
+	with open(tmp,'w') as f:
+		json.dump(obj,f)
+	os.rename(tmp,path)
+
+#Creates the archive folder path for the instances of graph (see graphs.py), or checks that an existing archive
+#is one of the same run, so that eg. a resumed run appends to it. meta holds the graph-id, the seed, etc. of the run.
+#The instances are stored by their index in the run, so the instances of another seed cannot be added.
+def create_archive(path,graph,**meta):
+	meta_path = os.path.join(path,'meta.json')
+	if os.path.exists(meta_path):
+		with open(meta_path,'r') as f:
+			old = json.load(f)
+		if old['n'] != graph.n or [tuple(e) for e in old['edges']] != [tuple(e) for e in graph.edges]:
+			raise ValueError('The archive '+path+' holds instances of another graph')
+		if old.get('seed') != meta.get('seed'):
+			raise ValueError('The archive '+path+' holds the instances of seed '+str(old.get('seed'))+', not '+str(meta.get('seed')))
+		return
+	if not os.path.isdir(path):
+		os.makedirs(path)
+	meta.update({'n':graph.n,'edges':graph.edges,'created':time.strftime('%b-%d-%Y_%H:%M:%S',time.localtime())})
+	_write_json(meta_path,meta)
+
+class ArchiveWriter(object):
+	#Appends instances to the archive folder path (see create_archive), chunk_size instances per chunk,
+	#in blocks of at most block_size instances.
+	#With path None nothing is stored, so that the solve loops can call add whether or not the run is archived.
+	def __init__(self,path,chunk_size=CHUNK_SIZE,block_size=BLOCK_SIZE):
+		self.path = path
+		self.chunk_size = chunk_size
+		self.block_size = block_size
+		_writers[0] += 1
+		self.tag = '%010d_%s_%d_%d' % (int(time.time()),socket.gethostname(),os.getpid(),_writers[0])
+		self.chunks = 0
+		self.blocks = 0#Blocks in the current chunk
+		self.in_chunk = 0#Instances in the current chunk
+		self._clear()
+
+	def _clear(self):
+		self.index, self.b, self.sols = [], [], []
+
+	#Adds instance i with susceptances b and the array sols of its finite solutions (nothing if sols is None).
+	def add(self,i,b,sols):
+		if self.path is None or sols is None:
+			return
+		self.index.append(i)
+		self.b.append(np.asarray(b,dtype=float))
+		self.sols.append(np.asarray(sols,dtype=complex))
+		if len(self.index) >= self.block_size:
+			self.flush()
+
+	#Appends the instances added since the last flush to the current chunk, as a new block.
+	#The first block of a chunk is written with numpy.savez_compressed, the next ones are added to the zip file
+	#in the same format, on a copy of the chunk that then replaces it.
+	def flush(self):
+		if self.path is None or not self.index:
+			return
+		offsets = np.zeros(len(self.sols)+1,dtype=np.int64)
+		offsets[1:] = np.cumsum([s.shape[0] for s in self.sols])
+		dim = max([s.shape[1] for s in self.sols if s.ndim == 2] or [0])
+		block = {
+			'index_%d' % self.blocks : np.array(self.index,dtype=np.int64),
+			'b_%d' % self.blocks : np.array(self.b),
+			'offsets_%d' % self.blocks : offsets,
+			'solutions_%d' % self.blocks : np.concatenate([s.reshape(s.shape[0],dim) for s in self.sols]),
+		}
+		name = 'chunk_%s_%06d.npz' % (self.tag,self.chunks)
+		tmp = os.path.join(self.path,'.'+name)
+		if self.blocks == 0:
+			with open(tmp,'wb') as f:
+				np.savez_compressed(f,**block)
+		else:
+			shutil.copyfile(os.path.join(self.path,name),tmp)
+			with zipfile.ZipFile(tmp,'a',zipfile.ZIP_DEFLATED,allowZip64=True) as f:
+				for key, value in block.items():
+					data = io.BytesIO()
+					np.lib.format.write_array(data,value,allow_pickle=False)
+					f.writestr(key+'.npy',data.getvalue())
+		os.rename(tmp,os.path.join(self.path,name))
+		self.blocks += 1
+		self.in_chunk += len(self.index)
+		if self.in_chunk >= self.chunk_size:
+			self.chunks += 1
+			self.blocks = 0
+			self.in_chunk = 0
+		self._clear()
+
+	def close(self):
+		self.flush()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self,*exc):
+		self.close()
+
+#Output: The writer of this process for the archive folder path (see ArchiveWriter), made on first use.
+#The solve loops of a worker process all add to this writer and flush it when they are done, so that every worker
+#appends to a few large chunks instead of writing a chunk per pool chunk.
+def process_writer(path):
+	key = (os.getpid(),path)
+	if key not in _process_writers:
+		_process_writers[key] = ArchiveWriter(path)
+	return _process_writers[key]
+
+#Output: The numbers of the blocks of the open chunk (see numpy.load).
+def _blocks(chunk):
+	return sorted(int(name[len('index_'):]) for name in chunk.files if name.startswith('index_'))
+
+class Archive(object):
+	#Opens the archive folder path for reading.
+	def __init__(self,path):
+		self.path = path
+		with open(os.path.join(path,'meta.json'),'r') as f:
+			self.meta = json.load(f)
+		self._index = None
+
+	#Output: The names of the chunks of the archive, oldest writer first.
+	def chunk_names(self):
+		return sorted(name for name in os.listdir(self.path) if name.startswith('chunk_') and name.endswith('.npz'))
+
+	#Output: A dictionary giving the chunk, block and position of every instance in the archive, from the latest
+	#block holding it. Only the indices of the blocks are read.
+	def index(self):
+		if self._index is None:
+			self._index = {}
+			for name in self.chunk_names():
+				with np.load(os.path.join(self.path,name)) as chunk:
+					for j in _blocks(chunk):
+						for k, i in enumerate(chunk['index_%d' % j].tolist()):
+							self._index[i] = (name,j,k)
+		return self._index
+
+	#Output: The number of instances in the archive.
+	def __len__(self):
+		return len(self.index())
+
+	#Yields (index, susceptances, solutions) of the instances in the archive, or of those in indices, a block at a time.
+	def instances(self,indices=None):
+		index = self.index()
+		wanted = set(index.keys()) if indices is None else set(indices)
+		for name in self.chunk_names():
+			with np.load(os.path.join(self.path,name)) as chunk:
+				for j in _blocks(chunk):
+					keep = [(k,i) for k, i in enumerate(chunk['index_%d' % j].tolist()) if i in wanted and index[i] == (name,j,k)]
+					if not keep:
+						continue
+					b, offsets, solutions = chunk['b_%d' % j], chunk['offsets_%d' % j], chunk['solutions_%d' % j]
+					for k, i in keep:
+						yield i, b[k], solutions[offsets[k]:offsets[k+1]]
+
+	#Output: The susceptances and the solutions of instance i.
+	def get(self,i):
+		name, j, k = self.index()[i]
+		with np.load(os.path.join(self.path,name)) as chunk:
+			offsets = chunk['offsets_%d' % j]
+			return chunk['b_%d' % j][k], chunk['solutions_%d' % j][offsets[k]:offsets[k+1]]
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser()
+	parser.add_argument('command', choices=['info','show'])
+	parser.add_argument('-archive', dest="archive", type=str, required=True)#The archive folder
+	parser.add_argument('-instances', dest="instances", type=str, default="")#Comma separated indices of the instances to show, eg. "17,2041"
+	parser.add_argument('-tol', type=float, dest="tol", default=0.0000001)#What tolerance should we use to determine if something is a real solution
+	args = parser.parse_args()
+	archive = Archive(args.archive)
+
+	if args.command == 'info':
+		names = archive.chunk_names()
+		size = sum(os.path.getsize(os.path.join(args.archive,name)) for name in names)
+		num_sols = 0
+		for name in names:
+			with np.load(os.path.join(args.archive,name)) as chunk:
+				num_sols += sum(int(chunk['offsets_%d' % j][-1]) for j in _blocks(chunk))
+		print('%s: graph %s on %d buses, seed %s' % (args.archive,archive.meta.get('graph_id'),archive.meta['n'],archive.meta.get('seed')))
+		print('%d instances, %d solutions in %d chunks, %.1f MB' % (len(archive),num_sols,len(names),size/1e6))
+	else:
+		indices = [int(i) for i in args.instances.split(',')] if len(args.instances) > 0 else None
+		for i, b, sols in archive.instances(indices):
+			real = np.all(np.abs(sols.imag) <= args.tol,axis=1)
+			print('Instance %d: %d finite solutions, %d real' % (i,sols.shape[0],int(np.sum(real))))
+			print('  b = '+' '.join(['%.15g' % v for v in b]))
+			for sol, is_real in zip(sols,real):
+				print('  '+' '.join(['%.15g%+.15gi' % (v.real,v.imag) for v in sol])+(' (real)' if is_real else ''))
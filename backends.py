@@ -0,0 +1,198 @@
+#Solver backends: one interface for the different ways of solving the power flow equations.
+#
+#A backend is made for one graph (and one scratch folder) and solves batches of instances:
+#	backend = make_backend('phc',graph,workdir,'temp_123')
+#	solutions = backend.solve(b)
+#where b is an array of shape (k,|E|) of susceptances, and solutions is a list of k arrays of shape
+#(number of finite solutions,2n-2) with the coordinates (x_1,...,x_{n-1},y_1,...,y_{n-1}) of the solutions,
+#or None for the instances whose solver run failed or whose output could not be read.
+#
+#The backends are
+#	bertini	./bertini in a subprocess, reading its finite_solutions file
+#	phc	./phc -b in a subprocess, reading the solutions it appends to the file of the system
+#	phcpy	PHCpack's Python bindings in-process, if phcpy is installed; no files are written
+#	native	the NumPy homotopy solver in homotopy.py, in-process and vectorized over the batch
+#The subprocess backends time the write, solve and parse stages of every instance if given a Telemetry (see telemetry.py).
+#
+
+import numpy as np
+import subprocess
+import os
+
+from sampling import bus_incidence, pq_eqs
+from templates import InputTemplate
+from workspace import remove_files
+from telemetry import Telemetry
+from homotopy import solve_batch
+from bounds import mixed_volume_from_phc, check_finite
+import bertini_output
+import phc_output
+
+BERTINI = os.path.abspath('bertini')#Absolute paths, since the solvers are run from scratch folders
+PHC = os.path.abspath('phc')
+BACKENDS = ['bertini','phc','phcpy','native']
+HIGH_PRECISION = ['MPTYPE:2','FinalTol:1e-14'] #Bertini settings for adaptive multiprecision and tighter endpoints, eg. to check an instance again
+
+#Output: The names of the variables of the graph with n buses, in the order of the columns of the solutions.
+def variable_names(n):
+	return ['x'+str(i) for i in range(1,n)]+['y'+str(i) for i in range(1,n)]
+
+class Backend(object):
+	lists_diverged = False #True if the solver's solution list may include the endpoints of diverged paths
+
+	def __init__(self,graph):
+		self.graph = graph
+		self.dim = 2*graph.n-2
+
+	#Input: An array b of shape (k,|E|) of susceptances.
+	#Output: A list of k arrays of solutions (or None for failed instances).
+	def solve(self,b,telemetry=None):
+		telemetry = telemetry if telemetry is not None else Telemetry()
+		return [self.solve_one(row,telemetry) for row in b]
+
+#Runs ./bertini on every instance inside workdir, with the input file name.input.
+#config is an optional list of Bertini settings, eg. HIGH_PRECISION.
+class BertiniBackend(Backend):
+	def __init__(self,graph,workdir='.',name='temp',config=None):
+		Backend.__init__(self,graph)
+		self.template = InputTemplate(graph.n,graph.edges,'bertini',config)
+		self.workdir = workdir
+		self.name = name
+
+	def solve_one(self,b,telemetry):
+		with telemetry.stage('write'):
+			self.template.write(b,os.path.join(self.workdir,self.name))
+		with telemetry.stage('solve'):
+			try:
+				subprocess.call([BERTINI,self.name+'.input'],cwd=self.workdir)
+			except OSError:
+				telemetry.fail('solver_error')
+		with telemetry.stage('parse'):
+			try:
+				sols = bertini_output.read_solutions(os.path.join(self.workdir,'finite_solutions'),self.dim)
+			except (IOError,ValueError,IndexError):
+				sols = None
+		#The output files are removed too, so that a failed run is not read as the next instance
+		with telemetry.stage('cleanup'):
+			remove_files(self.workdir,self.name+'.input','finite_solutions')
+		return sols
+
+#Runs ./phc -b on every instance inside workdir, with the files name_eqs.txt and name_roots.txt.
+#The mixed volume from the root counts in PHC's report is kept in self.mixed_volume (see bounds.py).
+class PHCBackend(Backend):
+	lists_diverged = True
+
+	def __init__(self,graph,workdir='.',name='temp'):
+		Backend.__init__(self,graph)
+		self.template = InputTemplate(graph.n,graph.edges,'phc')
+		self.workdir = workdir
+		self.name = name
+		self.mixed_volume = None
+		self._read_report = False
+
+	def solve_one(self,b,telemetry):
+		eqs_file = os.path.join(self.workdir,self.name+'_eqs.txt')
+		with telemetry.stage('write'):
+			self.template.write(b,os.path.join(self.workdir,self.name))
+		with telemetry.stage('solve'):
+			try:
+				subprocess.call([PHC,'-b',self.name+'_eqs.txt',self.name+'_roots.txt'],cwd=self.workdir)
+			except OSError:
+				telemetry.fail('solver_error')
+		with telemetry.stage('parse'):
+			try:
+				#phc -b appends the solutions it found to the file of the system
+				sols = phc_output.read_solutions(eqs_file,variable_names(self.graph.n))
+			except (IOError,ValueError,IndexError):
+				sols = None
+			if not self._read_report:
+				self.mixed_volume = mixed_volume_from_phc(os.path.join(self.workdir,self.name+'_roots.txt'))
+				self._read_report = True
+		with telemetry.stage('cleanup'):
+			remove_files(self.workdir,self.name+'_eqs.txt',self.name+'_roots.txt')
+		return sols
+
+#Solves every instance with the blackbox solver of phcpy, without writing any files.
+class PhcpyBackend(Backend):
+	lists_diverged = True
+
+	def __init__(self,graph,workdir=None,name=None):
+		Backend.__init__(self,graph)
+		try:
+			from phcpy.solver import solve
+			from phcpy.solutions import strsol2dict
+		except ImportError:
+			raise ImportError('The phcpy backend needs PHCpack\'s Python bindings (phcpy), which are not installed')
+		self._solve = solve
+		self._strsol2dict = strsol2dict
+		self.incidence = bus_incidence(graph.n,graph.edges)
+		self.names = variable_names(graph.n)
+
+	def solve_one(self,b,telemetry):
+		with telemetry.stage('write'):
+			pols = [eq+';' for eq in pq_eqs(self.incidence,b)]
+		with telemetry.stage('solve'):
+			try:
+				try:
+					sols = self._solve(pols,verbose=False)
+				except TypeError:#Older versions of phcpy
+					sols = self._solve(pols,silent=True)
+			except RuntimeError:
+				telemetry.fail('solver_error')
+				return None
+		with telemetry.stage('parse'):
+			result = np.zeros([len(sols),self.dim],dtype=complex)
+			for k, sol in enumerate(sols):
+				d = self._strsol2dict(sol)
+				result[k] = [complex(d[name]) for name in self.names]
+		return result
+
+#Solves the whole batch at once with the homotopy solver in homotopy.py.
+class NativeBackend(Backend):
+	def __init__(self,graph,workdir=None,name=None):
+		Backend.__init__(self,graph)
+
+	def solve(self,b,telemetry=None):
+		telemetry = telemetry if telemetry is not None else Telemetry()
+		with telemetry.stage('solve'):
+			return solve_batch(self.graph.n,self.graph.edges,b)
+
+_CLASSES = {
+	'bertini' : BertiniBackend,
+	'phc' : PHCBackend,
+	'phcpy' : PhcpyBackend,
+	'native' : NativeBackend,
+}
+
+#Output: The backend called kind (one of BACKENDS) for the graph, writing its files (if any) to workdir with the file name name.
+#config is a list of Bertini settings, only the bertini backend takes it.
+def make_backend(kind,graph,workdir='.',name='temp',config=None):
+	if config is not None:
+		if kind != 'bertini':
+			raise ValueError('Only the bertini backend takes Bertini settings')
+		return BertiniBackend(graph,workdir,name,config)
+	return _CLASSES[kind](graph,workdir,name)
+
+#Counts the real solutions of instance i (solutions sols from backend) in freq_count.
+#Instances that failed (sols is None), whose number of finite solutions does not match root_counts (see bounds.py)
+#or that have an odd number of real solutions are reported, counted as failures in telemetry, and not counted.
+#Output: The number of real solutions, or None if the instance failed.
+def record_solutions(freq_count,sols,tol,i,root_counts,telemetry,backend):
+	if sols is None:
+		telemetry.fail('unreadable')
+		print "Could not read the solutions of instance "+str(i)
+		return None
+	number_real = int(np.sum(np.all(np.abs(sols.imag) <= tol,axis=1)))
+	failure = check_finite(root_counts,sols.shape[0],number_real)
+	if failure == 'excess' and backend.lists_diverged and number_real <= root_counts['generic']:
+		failure = None#PHC also lists the endpoints of paths that diverged, so only missing solutions are failures
+	if failure is not None:
+		telemetry.fail(failure)
+		print "Instance "+str(i)+" failed, "+str(sols.shape[0])+" finite solutions but the generic count is "+str(root_counts['generic'])
+		return None
+	if number_real%2 != 0:
+		telemetry.fail('odd')
+		print "Instance "+str(i)+" failed, odd number of solutions detected"
+		return number_real
+	freq_count[number_real] = freq_count.get(number_real,0) + 1
+	return number_real
@@ -0,0 +1,197 @@
+#Benchmarks of the steps every instance goes through, for comparing changes between commits.
+#
+#For every graph family and number of buses, this times
+#	generate	drawing the susceptances and building the equations (with sample_susceptances and pq_eqs)
+#	write_equations	writing the Bertini input file from the equations (as write_equations does)
+#	write_template	writing the same file through a precompiled InputTemplate
+#	solve_bertini	one call of the solver, as the Bertini drivers make it
+#	parse_bertini	reading real_finite_solutions and finite_solutions (as compare_poly_full_all does)
+#	solve_phc	one call of the solver, as random_eqs makes it
+#	parse_phc	reading the solutions PHC appended to the input file
+#	poly_coeff	evaluating the k4minus1 eliminant for one instance (k4minus1 only)
+#	eliminant_batch	the same, per instance, for a batch of 1000 instances (k4minus1 only)
+#
+#The solver is bench_stub.py, which replays canned output files prepared here instead of
+#solving the system, so the solver step only measures the cost of starting a process and
+#its files, and the benchmarks run without Bertini or PHC.
+#
+#To run the benchmarks, do the following:
+#python bench.py [-nmin 3] [-nmax 10] [-families complete,cycle,k4minus1,tree] [-reps 20] [-o bench_output.txt]
+#
+#The results are written as JSON, with one entry (family, n, stage, reps, mean, min) per measurement,
+#all times in seconds. To compare two result files, eg. from before and after a change:
+#python bench.py -compare OLD NEW
+#
+
+import numpy as np
+import subprocess
+import argparse
+import timeit
+import json
+import time
+import sys
+import os
+
+from graphs import Graph, complete_graph
+from sampling import bus_incidence, sample_susceptances, pq_eqs
+from templates import InputTemplate, bertini_input
+from phc_output import read_solutions, count_real
+from workspace import Workspace
+import bertini_output
+from k4minus1 import B_EDGES, poly_coeff, eliminant_coeffs
+
+STUB = os.path.join(os.path.dirname(os.path.abspath(__file__)),'bench_stub.py')#Next to this file, whatever the working folder
+MAX_CANNED = 5000 #Maximal number of solutions in the canned solver output
+TOL = 0.0000001
+
+#Output: The graph with n buses of the given family, or None if the family has no graph with n buses.
+#The trees are random, but the same for every run.
+def family_graph(family,n):
+	if family == 'complete':
+		return complete_graph(n)
+	if family == 'cycle':
+		return Graph(n,[(i,(i+1)%n) for i in range(n)])
+	if family == 'k4minus1':
+		return Graph(4,B_EDGES) if n == 4 else None
+	if family == 'tree':
+		rand = np.random.RandomState(n)
+		return Graph(n,[(k,rand.randint(0,k)) for k in range(1,n)])
+	raise ValueError('Unknown family '+family)
+
+#Writes canned solver output for systems with dim variables into canned/dim_(dim), in the formats of Bertini and PHC.
+#There are as many solutions as the generic number for the complete graph (at most MAX_CANNED), half of them real.
+def prepare_canned(canned,dim):
+	folder = os.path.join(canned,'dim_'+str(dim))
+	if os.path.isdir(folder):
+		return
+	os.mkdir(folder)
+	m = dim//2
+	num_sols = min(MAX_CANNED,int(round(np.prod([float(m+k)/k for k in range(1,m+1)]))))
+	rand = np.random.RandomState(dim)
+	sols = rand.normal(size=(num_sols,dim))+1j*rand.normal(size=(num_sols,dim))
+	sols[::2] = sols[::2].real
+
+	def bertini_file(s):
+		return str(s.shape[0])+'\n\n'+''.join([''.join(['%.15e %.15e\n' % (v.real,v.imag) for v in sol])+'\n' for sol in s])
+	with open(os.path.join(folder,'finite_solutions'),'w') as f:
+		f.write(bertini_file(sols))
+	with open(os.path.join(folder,'real_finite_solutions'),'w') as f:
+		f.write(bertini_file(sols[::2]))
+
+	names = ['x'+str(i+1) for i in range(m)]+['y'+str(i+1) for i in range(m)]
+	text = '\nTHE SOLUTIONS :\n'+str(num_sols)+' '+str(dim)+'\n'+'='*59+'\n'
+	for k, sol in enumerate(sols):
+		text += 'solution '+str(k+1)+' :\nt :  1.00000000000000E+00   0.00000000000000E+00\nm : 1\nthe solution for t :\n'
+		text += ''.join([' %s : %21.14E  %21.14E\n' % (name,v.real,v.imag) for name, v in zip(names,sol)])
+		text += '== err :  1.0E-15 = rco :  1.0E-01 = res :  1.0E-15 ==\n'
+	with open(os.path.join(folder,'phc_solutions'),'w') as f:
+		f.write(text)
+
+#Reads the Bertini output in workdir like compare_poly_full_all does.
+#Output: The number of real solutions, and the number of solutions whose y_1 is real.
+def parse_bertini(workdir,n):
+	with open(os.path.join(workdir,'real_finite_solutions'),'r') as f:
+		number_real = int(f.readline().strip())
+	sols = bertini_output.read_solutions(os.path.join(workdir,'finite_solutions'),2*n-2)
+	return number_real, int(np.sum(bertini_output.real_coordinates(sols,TOL)[:,n-1]))
+
+#Output: The mean and minimal time of one call of fn, over reps calls.
+def measure(fn,reps):
+	times = timeit.repeat(fn,repeat=reps,number=1)
+	return float(np.mean(times)), float(np.min(times))
+
+#Output: A list of (stage, function to time) for the graph with n buses, using workdir for files.
+def stages(family,graph,n,workdir):
+	edges = graph.edges
+	incidence = bus_incidence(n,edges)
+	template = InputTemplate(n,edges,'bertini')
+	b = sample_susceptances(len(edges),1)[0]
+	eqs = pq_eqs(incidence,b)
+	name = os.path.join(workdir,'bench')
+
+	def write_equations():
+		with open(name+'.input','w') as f:
+			f.write(bertini_input(eqs))
+
+	def solve_phc():
+		with open(name+'_eqs.txt','w') as f:
+			f.write(InputTemplate(n,edges,'phc').render(b))
+		subprocess.call([sys.executable,STUB,'-b','bench_eqs.txt','bench_roots.txt'],cwd=workdir)
+
+	result = [
+		('generate',lambda: pq_eqs(incidence,sample_susceptances(len(edges),1)[0])),
+		('write_equations',write_equations),
+		('write_template',lambda: template.write(b,name)),
+		('solve_bertini',lambda: subprocess.call([sys.executable,STUB,'bench.input'],cwd=workdir)),
+		('parse_bertini',lambda: parse_bertini(workdir,n)),
+		('solve_phc',solve_phc),
+		('parse_phc',lambda: count_real(read_solutions(name+'_eqs.txt'),TOL)),
+	]
+	if family == 'k4minus1':
+		batch = sample_susceptances(len(B_EDGES),1000)
+		result.append(('poly_coeff',lambda: poly_coeff(b)))
+		result.append(('eliminant_batch',lambda: eliminant_coeffs(batch)))
+	return result
+
+#Runs all benchmarks.
+#Output: A list of dictionaries, one per measurement.
+def run(families,nmin,nmax,reps,solver_reps,verbose=True):
+	results = []
+	with Workspace(label='bench') as workspace:
+		canned = workspace.subdir('canned')
+		os.environ['POWERSYSTEMS_BENCH_CANNED'] = canned
+		workdir = workspace.subdir('work')
+		for family in families:
+			for n in range(nmin,nmax+1):
+				graph = family_graph(family,n)
+				if graph is None:
+					continue
+				prepare_canned(canned,2*n-2)
+				for stage, fn in stages(family,graph,n,workdir):
+					r = solver_reps if stage.startswith('solve') else reps
+					mean, best = measure(fn,r)
+					if stage == 'eliminant_batch':
+						mean, best = mean/1000, best/1000
+					results.append({'family':family,'n':n,'stage':stage,'reps':r,'mean':mean,'min':best})
+					if verbose:
+						sys.stdout.write('%-9s n=%-3d %-16s %.3e s\n' % (family,n,stage,best))
+	return results
+
+#Output: The commit the benchmarks were run on, or None if git is not available.
+def current_commit():
+	try:
+		return subprocess.check_output(['git','rev-parse','HEAD'],stderr=open(os.devnull,'w')).strip().decode('ascii')
+	except (OSError,subprocess.CalledProcessError):
+		return None
+
+#Prints the ratio new/old of the minimal times of every measurement in both result files.
+def compare(old_file,new_file):
+	with open(old_file,'r') as f:
+		old = json.load(f)
+	with open(new_file,'r') as f:
+		new = json.load(f)
+	old_times = dict(((r['family'],r['n'],r['stage']),r['min']) for r in old['results'])
+	print('Comparing '+str(new['commit'])+' against '+str(old['commit']))
+	for r in new['results']:
+		key = (r['family'],r['n'],r['stage'])
+		if key in old_times:
+			print('%-9s n=%-3d %-16s %.3e -> %.3e  x%.2f' % (key+(old_times[key],r['min'],r['min']/old_times[key])))
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser()
+	parser.add_argument('-nmin', type=int, dest="nmin", default=3)
+	parser.add_argument('-nmax', type=int, dest="nmax", default=10)
+	parser.add_argument('-families', dest="families", type=str, default="complete,cycle,k4minus1,tree")
+	parser.add_argument('-reps', type=int, dest="reps", default=20)#How often every stage is timed
+	parser.add_argument('-solver_reps', type=int, dest="solver_reps", default=5)#How often the solver stages are timed
+	parser.add_argument('-o', dest="output", type=str, default="bench_output.txt")
+	parser.add_argument('-compare', dest="compare", nargs=2, default=None)#Two result files to compare
+	args = parser.parse_args()
+
+	if args.compare:
+		compare(*args.compare)
+	else:
+		results = run(args.families.split(','),args.nmin,args.nmax,args.reps,args.solver_reps)
+		with open(args.output,'w') as f:
+			json.dump({'commit':current_commit(),'timestamp':time.strftime('%b-%d-%Y_%H:%M:%S',time.localtime()),
+				'python':sys.version.split()[0],'numpy':np.__version__,'results':results},f,indent=1)
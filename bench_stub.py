@@ -0,0 +1,38 @@
+#A stand-in for ./bertini and ./phc used by bench.py.
+#
+#It is called exactly like the real solvers,
+#	python bench_stub.py [INPUT FILE] ...		(like bertini, run from the folder of the input file)
+#	python bench_stub.py -b [INPUT FILE] [OUTPUT FILE]	(like phc -b)
+#but instead of solving the system it replays the canned output that bench.py prepared in the
+#folder $POWERSYSTEMS_BENCH_CANNED for systems with the same number of variables.
+#This makes the solver step of the benchmarks deterministic and independent of Bertini and PHC.
+#
+
+import shutil
+import sys
+import os
+
+#Output: The number of variables of the system in the input file filename.
+def num_variables(filename,phc):
+	with open(filename,'r') as f:
+		if phc:
+			return int(f.readline().strip())
+		for line in f:
+			if line.startswith('variable_group'):
+				return len(line.strip()[len('variable_group'):].rstrip(';').split(','))
+
+if __name__ == '__main__':
+	phc = sys.argv[1] == '-b'
+	input_file = sys.argv[2] if phc else sys.argv[1]
+	canned = os.path.join(os.environ['POWERSYSTEMS_BENCH_CANNED'],'dim_'+str(num_variables(input_file,phc)))
+
+	if phc:
+		#phc -b appends the solutions to the input file and writes a report to the output file
+		with open(os.path.join(canned,'phc_solutions'),'r') as f:
+			solutions = f.read()
+		with open(input_file,'a') as f:
+			f.write(solutions)
+		shutil.copy(os.path.join(canned,'phc_solutions'),sys.argv[3])
+	else:
+		for name in ['real_finite_solutions','finite_solutions']:
+			shutil.copy(os.path.join(canned,name),name)
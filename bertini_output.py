@@ -0,0 +1,42 @@
+#A parser for the solution files Bertini writes (finite_solutions, real_finite_solutions, ...).
+#
+#These files have the form
+#	4
+#
+#	9.999999999999999e-01 -3.252606517456513e-19
+#	-2.052137593164120e-17 1.029327954680140e-18
+#
+#	...
+#where the first line holds the number of solutions, followed by one block per solution with
+#one line "real imaginary" per variable (in the order of the variable_group), and a blank line after each block.
+#
+
+import numpy as np
+import mmap
+
+#Input: A solution file written by Bertini and the number of variables dim.
+#Output: An array of shape (number of solutions,dim) with the coordinates of the solutions.
+#If the file was cut off, only the complete solutions are returned.
+#The file is memory-mapped and all numbers are decoded by one call of np.fromstring, so no list of lines
+#is built, and any test on the coordinates (eg. which solutions or variables are real) is one array operation.
+def read_solutions(filename,dim):
+	with open(filename,'rb') as f:
+		data = mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ)#ValueError if the file is empty
+	try:
+		header = data.find(b'\n')
+		num_sols = int(data[:header])
+		end = len(data)
+		if not data[-1:].isspace():
+			end = max(data.rfind(b' '),data.rfind(b'\n'))+1#The last number may have been cut off, eg. to a lone '-'
+		values = np.fromstring(buffer(data,header+1,max(end-header-1,0)),sep=' ')#Any whitespace separates the numbers
+	finally:
+		data.close()
+	k = min(num_sols,values.shape[0]//(2*dim))
+	values = values[:2*dim*k].reshape(k,dim,2)
+	return values[:,:,0]+1j*values[:,:,1]
+
+#Input: The solutions returned by read_solutions, and the tolerance for certifying a number is real.
+#Output: A boolean array of shape (number of solutions,dim) marking the coordinates with imaginary part at most tol.
+#eg. real_coordinates(sols,tol).all(axis=1) marks the real solutions, and real_coordinates(sols,tol)[:,k] those real in variable k.
+def real_coordinates(sols,tol):
+	return np.abs(sols.imag) <= tol
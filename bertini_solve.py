@@ -7,6 +7,8 @@
 #To specify edges, it should be a string of the form "a,b:c,d:e,g:...:j,k" where each variable here is a number.
 #For example, the complete graph on 3 buses is "0,1:1,2:0,2", as we assume it's undirected.
 #If you don't use the -edges command, it will default to a complete graph.
+#Large graphs can be read from a file with one edge per line, eg. the branch list of an IEEE test case,
+#with -edgefile [FILE] (see read_edge_file in graphs.py). The number of buses is then taken from the file.
 #
 #Example : python bertini_solve.py -n 4 -iters 1000 -edges "0,1:1,2:2,3:3,0"
 #This generates a graph on 4 buses with edges (0,1), (1,2), (2,3), (0,3)
@@ -14,147 +16,443 @@
 #
 #The distribution of real solutions is saved in the Data folder as a .txt document.
 #Its file name will be "dist_(graph-id)_(timestamp).txt"
-#Here graph-id records the edge structure of G.
+#Here graph-id records the edge structure of G up to isomorphism (see canonical_id in graphs.py), so
+#the same graph entered with different bus labels gets the same graph-id, eg. "0,1:1,2:2,3:3,0" and
+#"0,2:2,1:1,3:3,0" are both C4_886. Graphs with more than 12 buses keep the name of their edge file.
 #The hope is that later we can just merge all results with the same graph-id.
 #The timestamp is just so that different runs don't overwrite the file.
 #
 #If you'd like to use your own graph id, you can do this with the option -g
 #
+#To use several cores, pass -jobs [NUMBER OF PROCESSES]. Every worker process runs Bertini
+#in its own scratch folder, and the distributions of all workers are merged at the end.
+#
+#For small numbers of buses, -native solves the systems in-process with the NumPy homotopy
+#solver in homotopy.py, instead of writing files and calling Bertini.
+#
+#With -paramhom, Bertini first solves the system once at random complex susceptances
+#(ParameterHomotopy:1). Every random instance is then solved by a parameter homotopy
+#(ParameterHomotopy:2) from these generic solutions, so only the generic number of finite
+#solutions is tracked per instance instead of the Bezout bound. This pays off for K5, K6, ...
+#By default (-start auto) this is done whenever it tracks fewer paths in total than the total degree
+#homotopy, according to the root counts cached for the graph (see bounds.py); -start total turns it off.
+#The instances can also be solved by PHC with -backend phc, or in-process by PHCpack's Python bindings with
+#-backend phcpy (if phcpy is installed), which writes no files at all (see backends.py).
+#
+#Instances whose number of finite solutions differs from the generic count are reported as failures
+#(the paths of some solutions failed) and are not counted in the distribution.
+#
+#Every instance (index, susceptances, number of real solutions and time taken) is appended to
+#"Data/log_(graph-id)_(timestamp)" as soon as it is solved; use -log to put it elsewhere.
+#If a run crashes, restart it with the same arguments plus -resume [LOG]. This skips the
+#instances already in the log, appends the new ones to it and counts both in the distribution.
+#
+#Instance i of a run is drawn from its own random stream, keyed by the seed of the run (-seed, drawn at random
+#if not given and recorded in the log) and i. Any instance can therefore be solved again on its own, eg. all
+#instances of a log with 12 real solutions with python replay.py -log [LOG] -real 12 (see replay.py).
+#
+#The distribution is also added to the results store Data/results.db, where the runs of
+#each graph-id are merged. See results_db.py for how to query it.
+#
+#Bertini's input and output files are kept in a scratch folder, by default under /dev/shm,
+#which is removed when the run ends. Use -scratch [FOLDER] to put it elsewhere.
+#
+#To see where the time goes, -telemetry stderr prints the time spent sampling, writing, solving,
+#parsing and cleaning up, the throughput, ETA, slowest instances and solver failures every
+#-telemetry_interval seconds. Use json:[FILE] to append the same to a file, or profile:[FILE]
+#to run cProfile (see telemetry.py).
+#
+#With -adaptive, -iters is only the maximal number of instances. They are solved in rounds, and the run
+#stops as soon as the 95% confidence interval (see -confidence) of every number of real solutions is
+#narrower than +-precision, eg. -adaptive -precision 0.01, and/or the number of real solutions given by
+#-target has been seen -target_hits times, eg. -adaptive -target 12 -target_hits 50 (see adaptive.py).
+#
+#With -archive [FOLDER], the susceptances and all finite solutions of every instance are also stored in a compact
+#binary archive, for analysis without solving again (see archive.py). Resumed runs append to the same archive.
+#
 
 import numpy as np
 import subprocess
 import sys
 import argparse
+import errno
 import time
+import os
+import shutil
+from functools import partial
 
-#Input: Matrix A describing the adjacency of the graph.
-#Output: A string corresponding to random equations in this system.
-#The format of the string is amenable to Bertini.
-def random_pq_eqs(A):
-	n = A.shape[0]
-	x_names = ['x'+str(i) for i in range(1,n)]
-	y_names = ['y'+str(i) for i in range(1,n)]
-
-	B = np.zeros([n,n])
-	t = 0
-	for i in range(n):
-		for j in range(i,n):
-			if A[i,j] != 0:
-				### This distribution controls the susceptances ###
-				B[i,j] = B[j,i] = np.random.normal(0,1)
-	x = [str(1)]+x_names
-	y = [str(0)]+y_names
-
-	f = []
-	h = []
-	for i in range(1,n):
-		### This distribution controls the P and Q variables ###
-		p_eq = str(0)
-		h_eq = x[i]+"^2+"+y[i]+"^2-1"
-		for j in range(n):
-			if A[i,j] != 0:
-				p_eq += "+("+str(B[i,j])+")*("+x[j]+"*"+y[i]+"-"+x[i]+"*"+y[j]+")"
-		f.append(p_eq)
-		h.append(h_eq)
-	eqs = f+h
-	return eqs
+from parallel import run_pool, merge_counts
+from runlog import RunLog, completed, rebuild_counts, read_header, read_log
+from results_db import add_run
+from telemetry import Telemetry, make_sinks
+from adaptive import StoppingRule, run_adaptive
+from workspace import Workspace, remove_files
+from graphs import Graph, complete_graph, parse_edge_string, read_edge_file, canonical_id
+from sampling import bus_incidence, iter_instance_batches, iter_instances, pq_eqs
+from homotopy import solve_batch, count_real
+from bounds import get_bounds, record_bound, check_finite, format_bounds
+from templates import bertini_input
+from backends import BERTINI, make_backend, record_solutions
+from bertini_output import read_solutions
+from archive import process_writer, create_archive
 
 #Writes eqs to the file specified by filename.
-def write_equations(eqs,filename):
-	n = len(eqs)/2
-
-	disp = 'function '
-	for i in range(n):
-		if i > 0: disp += ','
-		disp += 'f'+str(i+1)
-	for i in range(n):
-		disp += ',g'+str(i+1)
-	disp += ';'+'\n'
-
-	disp += 'variable_group '
-	for i in range(n):
-		if i > 0: disp += ','
-		disp += 'x'+str(i+1)
-	for i in range(n):
-		disp += ',y'+str(i+1)
-	disp += ';'+'\n'+'\n'
-
-	for i in range(n):
-		disp += 'f'+str(i+1)+' = '+eqs[i]+';'+'\n'
-	for i in range(n):
-		disp += 'g'+str(i+1)+' = '+eqs[n+i]+';'+'\n'
-	disp += 'END;'
-
-	f = open(filename+'.input','w')
+#params is an optional list of parameter names used in eqs (for parameter homotopies),
+#and config an optional list of Bertini settings, eg. ['ParameterHomotopy:1'].
+def write_equations(eqs,filename,params=None,config=None):
+	with open(filename+'.input','w') as f:
+		f.write(bertini_input(eqs,params,config))
+
+#Input: The graph of the system (see graphs.py).
+#Output: The names of the susceptances, one parameter per edge, and the equations in terms of these parameters.
+def param_pq_eqs(graph):
+	edges = graph.edges
+	names = ['b'+str(i)+'_'+str(j) for i, j in edges]
+	return names, pq_eqs(bus_incidence(graph.n,edges),names)
+
+#Writes the parameter values to filename, in the format of Bertini's start_parameters and final_parameters files.
+def write_parameters(values,filename):
+	disp = str(len(values))+'\n'+'\n'
+	for v in values:
+		disp += repr(float(np.real(v)))+' '+repr(float(np.imag(v)))+'\n'
+	f = open(filename,'w')
 	f.write(disp)
 	f.close()
 
-#This generates iters many random equations according to the n-bus system
-#with adjacency matrix A.
-#tol is the tolerance for certifying a number is real (ie. imaginary part < tol)
-#If the number of real solutions equals the target, it prints the equation to the screen
-def eq_loop(A,iters,tol,n,graph_id,verbose=False):
-	seed = np.random.randint(0,100000)
+#Solves the system once, at random complex susceptances chosen by Bertini (ParameterHomotopy:1), inside setup_dir.
+#This leaves the files start_parameters and nonsingular_solutions in setup_dir, which every instance then starts from.
+#Output: The number of generic solutions, ie. the number of paths tracked per instance.
+def parameter_setup(graph,setup_dir):
+	names, eqs = param_pq_eqs(graph)
+	write_equations(eqs,os.path.join(setup_dir,'generic'),params=names,config=['ParameterHomotopy:1'])
+	subprocess.call([BERTINI,'generic.input'],cwd=setup_dir)
+	with open(os.path.join(setup_dir,'nonsingular_solutions'),'r') as f:
+		return int(f.readline().strip())
+
+#Output: The number of finite solutions of the Bertini run in workdir, or None if it could not be read.
+def read_finite_count(workdir):
+	try:
+		with open(os.path.join(workdir,'finite_solutions'),'r') as f:
+			return int(f.readline().strip())
+	except (IOError,ValueError):
+		return None
+
+#Reads the number of real solutions from the output of the Bertini run in workdir and records it in freq_count.
+#If the number of finite solutions does not match the root counts of the graph (see bounds.py), the instance is not counted.
+#Output: The number of real solutions (None if the output could not be read), and the kind of failure found by check_finite.
+def record_real_count(freq_count,workdir,i,root_counts):
+	number_real = None
+	failure = None
+	try:
+		with open(os.path.join(workdir,'real_finite_solutions'),'r') as f: #This is the file from Bertini recording all kinds of information about the solution set
+			first_line = f.readline()
+			number_real = int(first_line.strip())
+
+			num_finite = read_finite_count(workdir)
+			failure = check_finite(root_counts,num_finite,number_real)
+			if failure is not None:
+				print "Instance "+str(i)+" failed, "+str(num_finite)+" finite solutions but the generic count is "+str(root_counts['generic'])
+			#We update our frequency count
+			elif number_real%2 ==0:
+				if number_real in freq_count.keys():
+					freq_count[number_real] += 1
+				else:
+					freq_count[number_real] = 1
+			else:
+				print "File "+str(i)+" failed, odd number of solutions detected"
+
+	except:
+		print "Could not read file "+str(i)
+	return number_real, failure
+
+#Same as solve_range, but every instance is solved by a parameter homotopy (ParameterHomotopy:2)
+#from the generic solutions that parameter_setup left in setup_dir.
+#Only as many paths as there are generic solutions are tracked, instead of the Bezout bound.
+def solve_range_param(graph,tol,n,seed,setup_dir,root_counts,log,telemetry,bounds,workdir='.',verbose=False,archive=None):
+	start, stop = bounds
+	iters = stop-start
 	freq_count = {}#This dictionary will record how frequently we see each number of real sol
-	prog_checker = iters/10#This will be udpated to say what percentage is completed
+	prog_checker = max(1,iters/10)#This will be udpated to say what percentage is completed
+	telemetry.begin(iters)
 
-	for i in range(iters):
-		eqs = random_pq_eqs(A)#Generate random equations
-		write_equations(eqs,'temp_'+str(seed)+"_"+str(i))#Write them to a file
+	#The input file is the same for all instances, only final_parameters changes
+	names, eqs = param_pq_eqs(graph)
+	name = 'temp_'+str(seed)+"_param"
+	write_equations(eqs,os.path.join(workdir,name),params=names,config=['ParameterHomotopy:2'])
+	shutil.copy(os.path.join(setup_dir,'start_parameters'),os.path.join(workdir,'start_parameters'))
+	start_file = os.path.abspath(os.path.join(setup_dir,'nonsingular_solutions'))
+	writer = process_writer(archive)#Shared by all pool chunks of this worker
 
-		#We now try to solve them using Bertini.
-		try:
-			subprocess.call(["./bertini","temp_"+str(seed)+"_"+str(i)+".input","temp_"+str(seed)+"_"+str(i)+"_roots.txt"])
-		except:
-			print "Solving system "+str(i)+" failed"
+	for k, b in enumerate(telemetry.timed('sample',iter_instances(seed,start,stop,len(names)))):
+		i = start+k
+		if log.is_done(i):
+			continue
+		instance_start = time.time()
+		with telemetry.stage('write'):
+			write_parameters(b,os.path.join(workdir,'final_parameters'))
+			#The output of the previous instance is removed, so that a failed run is not read as this instance
+			remove_files(workdir,'real_finite_solutions','finite_solutions')
+
+		#We now track the generic solutions to this instance using Bertini.
+		with telemetry.stage('solve'):
+			try:
+				subprocess.call([BERTINI,name+".input",start_file],cwd=workdir)
+			except:
+				telemetry.fail('solver_error')
+				print "Solving system "+str(i)+" failed"
 
 		#We now determine how many real solutions there were
-		try:
-			with open('real_finite_solutions','r') as f: #This is the file from Bertini recording all kinds of information about the solution set
-				first_line = f.readline()
-				number_real = int(first_line.strip())
+		with telemetry.stage('parse'):
+			number_real, failure = record_real_count(freq_count,workdir,i,root_counts)
+		if archive is not None:
+			with telemetry.stage('archive'):
+				try:
+					writer.add(i,b,read_solutions(os.path.join(workdir,'finite_solutions'),2*n-2))
+				except (IOError,ValueError):
+					pass#The solutions could not be read, the instance is not archived
+		if failure is not None:
+			telemetry.fail(failure)
+			number_real = None#Logged as failed, so that a resumed run solves it again
+		else:
+			telemetry.check_count(number_real)
+		elapsed = time.time()-instance_start
+		with telemetry.stage('log'):
+			log.record(i,b,number_real,elapsed=elapsed)
+		telemetry.instance(i,elapsed)
+
+		#If verbose, we give a progress update every so often.
+		if verbose:
+			if k%prog_checker == 0:
+				sys.stdout.write(str((float(k)/iters)*100)+' percent completed\n')
 
+	remove_files(workdir,name+".input")
+	writer.flush()
+	telemetry.end()
+	return freq_count
+
+#Solves the instances in range(*bounds) inside the folder workdir.
+#Bertini writes its output files into the folder it is run from, so parallel workers each use their own workdir.
+#Instances whose number of finite solutions does not match root_counts (see bounds.py) are reported and not counted.
+#Output: A dictionary recording how frequently we see each number of real solutions.
+#backend is the solver backend used for the instances (see backends.py), 'bertini' by default.
+#If archive is the folder of an archive (see archive.py), the solutions of every instance are added to it.
+def solve_range(graph,tol,n,seed,backend,root_counts,log,telemetry,bounds,workdir='.',verbose=False,archive=None):
+	start, stop = bounds
+	iters = stop-start
+	freq_count = {}#This dictionary will record how frequently we see each number of real sol
+	prog_checker = max(1,iters/10)#This will be udpated to say what percentage is completed
+	telemetry.begin(iters)
+
+	edges = graph.edges
+	solver = make_backend(backend,graph,workdir,'temp_'+str(seed))#The input file of this graph is compiled once, only the susceptances change between instances
+	writer = process_writer(archive)#Shared by all pool chunks of this worker
+	for k, b in enumerate(telemetry.timed('sample',iter_instances(seed,start,stop,len(edges)))):
+		i = start+k
+		if log.is_done(i):
+			continue
+		instance_start = time.time()
+
+		#We now try to solve them using the backend, and determine how many real solutions there were.
+		#Failed instances are logged with None, so that a resumed run solves them again.
+		sols = solver.solve(b[None],telemetry)[0]
+		number_real = record_solutions(freq_count,sols,tol,i,root_counts,telemetry,solver)
+		if archive is not None:
+			with telemetry.stage('archive'):
+				writer.add(i,b,sols)
+		elapsed = time.time()-instance_start
+		with telemetry.stage('log'):
+			log.record(i,b,number_real,elapsed=elapsed)
+		telemetry.instance(i,elapsed)
+
+		#If verbose, we give a progress update every so often.
+		if verbose:
+			if (i-start)%prog_checker == 0:
+				sys.stdout.write(str((float(i-start)/iters)*100)+' percent completed\n')
+
+	writer.flush()
+	telemetry.end()
+	return freq_count
+
+#Same as solve_range, but the instances are solved in-process by the homotopy solver in homotopy.py.
+#No files are written, so workdir is not used.
+def solve_range_native(graph,tol,n,seed,root_counts,log,telemetry,bounds,workdir='.',verbose=False,archive=None):
+	start, stop = bounds
+	iters = stop-start
+	freq_count = {}#This dictionary will record how frequently we see each number of real sol
+	prog_checker = max(1,iters/10)#Instances are solved prog_checker at a time, so we can report progress
+	done = 0
+	writer = process_writer(archive)#Shared by all pool chunks of this worker
+	telemetry.begin(iters)
+
+	edges = graph.edges
+	for batch in telemetry.timed('sample',iter_instance_batches(seed,start,stop,len(edges))):
+		for s in range(0,batch.shape[0],prog_checker):
+			sub = batch[s:s+prog_checker]
+			indices = [start+done+k for k in range(sub.shape[0]) if not log.is_done(start+done+k)]
+			sub = sub[[i-start-done for i in indices]]
+			batch_start = time.time()
+			with telemetry.stage('solve'):
+				solutions = solve_batch(n,edges,sub)
+			elapsed = (time.time()-batch_start)/max(1,len(indices))
+			for i, b, sols, number_real in zip(indices,sub,solutions,count_real(solutions,tol)):
+				writer.add(i,b,sols)
+				failure = check_finite(root_counts,sols.shape[0],number_real)
+				if failure is not None:
+					telemetry.fail(failure)
+					print "Instance "+str(i)+" failed, "+str(sols.shape[0])+" finite solutions but the generic count is "+str(root_counts['generic'])
+					with telemetry.stage('log'):
+						log.record(i,b,None,elapsed=elapsed)
+					telemetry.instance(i,elapsed)
+					continue
 				#We update our frequency count
 				if number_real%2 ==0:
-					if number_real in freq_count.keys():
-						freq_count[number_real] += 1
-					else:
-						freq_count[number_real] = 1
+					freq_count[number_real] = freq_count.get(number_real,0) + 1
 				else:
-					print "File "+str(i)+" failed, odd number of solutions detected"
+					print "Instance "+str(i)+" failed, odd number of solutions detected"
+				telemetry.check_count(number_real)
+				with telemetry.stage('log'):
+					log.record(i,b,int(number_real),elapsed=elapsed)
+				telemetry.instance(i,elapsed)
+			done += batch[s:s+prog_checker].shape[0]
 
-		except:
-			print "Could not read file "+str(i)
+			#If verbose, we give a progress update every so often.
+			if verbose:
+				sys.stdout.write(str((float(done)/iters)*100)+' percent completed\n')
 
-		#Deleting the text files created.
-		try:
-			subprocess.call(["rm","-f","temp_"+str(seed)+"_"+str(i)+".input"])
-		except:
-			print "Error removing temp_"+str(seed)+"_"+str(i)+".input"		
+	writer.flush()
+	telemetry.end()
+	return freq_count
 
-		#If verbose, we give a progress update every so often.
+#This generates iters many random equations according to the n-bus system
+#given by graph.
+#tol is the tolerance for certifying a number is real (ie. imaginary part < tol)
+#jobs is the number of worker processes; with jobs > 1 the instances are spread over a process pool.
+#If native is True, the systems are solved by the in-process homotopy solver instead of Bertini.
+#start chooses the start system: 'total' tracks the Bezout bound of paths per instance, 'param' solves the system once
+#at generic parameters and every instance is a parameter homotopy from there, and 'auto' picks the one that tracks
+#fewer paths in total, using the root counts cached in the results store (see bounds.py).
+#backend is the solver used with the total degree start system: 'bertini', 'phc' or 'phcpy' (see backends.py).
+#Every instance is appended to the log log_path as soon as it is solved (see runlog.py).
+#If resume is the path of such a log, the instances in it are skipped and counted from the log instead.
+#The files of Bertini are written to a workspace in the folder scratch (see workspace.py).
+#Stage timers, failure counters and throughput are reported to the sinks of telemetry (see telemetry.py).
+#If rule is a StoppingRule (see adaptive.py), the instances are solved in rounds until the distribution satisfies it,
+#and iters is only the maximal number of instances.
+#Instance i is drawn from the random stream of the run seed (see instance_susceptances in sampling.py), so it can be solved
+#again later with replay.py. The seed is drawn at random if not given, and recorded in the log.
+#If archive is a folder, the susceptances and solutions of every instance are stored there (see archive.py).
+def eq_loop(graph,iters,tol,n,graph_id,verbose=False,jobs=1,native=False,start='auto',backend='bertini',log_path=None,resume=None,scratch=None,telemetry=None,rule=None,seed=None,archive=None):
+	if telemetry is None:
+		telemetry = Telemetry()
+	if resume:
+		#The instances of a resumed run are the same as those of the crashed run
+		seed = read_header(resume).get('seed',seed)
+		if seed is None:
+			seed = np.random.randint(0,2**31-1)
+		log = RunLog(resume,seed,completed(resume))
+		old_count = rebuild_counts([rec for rec in log.done.values() if rec['i'] < iters],lambda rec: rec['real'] if rec['real']%2 == 0 else None)
 		if verbose:
-			if i%prog_checker == 0:
-				sys.stdout.write(str((float(i)/iters)*100)+' percent completed\n')
+			sys.stdout.write('Resuming, '+str(sum(old_count.values()))+' instances already in the log\n')
+	else:
+		if log_path is None:
+			log_path = 'Data/log_'+graph_id+'_'+time.strftime('%b-%d-%Y_%H:%M:%S',time.localtime())
+		if seed is None:
+			seed = np.random.randint(0,2**31-1)
+		log = RunLog(log_path,seed)
+		log.header(graph_id=graph_id,n=n,edges=graph.edges,iters=iters,seed=seed)
+		old_count = {}
+	if archive is not None:
+		create_archive(archive,graph,graph_id=graph_id,seed=seed,mu=0,var=1)
+
+	#The root counts of the graph, from the results store or computed once and stored there
+	canonical = canonical_id(graph)
+	root_counts = get_bounds(graph,canonical)
+	if verbose:
+		sys.stdout.write('Root counts: '+format_bounds(root_counts)+'\n')
+	if start == 'auto':
+		#The parameter homotopy tracks the Bezout bound of paths once, and then the generic number per instance
+		generic = root_counts['generic'] or root_counts['mixed_volume'] or root_counts['bezout']
+		start = 'param' if backend == 'bertini' and root_counts['bezout']+generic*iters < root_counts['bezout']*iters else 'total'
+
+	workspace = Workspace(scratch)
+	if native:
+		solve = partial(solve_range_native,graph,tol,n,seed,root_counts,log,telemetry,archive=archive)
+	elif start == 'param':
+		setup_dir = workspace.subdir('paramhom')
+		num_paths = parameter_setup(graph,setup_dir)
+		if root_counts['generic'] is not None and num_paths != root_counts['generic']:
+			print "The generic solve found "+str(num_paths)+" solutions, but the generic count is "+str(root_counts['generic'])
+		record_bound(canonical,root_counts,'generic',num_paths,graph=graph)
+		if verbose:
+			sys.stdout.write('Tracking '+str(num_paths)+' paths per instance instead of '+str(root_counts['bezout'])+'\n')
+		solve = partial(solve_range_param,graph,tol,n,seed,setup_dir,root_counts,log,telemetry,archive=archive)
+	else:
+		solve = partial(solve_range,graph,tol,n,seed,backend,root_counts,log,telemetry,archive=archive)
+	with workspace:
+		if jobs > 1:
+			telemetry.begin(iters)
+			solve_round = lambda start, stop: run_pool(solve,stop-start,jobs,verbose,scratch=workspace.path,telemetry=telemetry,start=start)
+		else:
+			solve_round = lambda start, stop: solve((start,stop),workdir=workspace.subdir('solve'),verbose=verbose)
+		if rule is not None:
+			freq_count, iters = run_adaptive(solve_round,rule,iters,old_count,verbose)
+		else:
+			freq_count = merge_counts(solve_round(0,iters),old_count)
+		if jobs > 1:
+			telemetry.end()
 
 	#We now print the frequency count to the screen.
 	num_roots_found = freq_count.keys()
 	num_roots_found.sort() #We sort from smallest number to largest number of real roots.
-	t = time.localtime()
-	timestamp = time.strftime('%b-%d-%Y_%H:%M:%S', t)
+	#Runs of the same graph (eg. the pieces of a sweep) may finish in the same second, so we never reuse a file name
+	while True:
+		t = time.localtime()
+		timestamp = time.strftime('%b-%d-%Y_%H:%M:%S', t)
+		try:
+			fd = os.open('Data/dist_'+graph_id+'_'+timestamp,os.O_WRONLY|os.O_CREAT|os.O_EXCL,0o644)
+			break
+		except OSError as e:
+			if e.errno != errno.EEXIST:
+				raise
+			time.sleep(1)
 
-	with open('Data/dist_'+graph_id+'_'+timestamp,'w') as f:
+	with os.fdopen(fd,'w') as f:
 		for k in num_roots_found:
 			f.write(str(k) + ' : ' + str(freq_count[k])+'\n')
 
+	#We also add the distribution to the results store, where all runs with the same graph-id are merged,
+	#with the mean time per instance from the log (eg. for the cost estimates of sweep.py).
+	times = [rec['time'] for rec in read_log(log.path) if rec.get('time') is not None]
+	seconds = float(np.mean(times)) if times else None
+	add_run('bertini_solve',graph_id,freq_count,iters=iters,timestamp=timestamp,source=os.path.abspath('Data/dist_'+graph_id+'_'+timestamp),seconds=seconds)
+
 #Here we take the arguments passed via the command line.
 parser = argparse.ArgumentParser()
 parser.add_argument('-iters', type=int, dest="iters", default = 1000) #How many graphs to check
 parser.add_argument('-tol', type=float, dest="tol", default = 0.0000001) #What tolerance should we use to determine if something is a real solution
 parser.add_argument('-n', type=int,dest="n", default=4)#Number of buses
 parser.add_argument('-edges', dest="e", type=str, default="")#Edges structure, eg. "01,12,23"
+parser.add_argument('-edgefile', dest="edgefile", type=str, default="")#File with one edge per line, eg. the branch list of an IEEE test case (see graphs.py)
 parser.add_argument('-v',action='store_true', default=False, dest='verbose') #If verbose, it will tell you when it has done 10, 20, ... %
 parser.add_argument('-g', dest = "g", type=str, default="")
+parser.add_argument('-jobs', type=int, dest="jobs", default=1)#Number of worker processes
+parser.add_argument('-native',action='store_true', default=False, dest='native') #Solve in-process instead of calling Bertini (for small n)
+parser.add_argument('-paramhom',action='store_true', default=False, dest='paramhom') #Use a Bertini parameter homotopy from one generic solve, same as -start param
+parser.add_argument('-start', dest="start", choices=['auto','total','param'], default='auto')#Start system, see eq_loop
+parser.add_argument('-backend', dest="backend", choices=['bertini','phc','phcpy'], default='bertini')#Solver for the total degree start, see backends.py
+parser.add_argument('-log', dest="log", type=str, default=None)#Where to log every instance, defaults to Data/log_(graph-id)_(timestamp)
+parser.add_argument('-resume', dest="resume", type=str, default=None)#Log of a crashed run to continue
+parser.add_argument('-scratch', dest="scratch", type=str, default=None)#Folder for the scratch files, defaults to /dev/shm
+parser.add_argument('-telemetry', dest="telemetry", type=str, default="")#Where to report stage timings, eg. "stderr,json:Data/metrics.json,profile:Data/run.prof"
+parser.add_argument('-telemetry_interval', type=float, dest="telemetry_interval", default=10)#Seconds between reports
+parser.add_argument('-adaptive',action='store_true', default=False, dest='adaptive') #Stop as soon as the distribution is known well enough
+parser.add_argument('-precision', type=float, dest="precision", default=None)#Largest allowed half-width of the confidence intervals
+parser.add_argument('-target', type=int, dest="target", default=None)#Number of real solutions that must be seen -target_hits times
+parser.add_argument('-target_hits', type=int, dest="target_hits", default=10)
+parser.add_argument('-confidence', type=float, dest="confidence", default=0.95)#Confidence level of the intervals
+parser.add_argument('-round', type=int, dest="round", default=100)#Smallest number of instances solved between two checks
+parser.add_argument('-seed', type=int, dest="seed", default=None)#Seed of the instances, drawn at random if not given (see replay.py)
+parser.add_argument('-archive', dest="archive", type=str, default=None)#Folder to store the solutions of every instance in (see archive.py)
 
 args = vars(parser.parse_args())
 iters = args["iters"]
@@ -162,26 +460,39 @@ verbose = args["verbose"]
 tol = args["tol"]
 n = args["n"]
 edge_string = args["e"]
+edge_file = args["edgefile"]
 g = args["g"]
+jobs = args["jobs"]
+native = args["native"]
+start = 'param' if args["paramhom"] else args["start"]
+backend = args["backend"]
+log_path = args["log"]
+resume = args["resume"]
+scratch = args["scratch"]
+seed = args["seed"]
+telemetry = Telemetry(make_sinks(args["telemetry"]),args["telemetry_interval"])
+rule = None
+if args["adaptive"]:
+	precision = args["precision"]
+	if precision is None and args["target"] is None:
+		precision = 0.01
+	rule = StoppingRule(precision,args["target"],args["target_hits"],args["confidence"],args["round"])
 
-#We now construct the edges corresponding to the edge string
-if len(edge_string) > 0:
-	edges = [(int(b.split(',')[0]),int(b.split(',')[1])) for b in edge_string.split(':')]
-	if len(g) == 0:
-		graph_id = ''+edge_string+''
-	else:
-		graph_id = g
+#We now construct the graph, from the edge file, the edge string, or the complete graph
+if len(edge_file) > 0:
+	graph = read_edge_file(edge_file)
+	n = graph.n
+	default_id = os.path.basename(edge_file)
+elif len(edge_string) > 0:
+	graph = Graph(n,parse_edge_string(edge_string))
+	default_id = ''+edge_string+''
 else:
-	edges = [(i,j) for i in range(n) for j in range(i+1,n)]
-	if len(g) == 0:
-		graph_id = 'K'+str(n)
-	else:
-		graph_id = g
-
-#This creates the adjacency matrix
-A = np.zeros([n,n])
-for e in edges:
-	A[e[0],e[1]] = A[e[1],e[0]] = 1
+	graph = complete_graph(n)
+	default_id = 'K'+str(n)
+if len(g) == 0:
+	graph_id = canonical_id(graph,default_id)
+else:
+	graph_id = g
 
 #This is the main call of the algorithm
-eq_loop(A,iters,tol,n,graph_id,verbose=verbose)
+eq_loop(graph,iters,tol,n,graph_id,verbose=verbose,jobs=jobs,native=native,start=start,backend=backend,log_path=log_path,resume=resume,scratch=scratch,telemetry=telemetry,rule=rule,seed=seed,archive=args["archive"])
@@ -0,0 +1,163 @@
+#A cache of root counts per graph, to choose the start system and to check the solver's output.
+#
+#For every canonical graph-id (see canonical_id in graphs.py), the table bounds of Data/results.db holds
+#	bezout		the total degree of the system, ie. the number of paths of a total degree homotopy,
+#	mixed_volume	the BKK bound, as PHC reports it in the root counts of its output (see mixed_volume_from_phc),
+#	generic		the number of finite solutions at generic (random complex) susceptances.
+#These are computed once and then read from the store. The generic count is known in closed form for complete
+#graphs, binomial(2n-2,n-1), is computed with the homotopy solver in homotopy.py for small graphs, and is recorded
+#by bertini_solve whenever a parameter homotopy is set up (the number of nonsingular generic solutions).
+#A generic count that was found by solving is only stored if it equals the Bezout bound or the mixed volume, since
+#a solve that lost paths undercounts, and every correct instance would then be flagged as 'excess' for good.
+#Other generic counts are the largest over more solves (up to MAX_GENERIC_TRIES), and are used but not stored.
+#
+#The drivers use the cache to
+#	track only the generic number of paths (a parameter homotopy) when that is cheaper than the Bezout bound, and
+#	flag instances whose number of finite solutions is not the generic count (see check_finite), which points to
+#	path failures, instead of counting their real solutions in the distribution.
+#
+
+import numpy as np
+import re
+
+from results_db import connect, DB_PATH
+from homotopy import equation_degrees, solve_batch
+
+MAX_NATIVE_GENERIC = 6 #Largest number of buses for which the generic count is computed with homotopy.py
+GENERIC_TRIES = 2 #The generic count is the largest count over this many generic instances, in case paths fail
+MAX_GENERIC_TRIES = 8 #Generic instances solved in all if the count does not reach the Bezout bound or mixed volume
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS bounds (
+	graph_id TEXT PRIMARY KEY,
+	n INTEGER NOT NULL,
+	bezout INTEGER NOT NULL,
+	mixed_volume INTEGER,
+	generic INTEGER
+);
+'''
+
+_MIXED_VOLUME = re.compile(r'mixed volume\s*:\s*(\d+)')
+
+#Output: The Bezout bound of the system of the graph.
+def bezout_bound(graph):
+	return int(np.prod(equation_degrees(graph.n,graph.edges)))
+
+#Output: The binomial coefficient n choose k.
+def _binomial(n,k):
+	result = 1
+	for i in range(1,k+1):
+		result = result*(n-k+i)//i
+	return result
+
+#Output: True if the generic count of the graph is known in closed form (complete graphs).
+def _closed_form(graph):
+	return len(graph.edges) == graph.n*(graph.n-1)//2
+
+#Output: True if the generic count can be stored, ie. it is known in closed form or equals one of the upper bounds
+#(the Bezout bound or the mixed volume), so no solutions can have been lost.
+def verified_generic(graph,bounds,count):
+	return count is not None and (_closed_form(graph) or count in [bounds.get('bezout'),bounds.get('mixed_volume')])
+
+#Output: The number of finite solutions of the system of the graph at generic susceptances,
+#or None if the graph is too large to compute it here.
+#The count is the largest over GENERIC_TRIES generic instances, or over MAX_GENERIC_TRIES if that does not
+#reach the Bezout bound or the mixed volume in bounds (see verified_generic).
+def generic_count(graph,bounds=None):
+	if _closed_form(graph):
+		return _binomial(2*graph.n-2,graph.n-1)
+	if graph.n > MAX_NATIVE_GENERIC:
+		return None
+	bounds = bounds if bounds is not None else {'bezout':bezout_bound(graph)}
+	count = 0
+	tries = 0
+	while tries < MAX_GENERIC_TRIES:
+		size = (GENERIC_TRIES,len(graph.edges))
+		b = np.random.normal(size=size)+1j*np.random.normal(size=size)
+		count = max([count]+[sols.shape[0] for sols in solve_batch(graph.n,graph.edges,b)])
+		tries += GENERIC_TRIES
+		if verified_generic(graph,bounds,count):
+			break
+	return count
+
+#Input: The report PHC writes with phc -b (the output file, not the file of the system).
+#Output: The mixed volume in its root counts, or None if there is none.
+def mixed_volume_from_phc(filename):
+	try:
+		with open(filename,'r') as f:
+			match = _MIXED_VOLUME.search(f.read())
+	except IOError:
+		return None
+	return int(match.group(1)) if match else None
+
+def _connect(path):
+	conn = connect(path)
+	conn.executescript(_SCHEMA)
+	return conn
+
+#Output: A dictionary with the bounds of the graph (bezout, mixed_volume and generic, each None if unknown).
+#If graph_id is given, the bounds are read from the store, and those missing are computed and stored
+#(the generic count only if verified_generic holds, otherwise it is computed again by every run).
+def get_bounds(graph,graph_id=None,path=DB_PATH):
+	if graph_id is None:
+		bounds = {'bezout':bezout_bound(graph),'mixed_volume':None}
+		bounds['generic'] = generic_count(graph,bounds)
+		return bounds
+	conn = _connect(path)
+	try:
+		row = conn.execute('SELECT bezout, mixed_volume, generic FROM bounds WHERE graph_id = ?',(graph_id,)).fetchone()
+		if row is None:
+			with conn:
+				conn.execute('INSERT OR IGNORE INTO bounds (graph_id,n,bezout) VALUES (?,?,?)',(graph_id,graph.n,bezout_bound(graph)))
+			row = conn.execute('SELECT bezout, mixed_volume, generic FROM bounds WHERE graph_id = ?',(graph_id,)).fetchone()
+		bounds = dict(zip(['bezout','mixed_volume','generic'],row))
+		if bounds['generic'] is not None and not verified_generic(graph,bounds,bounds['generic']):
+			bounds['generic'] = None#Stored before counts were checked, it may be too low
+			with conn:
+				conn.execute('UPDATE bounds SET generic = NULL WHERE graph_id = ?',(graph_id,))
+		if bounds['generic'] is None:
+			bounds['generic'] = generic_count(graph,bounds)
+			if verified_generic(graph,bounds,bounds['generic']):
+				with conn:
+					conn.execute('UPDATE bounds SET generic = ? WHERE graph_id = ? AND generic IS NULL',(bounds['generic'],graph_id))
+	finally:
+		conn.close()
+	return bounds
+
+#Stores a bound that was found while solving, eg. record_bound(graph_id,'generic',20) after a parameter homotopy setup.
+#bounds is the dictionary returned by get_bounds, which is updated too. Bounds already in the store are kept.
+#A generic count is only stored if it equals the Bezout bound or the mixed volume (see verified_generic).
+#graph is only needed for generic counts.
+def record_bound(graph_id,bounds,name,value,path=DB_PATH,graph=None):
+	if value is None or bounds.get(name) is not None:
+		return
+	bounds[name] = value
+	if graph_id is None:
+		return
+	if name == 'generic' and not (graph is not None and verified_generic(graph,bounds,value)):
+		return
+	conn = _connect(path)
+	try:
+		with conn:
+			conn.execute('UPDATE bounds SET '+name+' = ? WHERE graph_id = ? AND '+name+' IS NULL',(int(value),graph_id))
+	finally:
+		conn.close()
+
+#Input: The bounds of the graph, and the number of finite and real solutions the solver found for an instance.
+#Output: None if these are consistent with the bounds, otherwise the kind of failure:
+#	'missing'	fewer finite solutions than the generic count, some paths failed,
+#	'excess'	more finite (or real) solutions than the generic count, eg. duplicates or paths that did not converge.
+#Instances whose number of finite solutions is unknown (num_finite is None) are not checked.
+def check_finite(bounds,num_finite,num_real=None):
+	expected = bounds.get('generic')
+	if expected is None or num_finite is None:
+		return None
+	if num_finite < expected:
+		return 'missing'
+	if num_finite > expected or (num_real is not None and num_real > expected):
+		return 'excess'
+	return None
+
+#Output: A line of text with the bounds, eg. for verbose output.
+def format_bounds(bounds):
+	return ', '.join([name+' '+str(bounds[name]) for name in ['bezout','mixed_volume','generic'] if bounds.get(name) is not None])
@@ -10,6 +10,8 @@
 #To specify edges, it should be a string of the form "a,b:c,d:e,g:...:j,k" where each variable here is a number.
 #For example, the complete graph on 3 buses is "0,1:1,2:0,2", as we assume it's undirected.
 #If you don't use the -edges command, it will default to a complete graph.
+#Large graphs can be read from a file with one edge per line, eg. the branch list of an IEEE test case,
+#with -edgefile [FILE] (see read_edge_file in graphs.py). The number of buses is then taken from the file.
 #
 #Example : python bertini_solve.py -n 4 -iters 1000 -edges "0,1:1,2:2,3:3,0"
 #This generates a graph on 4 buses with edges (0,1), (1,2), (2,3), (0,3)
@@ -23,108 +25,95 @@
 #
 #If you'd like to use your own graph id, you can do this with the option -g
 #
+#To use several cores, pass -jobs [NUMBER OF PROCESSES]. Every worker process runs Bertini
+#in its own scratch folder, and the distributions of all workers are merged at the end.
+#
+#Every instance is appended to a log in the Data folder as soon as it is solved (-log to put it
+#elsewhere). After a crash, rerun with -resume [LOG] to skip the instances already in the log.
+#
+#The distribution is also added to the results store Data/results.db, where the runs of
+#each graph-id are merged. See results_db.py for how to query it.
+#
+#Bertini's files are kept in a scratch folder (by default under /dev/shm, see -scratch),
+#which is removed when the run ends.
+#
+#-telemetry stderr reports the time spent in each stage, throughput, ETA and failures while
+#the run goes on (see telemetry.py for the other sinks).
+#
+#Instance i of a run is drawn from its own random stream, keyed by the seed of the run (-seed, drawn at random
+#if not given and recorded in the log) and i, so it can be solved again on its own with replay.py -log [LOG].
+#
+#The eliminant of the graph is read from the results store, where it is derived once per graph-id (see eliminants.py),
+#so any small graph can be compared, not only K4 minus an edge (whose eliminant comes from k4minus1.py).
+#
 
 import numpy as np
 import subprocess
 import sys
 import argparse
 import time
+import os
+from functools import partial
 
-from k4minus1 import *
-
-#Input: Matrix A describing the adjacency of the graph.
-#Output: A string corresponding to random equations in this system.
-#The format of the string is amenable to Bertini.
-def random_pq_eqs(A):
-	n = A.shape[0]
-	x_names = ['x'+str(i) for i in range(1,n)]
-	y_names = ['y'+str(i) for i in range(1,n)]
-
-	B = np.zeros([n,n])
-	t = 0
-	for i in range(n):
-		for j in range(i,n):
-			if A[i,j] != 0:
-				### This distribution controls the susceptances ###
-				B[i,j] = B[j,i] = np.random.normal(0,1)
-	x = [str(1)]+x_names
-	y = [str(0)]+y_names
-	b = [B[0,1],B[0,3],B[1,2],B[1,3],B[2,3]]
-
-	f = []
-	h = []
-	for i in range(1,n):
-		### This distribution controls the P and Q variables ###
-		p_eq = str(0)
-		h_eq = x[i]+"^2+"+y[i]+"^2-1"
-		for j in range(n):
-			if A[i,j] != 0:
-				p_eq += "+("+str(B[i,j])+")*("+x[j]+"*"+y[i]+"-"+x[i]+"*"+y[j]+")"
-		f.append(p_eq)
-		h.append(h_eq)
-	eqs = f+h
-	return eqs, b
-
-#Writes eqs to the file specified by filename.
-def write_equations(eqs,filename):
-	n = len(eqs)/2
-
-	disp = 'function '
-	for i in range(n):
-		if i > 0: disp += ','
-		disp += 'f'+str(i+1)
-	for i in range(n):
-		disp += ',g'+str(i+1)
-	disp += ';'+'\n'
-
-	disp += 'variable_group '
-	for i in range(n):
-		if i > 0: disp += ','
-		disp += 'x'+str(i+1)
-	for i in range(n):
-		disp += ',y'+str(i+1)
-	disp += ';'+'\n'+'\n'
-
-	for i in range(n):
-		disp += 'f'+str(i+1)+' = '+eqs[i]+';'+'\n'
-	for i in range(n):
-		disp += 'g'+str(i+1)+' = '+eqs[n+i]+';'+'\n'
-	disp += 'END;'
-
-	f = open(filename+'.input','w')
-	f.write(disp)
-	f.close()
+from parallel import run_pool, merge_counts
+from runlog import RunLog, completed, rebuild_counts, read_header
+from results_db import add_run
+from telemetry import Telemetry, make_sinks
+from templates import InputTemplate
+from workspace import Workspace, remove_files
+from graphs import Graph, complete_graph, parse_edge_string, read_edge_file, canonical_id
+from sampling import iter_instance_batches
+from eliminants import get_eliminant, k4minus1_eliminant
 
-#This generates iters many random equations according to the n-bus system
-#with adjacency matrix A.
-#tol is the tolerance for certifying a number is real (ie. imaginary part < tol)
-#If the number of real solutions equals the target, it prints the equation to the screen
-def eq_loop(A,iters,tol,n,graph_id,verbose=False):
-	seed = np.random.randint(0,100000)
-	freq_count = {}#This dictionary will record how frequently we see each number of real sol
-	prog_checker = iters/10#This will be udpated to say what percentage is completed
+BERTINI = os.path.abspath('bertini')#Absolute path, since parallel workers run Bertini from their own scratch folders
 
-	for i in range(iters):
-		eqs, b = random_pq_eqs(A)#Generate random equations
+#Yields the susceptances of the instances in range(start,stop) of the run seed (see instance_susceptances in sampling.py)
+#together with the number of real roots of their eliminant.
+#The eliminant is evaluated and solved for a whole batch of instances at once.
+#As before, every real root counts twice.
+def iter_instances(seed,start,stop,num_edges,elim,elim_cols,tol):
+	for batch in iter_instance_batches(seed,start,stop,num_edges):
+		num_elim_real = 2*elim.count_real(batch[:,elim_cols],tol)
+		for k in range(batch.shape[0]):
+			yield batch[k], num_elim_real[k]
 
-		elim_coeff = poly_coeff(b)
-		elim_roots = np.roots(elim_coeff)
-		num_elim_real = 0
-		for root in elim_roots:
-			if root.imag < tol:
-				num_elim_real += 2
+#Solves the instances in range(*bounds) inside the folder workdir, elim is the eliminant of the graph (see eliminants.py).
+#Bertini writes its output files into the folder it is run from, so parallel workers each use their own workdir.
+#Output: A dictionary recording how frequently we see each pair (real solutions, real eliminant roots).
+def solve_range(graph,tol,n,seed,log,telemetry,elim,bounds,workdir='.',verbose=False):
+	start, stop = bounds
+	iters = stop-start
+	freq_count = {}#This dictionary will record how frequently we see each number of real sol
+	prog_checker = max(1,iters/10)#This will be udpated to say what percentage is completed
+	telemetry.begin(iters)
 
-		write_equations(eqs,'temp_'+str(seed)+"_"+str(i))#Write them to a file
+	edges = graph.edges
+	template = InputTemplate(n,edges,'bertini')#The input file of this graph, only the susceptances change between instances
+	elim_cols = elim.columns(graph)#Columns of the susceptances entering the eliminant
+	for k, (row, num_elim_real) in enumerate(telemetry.timed('sample',iter_instances(seed,start,stop,len(edges),elim,elim_cols,tol))):
+		i = start+k
+		if log.is_done(i):
+			continue
+		instance_start = time.time()
+		name = 'temp_'+str(seed)+"_"+str(i)
+		with telemetry.stage('write'):
+			template.write(row,os.path.join(workdir,name))#Write the equations of this instance to a file
+			#The output of the previous instance is removed, so that a failed run is not read as this instance
+			remove_files(workdir,'real_finite_solutions','finite_solutions')
 
 		#We now try to solve them using Bertini.
-		try:
-			subprocess.call(["./bertini","temp_"+str(seed)+"_"+str(i)+".input","temp_"+str(seed)+"_"+str(i)+"_roots.txt"])
-		except:
-			print "Solving system "+str(i)+" failed"
+		with telemetry.stage('solve'):
+			try:
+				subprocess.call([BERTINI,name+".input",name+"_roots.txt"],cwd=workdir)
+			except:
+				telemetry.fail('solver_error')
+				print "Solving system "+str(i)+" failed"
 
 		#We now determine how many real solutions there were
+		parse_start = time.time()
+		number_real = None
 		try:
-			with open('real_finite_solutions','r') as f: #This is the file from Bertini recording all kinds of information about the solution set
+			with open(os.path.join(workdir,'real_finite_solutions'),'r') as f: #This is the file from Bertini recording all kinds of information about the solution set
 				first_line = f.readline()
 				number_real = int(first_line.strip())
 
@@ -137,17 +126,71 @@ def eq_loop(A,iters,tol,n,graph_id,verbose=False):
 
 		except:
 			print "Could not read file "+str(i)
+		telemetry.add_time('parse',time.time()-parse_start)
+		if number_real is None:
+			telemetry.fail('unreadable')
+		elapsed = time.time()-instance_start
+		with telemetry.stage('log'):
+			log.record(i,row,number_real,elim=num_elim_real,elapsed=elapsed)
 
-		#Deleting the text files created.
-		try:
-			subprocess.call(["rm","-f","temp_"+str(seed)+"_"+str(i)+".input"])
-		except:
-			print "Error removing temp_"+str(seed)+"_"+str(i)+".input"		
+		#Deleting the input file, the output files of Bertini are removed before the next instance is solved.
+		with telemetry.stage('cleanup'):
+			remove_files(workdir,name+".input")
+		telemetry.instance(i,elapsed)
 
 		#If verbose, we give a progress update every so often.
 		if verbose:
-			if i%prog_checker == 0:
-				sys.stdout.write(str((float(i)/iters)*100)+' percent completed\n')
+			if (i-start)%prog_checker == 0:
+				sys.stdout.write(str((float(i-start)/iters)*100)+' percent completed\n')
+
+	telemetry.end()
+	return freq_count
+
+#This generates iters many random equations according to the n-bus system
+#given by graph.
+#tol is the tolerance for certifying a number is real (ie. imaginary part < tol)
+#jobs is the number of worker processes; with jobs > 1 the instances are spread over a process pool.
+#Every instance is appended to the log log_path as soon as it is solved (see runlog.py).
+#If resume is the path of such a log, the instances in it are skipped and counted from the log instead.
+#The files of Bertini are written to a workspace in the folder scratch (see workspace.py).
+#Stage timers, failure counters and throughput are reported to the sinks of telemetry (see telemetry.py).
+#Instance i is drawn from the random stream of the run seed (see instance_susceptances in sampling.py), so it can be solved
+#again later with replay.py. The seed is drawn at random if not given, and recorded in the log.
+def eq_loop(graph,iters,tol,n,graph_id,verbose=False,jobs=1,log_path=None,resume=None,scratch=None,telemetry=None,seed=None):
+	if telemetry is None:
+		telemetry = Telemetry()
+	elim = get_eliminant(graph)
+	if elim is None:
+		sys.exit('The graph is too large to derive its eliminant')
+	#Runs of K4 minus an edge keep their old file names, those of other graphs are named compare_elim_(graph-id)_...
+	#so that they are not taken for runs of compare_poly_full_all.py (see import_file in results_db.py)
+	tag = 'k4minus1' if canonical_id(graph) == canonical_id(Graph(4,k4minus1_eliminant().edges)) else 'elim_'+graph_id
+	if resume:
+		#The instances of a resumed run are the same as those of the crashed run
+		seed = read_header(resume).get('seed',seed)
+		if seed is None:
+			seed = np.random.randint(0,2**31-1)
+		log = RunLog(resume,seed,completed(resume))
+		old_count = rebuild_counts([rec for rec in log.done.values() if rec['i'] < iters],lambda rec: (rec['real'],rec['elim']))
+		if verbose:
+			sys.stdout.write('Resuming, '+str(sum(old_count.values()))+' instances already in the log\n')
+	else:
+		if log_path is None:
+			log_path = 'Data/log_compare_'+tag+'_'+time.strftime('%b-%d-%Y_%H:%M:%S',time.localtime())
+		if seed is None:
+			seed = np.random.randint(0,2**31-1)
+		log = RunLog(log_path,seed)
+		log.header(graph_id=graph_id,n=n,edges=graph.edges,iters=iters,seed=seed)
+		old_count = {}
+
+	with Workspace(scratch) as workspace:
+		if jobs > 1:
+			telemetry.begin(iters)
+			freq_count = run_pool(partial(solve_range,graph,tol,n,seed,log,telemetry,elim),iters,jobs,verbose,scratch=workspace.path,telemetry=telemetry)
+			telemetry.end()
+		else:
+			freq_count = solve_range(graph,tol,n,seed,log,telemetry,elim,(0,iters),workdir=workspace.path,verbose=verbose)
+	merge_counts(freq_count,old_count)
 
 	#We now print the frequency count to the screen.
 	num_roots_found = freq_count.keys()
@@ -155,18 +198,29 @@ def eq_loop(A,iters,tol,n,graph_id,verbose=False):
 	t = time.localtime()
 	timestamp = time.strftime('%b-%d-%Y_%H:%M:%S', t)
 
-	with open('Data/compare_k4minus1_'+timestamp,'w') as f:
+	with open('Data/compare_'+tag+'_'+timestamp,'w') as f:
 		for k in num_roots_found:
 			f.write(str(k) + ' : ' + str(freq_count[k])+'\n')
 
+	#We also add the distribution to the results store, where all runs with the same graph-id are merged.
+	add_run('compare_poly_full',graph_id,freq_count,iters=iters,timestamp=timestamp,source=os.path.abspath('Data/compare_'+tag+'_'+timestamp))
+
 #Here we take the arguments passed via the command line.
 parser = argparse.ArgumentParser()
 parser.add_argument('-iters', type=int, dest="iters", default = 1000) #How many graphs to check
 parser.add_argument('-tol', type=float, dest="tol", default = 0.0000001) #What tolerance should we use to determine if something is a real solution
 parser.add_argument('-n', type=int,dest="n", default=4)#Number of buses
 parser.add_argument('-edges', dest="e", type=str, default="")#Edges structure, eg. "01,12,23"
+parser.add_argument('-edgefile', dest="edgefile", type=str, default="")#File with one edge per line, eg. the branch list of an IEEE test case (see graphs.py)
 parser.add_argument('-v',action='store_true', default=False, dest='verbose') #If verbose, it will tell you when it has done 10, 20, ... %
 parser.add_argument('-g', dest = "g", type=str, default="")
+parser.add_argument('-jobs', type=int, dest="jobs", default=1)#Number of worker processes
+parser.add_argument('-log', dest="log", type=str, default=None)#Where to log every instance
+parser.add_argument('-resume', dest="resume", type=str, default=None)#Log of a crashed run to continue
+parser.add_argument('-scratch', dest="scratch", type=str, default=None)#Folder for the scratch files, defaults to /dev/shm
+parser.add_argument('-telemetry', dest="telemetry", type=str, default="")#Where to report stage timings, eg. "stderr,json:Data/metrics.json"
+parser.add_argument('-telemetry_interval', type=float, dest="telemetry_interval", default=10)#Seconds between reports
+parser.add_argument('-seed', type=int, dest="seed", default=None)#Seed of the instances, drawn at random if not given (see replay.py)
 
 args = vars(parser.parse_args())
 iters = args["iters"]
@@ -174,26 +228,29 @@ verbose = args["verbose"]
 tol = args["tol"]
 n = args["n"]
 edge_string = args["e"]
+edge_file = args["edgefile"]
 g = args["g"]
+jobs = args["jobs"]
+log_path = args["log"]
+resume = args["resume"]
+scratch = args["scratch"]
+telemetry = Telemetry(make_sinks(args["telemetry"]),args["telemetry_interval"])
 
-#We now construct the edges corresponding to the edge string
-if len(edge_string) > 0:
-	edges = [(int(b.split(',')[0]),int(b.split(',')[1])) for b in edge_string.split(':')]
-	if len(g) == 0:
-		graph_id = ''+edge_string+''
-	else:
-		graph_id = g
+#We now construct the graph, from the edge file, the edge string, or the complete graph
+if len(edge_file) > 0:
+	graph = read_edge_file(edge_file)
+	n = graph.n
+	default_id = os.path.basename(edge_file)
+elif len(edge_string) > 0:
+	graph = Graph(n,parse_edge_string(edge_string))
+	default_id = ''+edge_string+''
 else:
-	edges = [(i,j) for i in range(n) for j in range(i+1,n)]
-	if len(g) == 0:
-		graph_id = 'K'+str(n)
-	else:
-		graph_id = g
-
-#This creates the adjacency matrix
-A = np.zeros([n,n])
-for e in edges:
-	A[e[0],e[1]] = A[e[1],e[0]] = 1
+	graph = complete_graph(n)
+	default_id = 'K'+str(n)
+if len(g) == 0:
+	graph_id = default_id
+else:
+	graph_id = g
 
 #This is the main call of the algorithm
-eq_loop(A,iters,tol,n,graph_id,verbose=verbose)
+eq_loop(graph,iters,tol,n,graph_id,verbose=verbose,jobs=jobs,log_path=log_path,resume=resume,scratch=scratch,telemetry=telemetry,seed=args["seed"])
@@ -0,0 +1,253 @@
+#Eliminants of the power flow equations of small graphs, derived once and cached.
+#
+#The eliminant of a graph is the univariate polynomial in y1 (the imaginary part of bus 1) that vanishes on all
+#solutions of its system, with coefficients that are polynomials in the susceptances b of the edges,
+#	sum over terms of coefficient * t^power * b_0^e_0 * ... * b_m^e_m.
+#k4minus1.py is such an eliminant, pasted by hand for one graph. Here the eliminant of any small graph is derived
+#with sympy (a Groebner basis over the field of rational functions in b, converted to lex order, whose last element
+#only involves y1), and stored as a table of terms (power, coefficient, e_0, ..., e_m) in the table eliminants of
+#Data/results.db, keyed by the canonical graph-id (see canonical_id in graphs.py). The derivation is only done once
+#per isomorphism class; every later run reads the table and evaluates it for whole batches of instances at once,
+#which is much cheaper than solving the system, eg. to estimate the number of real solutions of many instances.
+#
+#sympy is only needed to derive new eliminants, not to evaluate the stored ones. The cost of the derivation grows
+#quickly with the graph: K3 takes a fraction of a second, K4 minus an edge several minutes. That eliminant is
+#therefore taken from k4minus1.py instead of derived.
+#
+#To derive and store the eliminant of a graph, or of all connected graphs on n buses:
+#python eliminants.py derive -n [NUMBER OF BUSES] -edges [EDGES]
+#python eliminants.py derive -n [NUMBER OF BUSES] -all
+#
+#To list the stored eliminants:
+#python eliminants.py list
+#
+#To estimate the distribution of the number of real eliminant roots from random instances, without solving them:
+#python eliminants.py estimate -n [NUMBER OF BUSES] -edges [EDGES] -iters [NUMBER OF INSTANCES] [-seed SEED -mu MU -var VAR]
+#
+#Example : python eliminants.py estimate -n 3 -iters 100000
+#
+
+import numpy as np
+import argparse
+import json
+import sys
+
+from results_db import connect, DB_PATH
+from graphs import Graph, complete_graph, parse_edge_string, read_edge_file, canonical_id, canonical_labelling, canonical_edges, connected_graphs
+from sampling import bus_incidence, edge_columns, pq_eqs, iter_instance_batches
+from real_roots import count_real_roots, count_real_even_roots
+
+CHUNK_SIZE = 1024 #Number of instances evaluated at a time, this bounds the size of the monomial array
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS eliminants (
+	graph_id TEXT PRIMARY KEY,
+	n INTEGER NOT NULL,
+	edges TEXT NOT NULL,
+	degree INTEGER NOT NULL,
+	terms TEXT NOT NULL
+);
+'''
+
+class Eliminant(object):
+	#The eliminant of the graph with n buses and the given edges, in this labelling of the buses.
+	#terms is a list of (power, coefficient, e_0, ..., e_m), where e_k is the exponent of the susceptance of edges[k].
+	def __init__(self,n,edges,terms):
+		self.n = n
+		self.edges = [tuple(e) for e in edges]
+		self.terms = [tuple(t) for t in terms]
+		powers = np.array([t[0] for t in self.terms],dtype=int)
+		self.degree = int(powers.max())
+		self.low = int(powers.min())#The eliminant is t^low times a polynomial with a nonzero constant term
+		self.even = bool(np.all((powers-self.low)%2 == 0))#If so, the other factor is an even polynomial
+		self._exponents = np.array([t[2:] for t in self.terms],dtype=int).reshape(len(self.terms),len(self.edges))
+		self._max_exp = self._exponents.max() if self._exponents.size > 0 else 0
+
+		#_weights[k,t] is the coefficient of term t in the coefficient of t^(degree-k), so that
+		#the coefficients are a single matrix product with the monomial values (as in k4minus1.py).
+		self._weights = np.zeros([self.degree+1,len(self.terms)])
+		self._weights[self.degree-powers,np.arange(len(self.terms))] = [float(t[1]) for t in self.terms]
+
+	#Output: The columns of the susceptance array of graph that correspond to the edges of the eliminant.
+	#If graph is labelled differently, its buses are matched with those of the eliminant through the canonical labelling.
+	def columns(self,graph):
+		if sorted((min(e),max(e)) for e in graph.edges) == sorted((min(e),max(e)) for e in self.edges):
+			return edge_columns(graph.edges,self.edges)
+		own = canonical_labelling(Graph(self.n,self.edges))
+		label = canonical_labelling(graph)
+		bus = dict((c,v) for v, c in enumerate(label))#The bus of graph with canonical label c
+		return edge_columns(graph.edges,[(bus[own[i]],bus[own[j]]) for i, j in self.edges])
+
+	#Input: An array b of shape (iters,m), one row of susceptances (ordered as self.edges) per instance.
+	#Output: An array of shape (iters,degree+1) with the coefficients of the eliminant in t, highest degree first.
+	def coeffs(self,b):
+		b = np.atleast_2d(np.asarray(b,dtype=float))
+		iters = b.shape[0]
+		coeffs = np.zeros([iters,self.degree+1])
+		for start in range(0,iters,CHUNK_SIZE):
+			chunk = b[start:start+CHUNK_SIZE]
+			#powers[e,k,j] = chunk[k,j]**e
+			powers = np.ones([self._max_exp+1]+list(chunk.shape))
+			for e in range(1,self._max_exp+1):
+				powers[e] = powers[e-1]*chunk
+			#monomials[t,k] is the value of term t on instance k
+			monomials = np.ones([len(self.terms),chunk.shape[0]])
+			for j in range(chunk.shape[1]):
+				monomials = monomials*powers[self._exponents[:,j],:,j]
+			coeffs[start:start+CHUNK_SIZE] = self._weights.dot(monomials).T
+		return coeffs
+
+	#Input: An array b of shape (iters,m) as in coeffs, and the tolerance tol for certifying a root is real.
+	#Output: An array with the number of real roots of the eliminant of each instance.
+	#The factor t^low is split off, and even eliminants are solved as polynomials in t^2 (see real_roots.py).
+	def count_real(self,b,tol):
+		coeffs = self.coeffs(b)[:,:self.degree-self.low+1]
+		if coeffs.shape[1] == 1:#The eliminant is t^low (eg. for trees, where all solutions are real)
+			counts = np.zeros(coeffs.shape[0],dtype=int)
+		elif self.even:
+			counts = count_real_even_roots(coeffs[:,0::2],tol)
+		else:
+			counts = count_real_roots(coeffs,tol)
+		return counts+(1 if self.low > 0 else 0)
+
+#Output: The eliminant of K4 minus an edge from the tables in k4minus1.py, in its labelling B_EDGES.
+def k4minus1_eliminant():
+	import k4minus1
+	tables = [k4minus1.C8_TERMS,k4minus1.C6_TERMS,k4minus1.C4_TERMS,k4minus1.C2_TERMS,k4minus1.C0_TERMS]
+	return Eliminant(4,k4minus1.B_EDGES,[(8-2*k,)+tuple(term) for k, table in enumerate(tables) for term in table])
+
+#Input: The graph of the system (see graphs.py), with at least 2 buses.
+#Output: The terms (power, coefficient, e_0, ..., e_m) of its eliminant in y1, where e_k is the exponent of
+#the susceptance of graph.edges[k]. The coefficients are integers without a common factor.
+def derive_terms(graph):
+	try:
+		import sympy
+	except ImportError:
+		raise ImportError('Deriving an eliminant needs sympy, which is not installed')
+	n = graph.n
+	bs = sympy.symbols(['b'+str(i)+'_'+str(j) for i, j in graph.edges])
+	xs = sympy.symbols('x1:'+str(n))
+	ys = sympy.symbols('y1:'+str(n))
+	eqs = [sympy.sympify(eq) for eq in pq_eqs(bus_incidence(n,graph.edges),[str(b) for b in bs])]
+	gens = list(xs)+list(ys[1:])+[ys[0]]
+	basis = sympy.groebner(eqs,*gens,order='grevlex',domain=sympy.QQ.frac_field(*bs)).fglm('lex')
+	elim = basis.exprs[-1]
+	if elim.free_symbols & set(gens) != set([ys[0]]):
+		raise ValueError('The system of the graph has no eliminant in y1, it may not have finitely many solutions')
+
+	#Clear the denominators, then divide out the common factor of the coefficients of the powers of y1
+	num = sympy.fraction(sympy.cancel(sympy.together(elim)))[0]
+	num = sympy.cancel(num/sympy.gcd_list(sympy.Poly(num,ys[0]).all_coeffs()))
+	poly = sympy.Poly(num,ys[0],*bs,domain='QQ').clear_denoms()[1].set_domain('ZZ').primitive()[1]
+	if poly.LC() < 0:
+		poly = -poly
+	return [(monom[0],int(coeff))+tuple(monom[1:]) for monom, coeff in poly.terms()]
+
+def _connect(path):
+	conn = connect(path)
+	conn.executescript(_SCHEMA)
+	return conn
+
+#Stores the eliminant under graph_id, unless there is one already.
+def store_eliminant(graph_id,elim,path=DB_PATH):
+	conn = _connect(path)
+	try:
+		with conn:
+			conn.execute('INSERT OR IGNORE INTO eliminants (graph_id,n,edges,degree,terms) VALUES (?,?,?,?,?)',
+				(graph_id,elim.n,json.dumps(elim.edges),elim.degree,json.dumps(elim.terms)))
+	finally:
+		conn.close()
+
+#Output: The eliminant of the graph (an Eliminant, see columns for matching its edges with those of graph),
+#read from the store, or None if the graph is too large for a canonical graph-id.
+#If it is not stored yet, it is taken from k4minus1.py for K4 minus an edge and otherwise derived with sympy
+#(unless derive is False, then None is returned), and stored.
+def get_eliminant(graph,derive=True,path=DB_PATH):
+	graph_id = canonical_id(graph)
+	if graph_id is None:
+		return None
+	conn = _connect(path)
+	try:
+		row = conn.execute('SELECT n, edges, terms FROM eliminants WHERE graph_id = ?',(graph_id,)).fetchone()
+	finally:
+		conn.close()
+	if row is not None:
+		return Eliminant(row[0],json.loads(row[1]),json.loads(row[2]))
+
+	k4minus1 = k4minus1_eliminant()
+	if canonical_id(Graph(4,k4minus1.edges)) == graph_id:
+		elim = k4minus1
+	elif derive:
+		canonical = Graph(graph.n,canonical_edges(graph))
+		elim = Eliminant(graph.n,canonical.edges,derive_terms(canonical))
+	else:
+		return None
+	store_eliminant(graph_id,elim,path)
+	return elim
+
+#Output: The stored eliminants, as a list of (graph-id, number of buses, degree, number of terms).
+def list_eliminants(path=DB_PATH):
+	conn = _connect(path)
+	try:
+		rows = conn.execute('SELECT graph_id, n, degree, terms FROM eliminants ORDER BY n, graph_id').fetchall()
+	finally:
+		conn.close()
+	return [(graph_id,n,degree,len(json.loads(terms))) for graph_id, n, degree, terms in rows]
+
+#Output: A dictionary recording how frequently we see each number of real eliminant roots among the instances
+#in range(iters) of the run seed (see iter_instance_batches in sampling.py).
+def estimate(graph,elim,iters,tol,seed,mu=0,var=1):
+	cols = elim.columns(graph)
+	freq_count = {}
+	for batch in iter_instance_batches(seed,0,iters,len(graph.edges),mu,var):
+		values, counts = np.unique(elim.count_real(batch[:,cols],tol),return_counts=True)
+		for v, c in zip(values.tolist(),counts.tolist()):
+			freq_count[v] = freq_count.get(v,0)+c
+	return freq_count
+
+def _describe(graph_id,elim):
+	return graph_id+': degree '+str(elim.degree)+', '+str(len(elim.terms))+' terms'+(', even' if elim.even else '')
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser()
+	parser.add_argument('command', choices=['derive','list','estimate'])
+	parser.add_argument('-n', type=int,dest="n", default=3)#Number of buses
+	parser.add_argument('-edges', dest="e", type=str, default="")#Edges structure, eg. "0,1:1,2:2,0"
+	parser.add_argument('-edgefile', dest="edgefile", type=str, default="")#File with one edge per line (see graphs.py)
+	parser.add_argument('-all',action='store_true', default=False, dest='all')#Derive the eliminants of all connected graphs on n buses
+	parser.add_argument('-iters', type=int, dest="iters", default=10000)#Number of instances to estimate from
+	parser.add_argument('-seed', type=int, dest="seed", default=None)#Seed of the instances, drawn at random if not given
+	parser.add_argument('-mu', dest="mu", type=int, default=0)#The mean of the random edges
+	parser.add_argument('-var', dest="var", type=float, default=1)#The variance of the random edges
+	parser.add_argument('-tol', type=float, dest="tol", default = 0.0000001)#Tolerance for certifying a root is real
+	parser.add_argument('-db', dest="db", type=str, default=DB_PATH)
+
+	args = vars(parser.parse_args())
+	if args["command"] == 'list':
+		for graph_id, n, degree, num_terms in list_eliminants(args["db"]):
+			print graph_id+' : '+str(n)+' buses, degree '+str(degree)+', '+str(num_terms)+' terms'
+		sys.exit(0)
+
+	if args["all"]:
+		graphs = connected_graphs(args["n"])
+	elif len(args["edgefile"]) > 0:
+		graphs = [read_edge_file(args["edgefile"])]
+	elif len(args["e"]) > 0:
+		graphs = [Graph(args["n"],parse_edge_string(args["e"]))]
+	else:
+		graphs = [complete_graph(args["n"])]
+
+	if args["command"] == 'derive':
+		for graph in graphs:
+			elim = get_eliminant(graph,path=args["db"])
+			print _describe(canonical_id(graph,'(too large)'),elim) if elim is not None else 'The graph is too large for a canonical graph-id'
+	else:
+		seed = args["seed"] if args["seed"] is not None else np.random.randint(0,2**31-1)
+		for graph in graphs:
+			elim = get_eliminant(graph,path=args["db"])
+			if elim is None:
+				sys.exit('The graph is too large for a canonical graph-id')
+			print _describe(canonical_id(graph),elim)+', seed '+str(seed)
+			freq_count = estimate(graph,elim,args["iters"],args["tol"],seed,args["mu"],args["var"])
+			for k in sorted(freq_count.keys()):
+				print str(k)+' : '+str(freq_count[k])
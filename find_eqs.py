@@ -4,167 +4,185 @@
 #To specify edges, it should be a string of the form "ab,cd,eg,...,jk" where each variable here is a number.
 #For example, the complete graph on 3 buses is "01,12,02", as we assume it's undirected.
 #If you don't use the -edges command, it will default to a complete graph.
+#Large graphs can be read from a file with one edge per line, eg. the branch list of an IEEE test case,
+#with -edgefile [FILE] (see read_edge_file in graphs.py). The number of buses is then taken from the file.
 #
 #Example : python find_eqs.py -n 4 -iters 1000 -edges "01,12,23,03 -target 12"
 #This generates a graph on 4 buses with edges (0,1), (1,2), (2,3), (0,3)
 #It then generates 1000 random equations and tries to find instances with 12 real solutions
 #
+#For small numbers of buses, -native solves the systems in-process with the NumPy homotopy
+#solver in homotopy.py, instead of writing files and calling PHC.
+#
+#Rare targets (eg. the maximal number of real solutions) are found much faster with -search, which
+#moves the distribution of the susceptances towards instances that came close to the target
+#(cross-entropy search, see search.py) and reports the gain in hit rate over plain sampling.
+#Each generation has -population instances, of which the best -elite fraction guide the next one.
+#With -stop_after [K] the search stops after K instances were found.
+#Example : python find_eqs.py -n 4 -iters 2000 -target 14 -search -stop_after 1 -native
+#
+#Every instance found is printed with the seed of the run and its index, eg. "Instance 1 (seed 1234, index 567):",
+#so that it can be solved again, eg. at higher precision, with python replay.py -n 4 -seed 1234 -instances 567.
+#
+#-backend chooses the solver: phc (the default), bertini, phcpy (PHCpack's Python bindings, in-process
+#and without any files, if phcpy is installed) or native (see backends.py).
+#
+#PHC's files are kept in a scratch folder (by default under /dev/shm, see -scratch),
+#which is removed when the run ends.
 #
 
 import numpy as np
-import subprocess
-import sys
 import argparse
 
-
-#Input: Matrix A describing the adjacency of the graph.
-#Output: A string corresponding to random equations in this system.
-#The format of the string is amenable to PHC.
-def random_pq_eqs(A):
-	n = A.shape[0]
-	x_names = ['x'+str(i) for i in range(1,n)]
-	y_names = ['y'+str(i) for i in range(1,n)]
-
-	B = np.zeros([n,n])
-	t = 0
-	for i in range(n):
-		for j in range(i,n):
-			if A[i,j] != 0:
-				### This distribution controls the susceptances ###
-				B[i,j] = B[j,i] = np.random.normal(0,1)
-	x = [str(1)]+x_names
-	y = [str(0)]+y_names
-
-	f = []
-	h = []
-	for i in range(1,n):
-		### This distribution controls the P and Q variables ###
-		p_eq = str(0)
-		h_eq = x[i]+"^2+"+y[i]+"^2-1"
-		for j in range(n):
-			if A[i,j] != 0:
-				p_eq += "+("+str(B[i,j])+")*("+x[j]+"*"+y[i]+"-"+x[i]+"*"+y[j]+")"
-		f.append(p_eq)
-		h.append(h_eq)
-	eqs = f+h
-	return eqs
-
-#Writes eqs to the file specified by filename.
-def write_equations(eqs,filename):
-	disp = str(len(eqs))+'\n'
-	for coeff in eqs:
-		str_coeff = str(coeff)
-		disp = disp+str_coeff.replace(' ','') + ';\n'
-	f = open(filename+'_eqs.txt','w')
-	f.write(disp)
-	f.close()
+from graphs import Graph, complete_graph, parse_edge_string, read_edge_file
+from sampling import bus_incidence, iter_instance_batches, iter_instances, pq_eqs
+from homotopy import count_real_solutions
+from phc_output import count_real
+from workspace import Workspace
+from backends import make_backend
+from search import search, format_stats
+
+
+#Prints the equations of the instance with susceptances b, the found-th instance hitting the target.
+#If the instance is instance i of the run seed, this is printed too, so it can be solved again with replay.py.
+def print_instance(incidence,b,found,seed=None,i=None):
+	if seed is not None:
+		print "Instance "+str(found)+" (seed "+str(seed)+", index "+str(i)+"):"
+	else:
+		print "Instance "+str(found)+":"
+	for coeff in pq_eqs(incidence,b):
+		print str(coeff)
+	print ""
 
 #This generates iters many random equations according to the n-bus system
-#with adjacency matrix A.
+#given by graph.
 #tol is the tolerance for certifying a number is real (ie. imaginary part < tol)
 #If the number of real solutions equals the target, it prints the equation to the screen
-def eq_loop(A,iters,tol,n,target):
-	seed = np.random.randint(0,100000)
-	prog_checker = iters/10
+#The files of PHC are written to a workspace in the folder scratch (see workspace.py).
+#backend is the solver, see backends.py.
+#Instance i is drawn from the random stream of the run seed (see instance_susceptances in sampling.py).
+def eq_loop(graph,iters,tol,n,target,scratch=None,backend='phc',seed=None):
+	if seed is None:
+		seed = np.random.randint(0,2**31-1)
 	instances_found = 0
 
-	for i in range(iters):
-		eqs = random_pq_eqs(A)#Generate random equations
-		write_equations(eqs,'temp_'+str(seed)+"_"+str(i))#Write them to a file
-
-		#We now try to solve them using phc
-		try:
-			subprocess.call(["./phc","-b","temp_"+str(seed)+"_"+str(i)+"_eqs.txt","temp_"+str(seed)+"_"+str(i)+"_roots.txt"])
-			subprocess.call(["./phc","-x","temp_"+str(seed)+"_"+str(i)+"_eqs.txt","temp_"+str(seed)+"_"+str(i)+"_eqs.dic"])
-		except:
-			print "Solving system "+str(i)+" failed"
-
-		number_real = 0
-
-		#We now determine how many real solutions there were
-		try:
-			#This is the file from PHC recording all kinds of information about the solution set
-			f = open("temp_"+str(seed)+"_"+str(i)+"_eqs.dic","r")
-			s = f.read()
-			sols = eval(s)
-
-			known_keys = ['res','err','multiplicity','time','rco']
-			#These are known pieces of data the file contains that aren't useful to us
-			
-			#We now loop through the solutions and calculate how many are real.
-			for sol in sols:
-				is_real = True
-				for k in sol.keys():
-					if k not in known_keys:
-						root = sol[k]
-						if abs(root.imag) > tol:
-							is_real = False
-				if is_real:
-					number_real += 1
-			f.close()
-
-		except:
-			print "Could not read file "+str(i)
+	edges = graph.edges
+	incidence = bus_incidence(n,edges)
+	workspace = Workspace(scratch)
+	solver = make_backend(backend,graph,workspace.path,"temp_"+str(seed))#The input file of this graph is compiled once, only the susceptances change between instances
+	for i, b in enumerate(iter_instances(seed,0,iters,len(edges))):
+		#We now try to solve them using phc (or the chosen backend), and determine how many real solutions there were
+		sols = solver.solve(b[None])[0]
+		if sols is None:
+			print "Could not read the solutions of instance "+str(i)
+			continue
+		number_real = count_real(sols,tol)
 
 		#If the number found equals the target
 		if number_real == target:
 			instances_found += 1
 			#We now print the equation
-			print "Instance "+str(instances_found)+":"
-			for coeff in eqs:
-				print str(coeff)
-			print ""
-			
-
-		#Deleting the text files created	
-		try:
-			subprocess.call(["rm","-f","temp_"+str(seed)+"_"+str(i)+"_eqs.txt"])
-		except:
-			print "Error removing temp_"+str(seed)+"_"+str(i)+"_eqs.txt"
-
-		try:
-			subprocess.call(["rm","-f","temp_"+str(seed)+"_"+str(i)+"_eqs.dic"])
-		except:
-			print "Error removing temp_"+str(seed)+"_"+str(i)+"_eqs.dic"
-
-		try:
-			subprocess.call(["rm","-f","temp_"+str(seed)+"_"+str(i)+"_roots.txt"])
-		except:
-			print "Error removing temp_"+str(seed)+"_"+str(i)+"_roots.txt"			
+			print_instance(incidence,b,instances_found,seed,i)
+	workspace.close()
+
+	#Total number of instances found
+	print "Instances found: "+str(instances_found)
+
+#Same as eq_loop, but the systems are solved in-process with the homotopy solver in homotopy.py.
+def native_loop(graph,iters,tol,n,target,seed=None):
+	if seed is None:
+		seed = np.random.randint(0,2**31-1)
+	instances_found = 0
+
+	edges = graph.edges
+	incidence = bus_incidence(n,edges)
+	done = 0
+	for batch in iter_instance_batches(seed,0,iters,len(edges)):
+		number_real = count_real_solutions(n,edges,batch,tol)
+
+		#If the number found equals the target
+		for k in np.nonzero(number_real == target)[0]:
+			instances_found += 1
+			#We now print the equation
+			print_instance(incidence,batch[k],instances_found,seed,done+k)
+		done += batch.shape[0]
 
 	#Total number of instances found
 	print "Instances found: "+str(instances_found)
 
+#Same as eq_loop, but the susceptances are drawn by the cross-entropy search in search.py, which moves
+#the sampling distribution towards instances close to the target. At most iters instances are solved,
+#by the solver backend (see backends.py), and the search stops after stop_after hits (if > 0).
+#At the end, the hit rate of the search is compared with the hit rate of plain sampling.
+#The search does not draw from the streams of a seed, so its instances are only given by the printed equations.
+def search_loop(graph,iters,tol,n,target,backend='phc',scratch=None,population=50,elite=0.2,stop_after=0,verbose=False):
+	seed = np.random.randint(0,100000)
+	edges = graph.edges
+	incidence = bus_incidence(n,edges)
+	found = [0]
+
+	def on_hit(b):
+		found[0] += 1
+		print_instance(incidence,b,found[0])
+
+	workspace = Workspace(scratch)
+	solver = make_backend(backend,graph,workspace.path,"temp_"+str(seed))
+	count_fn = lambda b: [count_real(sols,tol) if sols is not None else None for sols in solver.solve(b)]
+
+	stats = search(count_fn,len(edges),target,iters,population,elite,on_hit=on_hit,stop_after=stop_after,verbose=verbose)
+	workspace.close()
+
+	#Total number of instances found
+	print "Instances found: "+str(found[0])
+	for line in format_stats(stats):
+		print line
+
 #Here we take the arguments passed via the command line.
 parser = argparse.ArgumentParser()
 parser.add_argument('-iters', type=int, dest="iters", default = 1000) #How many graphs to check
 parser.add_argument('-tol', type=float, dest="tol", default = 0.0000001) #What tolerance should we use to determine if something is a real solution
 parser.add_argument('-n', type=int,dest="n", default=4)#Number of buses
 parser.add_argument('-edges', dest="e", type=str, default="")#Edges structure, eg. "01,12,23"
+parser.add_argument('-edgefile', dest="edgefile", type=str, default="")#File with one edge per line, eg. the branch list of an IEEE test case (see graphs.py)
 parser.add_argument('-target', dest="t", type=int, default=0)#How many solutions we are looking for
+parser.add_argument('-native',action='store_true', default=False, dest='native') #Solve in-process instead of calling PHC (for small n)
+parser.add_argument('-backend', dest="backend", choices=['phc','bertini','phcpy','native'], default='phc')#Solver, see backends.py
+parser.add_argument('-scratch', dest="scratch", type=str, default=None)#Folder for the scratch files, defaults to /dev/shm
+parser.add_argument('-search',action='store_true', default=False, dest='search') #Guided (cross-entropy) search instead of plain sampling
+parser.add_argument('-population', type=int, dest="population", default=50)#Instances per generation of the search
+parser.add_argument('-elite', type=float, dest="elite", default=0.2)#Fraction of a generation that guides the next one
+parser.add_argument('-stop_after', type=int, dest="stop_after", default=0)#Stop after this many instances were found (0: solve all -iters)
+parser.add_argument('-v',action='store_true', default=False, dest='verbose') #Report every generation of the search
+parser.add_argument('-seed', type=int, dest="seed", default=None)#Seed of the instances, drawn at random if not given (see replay.py)
 
 args = vars(parser.parse_args())
 iters = args["iters"]
 tol = args["tol"]
 n = args["n"]
 edge_string = args["e"]
+edge_file = args["edgefile"]
 target = args["t"]
-
-#We now construct the edges corresponding to the edge string
-if len(edge_string) > 0:
-	edges = [(int(a[0]),int(a[1])) for a in edge_string.split(",")]
+native = args["native"] or args["backend"] == 'native'
+scratch = args["scratch"]
+
+#We now construct the graph, from the edge file, the edge string, or the complete graph
+if len(edge_file) > 0:
+	graph = read_edge_file(edge_file)
+	n = graph.n
+elif len(edge_string) > 0:
+	graph = Graph(n,parse_edge_string(edge_string))
 else:
-	edges = [(i,j) for i in range(n) for j in range(i+1,n)]
-
-#This creates the adjacency matrix
-A = np.zeros([n,n])
-for e in edges:
-	A[e[0],e[1]] = A[e[1],e[0]] = 1
+	graph = complete_graph(n)
 
 #This is the main call of the algorithm
-eq_loop(A,iters,tol,n,target)
+if args["search"]:
+	search_loop(graph,iters,tol,n,target,backend='native' if native else args["backend"],scratch=scratch,population=args["population"],elite=args["elite"],stop_after=args["stop_after"],verbose=args["verbose"])
+elif native:
+	native_loop(graph,iters,tol,n,target,seed=args["seed"])
+else:
+	eq_loop(graph,iters,tol,n,target,scratch=scratch,backend=args["backend"],seed=args["seed"])
 
-#To change the distribution of the variables, see the commented parts of random_pq_eqs.
+#To change the distribution of the variables, see sample_susceptances in sampling.py.
 #You can change to any of the distributions located at: https://docs.scipy.org/doc/numpy/reference/routines.random.html
 
 
@@ -0,0 +1,216 @@
+#A sparse representation of the graph of a power system.
+#
+#The drivers used to build a dense n x n adjacency matrix and scan all of its entries to find
+#the edges, which is quadratic in the number of buses. A Graph stores the sorted edge list,
+#plus the adjacency in compressed sparse row (CSR) form:
+#	the neighbours of bus i are indices[indptr[i]:indptr[i+1]], in increasing order,
+#	and edge_ids[indptr[i]:indptr[i+1]] are the positions of the corresponding edges in edges.
+#Everything is built in O(|E| log |E|), so systems with hundreds of buses are cheap to set up.
+#
+#The edges are sorted as (i,j) with i < j, which is the order in which adjacency_edges
+#reads them from a matrix, so the susceptances are drawn in the same order as before.
+#
+#Graphs can be given by an edge string (see parse_edge_string) or read from a file of lines,
+#eg. the branch list of an IEEE test case (see read_edge_file).
+#
+
+import numpy as np
+
+from sampling import adjacency_edges
+
+class Graph(object):
+	#Input: The number of buses n and a list of edges (i,j).
+	#Loops are dropped, and an edge listed several times (or in both directions) is kept once.
+	#labels optionally records the original name of each bus, eg. its number in an IEEE test case.
+	def __init__(self,n,edges,labels=None):
+		edges = sorted(set((min(i,j),max(i,j)) for i, j in edges if i != j))
+		if edges and edges[-1][1] >= n:
+			raise ValueError('Edge '+str(edges[-1])+' does not fit in a graph with '+str(n)+' buses')
+		self.n = n
+		self.edges = edges
+		self.labels = labels if labels is not None else list(range(n))
+
+		#Both directions of every edge, sorted by bus and then by neighbour
+		ends = np.array(edges,dtype=int).reshape(-1,2)
+		ids = np.arange(len(edges))
+		rows = np.concatenate([ends[:,0],ends[:,1]])
+		cols = np.concatenate([ends[:,1],ends[:,0]])
+		order = np.lexsort((cols,rows))
+		self.indices = cols[order]
+		self.edge_ids = np.concatenate([ids,ids])[order]
+		self.indptr = np.concatenate([[0],np.cumsum(np.bincount(rows,minlength=n))])
+
+	#Output: The graph with adjacency matrix A.
+	@classmethod
+	def from_adjacency(cls,A):
+		return cls(A.shape[0],adjacency_edges(A))
+
+	#Output: The dense adjacency matrix, for code that still needs it.
+	def adjacency(self):
+		A = np.zeros([self.n,self.n])
+		for i, j in self.edges:
+			A[i,j] = A[j,i] = 1
+		return A
+
+	#Output: The neighbours of bus i, in increasing order.
+	def neighbours(self,i):
+		return self.indices[self.indptr[i]:self.indptr[i+1]]
+
+	#Output: An array with the degree of every bus.
+	def degrees(self):
+		return np.diff(self.indptr)
+
+	#Output: For each bus i, the list of pairs (j,e) where j is a neighbour of i and e is the index of the edge {i,j}.
+	#This is the same as sampling.bus_incidence(self.n,self.edges).
+	def incidence(self):
+		return [list(zip(self.neighbours(i).tolist(),self.edge_ids[self.indptr[i]:self.indptr[i+1]].tolist())) for i in range(self.n)]
+
+#Output: The complete graph on n buses.
+def complete_graph(n):
+	return Graph(n,[(i,j) for i in range(n) for j in range(i+1,n)])
+
+#Input: An edge string, either of the form "0,1:1,2:2,3" (used by bertini_solve) or "01,12,23" (used by random_eqs).
+#Output: The list of edges.
+def parse_edge_string(edge_string):
+	pairs = edge_string.split(':')
+	if len(pairs) == 1 and all(len(p) == 2 for p in edge_string.split(',')):
+		return [(int(p[0]),int(p[1])) for p in edge_string.split(',')]
+	return [(int(p.split(',')[0]),int(p.split(',')[1])) for p in pairs]
+
+#Reads a graph from a file with one line (branch) per edge.
+#The first two integers of a line are the buses it connects; further columns (impedances etc.) are ignored,
+#as are lines that do not start with two integers (headers) and everything after a '#' or '%'.
+#Columns may be separated by whitespace, commas or semicolons, so MATPOWER branch matrices and CSV line lists both work.
+#The buses are renumbered 0,...,n-1 in increasing order of their number in the file, except that ref (if given)
+#becomes bus 0, the reference bus with x_0 = 1 and y_0 = 0. The original numbers are kept in graph.labels.
+def read_edge_file(filename,ref=None):
+	lines = []
+	with open(filename,'r') as f:
+		for line in f:
+			fields = line.split('#')[0].split('%')[0].replace(',',' ').replace(';',' ').split()
+			try:
+				lines.append((int(fields[0]),int(fields[1])))
+			except (IndexError,ValueError):
+				continue
+	buses = sorted(set([i for i, j in lines]+[j for i, j in lines]))
+	if ref is not None:
+		buses.remove(ref)
+		buses = [ref]+buses
+	number = dict((b,k) for k, b in enumerate(buses))
+	return Graph(len(buses),[(number[i],number[j]) for i, j in lines],labels=buses)
+
+MAX_CANONICAL = 12 #Graphs with more buses keep the graph-id they are given, see canonical_id
+
+#Input: The neighbours of every bus and a colour (an integer) for every bus.
+#Output: The coarsest refinement of the colouring in which buses of the same colour have the same
+#number of neighbours of every colour. The colours are renumbered 0,1,... in a way that does not depend on the labels.
+def _refine(neighbours,colours):
+	num_colours = len(set(colours))
+	while True:
+		signatures = [(colours[v],tuple(sorted(colours[u] for u in neighbours[v]))) for v in range(len(colours))]
+		rank = dict((s,k) for k, s in enumerate(sorted(set(signatures))))
+		colours = [rank[s] for s in signatures]
+		if len(rank) == num_colours:
+			return colours
+		num_colours = len(rank)
+
+#Output: The buses that u is mapped to by the group generated by the automorphisms in generators (each a list giving
+#the image of every bus).
+def _orbit(u,generators):
+	orbit = set([u])
+	stack = [u]
+	while stack:
+		v = stack.pop()
+		for g in generators:
+			if g[v] not in orbit:
+				orbit.add(g[v])
+				stack.append(g[v])
+	return orbit
+
+#Output: The canonical relabelling of the graph, a list giving the canonical label of every bus.
+#Two graphs are isomorphic if and only if their relabelled edge lists (see canonical_edges) are the same. The labelling
+#is searched by colour refinement, branching over the buses of the first non-singleton colour (individualisation-refinement).
+#Two leaves of the search with the same edge list give an automorphism of the graph. At a node where the buses fixed so
+#far are also fixed by some of the automorphisms found, buses in the same orbit under those lead to the same edge lists,
+#so only one bus of every orbit is branched on. Without this, symmetric graphs (eg. K_n, with n! leaves) take factorial time.
+#The number of real solutions does not depend on which bus is the reference bus: the power balance of bus 0
+#is the sum of the others, so relabelling the buses of an instance (with its susceptances) does not change it.
+def canonical_labelling(graph):
+	neighbours = [graph.neighbours(i).tolist() for i in range(graph.n)]
+	first = [None,None]#The edge list and labelling of the first leaf, and of the best leaf so far
+	best = [None,None]
+	automorphisms = []
+
+	def search(colours,fixed):
+		colours = _refine(neighbours,colours)
+		if len(set(colours)) == graph.n:
+			form = sorted((min(colours[i],colours[j]),max(colours[i],colours[j])) for i, j in graph.edges)
+			for known_form, known in [first,best]:
+				if known_form == form:
+					bus = dict((c,v) for v, c in enumerate(known))
+					automorphisms.append([bus[colours[u]] for u in range(graph.n)])
+					break
+			if first[0] is None:
+				first[0], first[1] = form, colours
+			if best[0] is None or form < best[0]:
+				best[0], best[1] = form, colours
+			return
+		cell = min(c for c in set(colours) if colours.count(c) > 1)
+		seen = set()
+		for v in [u for u in range(graph.n) if colours[u] == cell]:
+			if v in seen:
+				continue
+			search([2*c+(1 if c == cell and u != v else 0) for u, c in enumerate(colours)],fixed+[v])
+			seen |= _orbit(v,[g for g in automorphisms if all(g[u] == u for u in fixed)])
+
+	search([0]*graph.n,[])
+	return best[1]
+
+#Output: The canonical form of the graph, as the sorted edge list of the canonical relabelling.
+#Two graphs have the same canonical form if and only if they are isomorphic.
+def canonical_edges(graph):
+	label = canonical_labelling(graph)
+	return sorted((min(label[i],label[j]),max(label[i],label[j])) for i, j in graph.edges)
+
+#Output: The graph-id of the isomorphism class of the graph, "C(n)_(hex)", where bit i*n+j of the hexadecimal
+#number is set for every edge (i,j), i < j, of the canonical form.
+#For graphs with more than MAX_CANONICAL buses the search may be too slow, and default is returned instead.
+def canonical_id(graph,default=None):
+	if graph.n > MAX_CANONICAL:
+		return default
+	code = 0
+	for i, j in canonical_edges(graph):
+		code |= 1 << (i*graph.n+j)
+	return 'C'+str(graph.n)+'_'+format(code,'x')
+
+#Output: The edge string of the graph in the form "0,1:1,2:2,3", which both drivers accept with -edges.
+def edge_string(graph):
+	return ':'.join([str(i)+','+str(j) for i, j in graph.edges])
+
+#Output: The connected graphs on n buses, one per isomorphism class, in their canonical labelling.
+#The graphs are grown one edge at a time from the empty graph, keeping one graph of every isomorphism class.
+def connected_graphs(n):
+	level = {(): Graph(n,[])}
+	result = []
+	for k in range(n*(n-1)//2):
+		next_level = {}
+		for edges, graph in level.items():
+			present = set(edges)
+			for e in [(i,j) for i in range(n) for j in range(i+1,n) if (i,j) not in present]:
+				form = tuple(canonical_edges(Graph(n,list(edges)+[e])))
+				if form not in next_level:
+					next_level[form] = Graph(n,form)
+		level = next_level
+		result += [g for form, g in sorted(level.items()) if is_connected(g)]
+	return result
+
+#Output: True if the graph is connected.
+def is_connected(graph):
+	seen = set([0])
+	stack = [0]
+	while stack:
+		for u in graph.neighbours(stack.pop()).tolist():
+			if u not in seen:
+				seen.add(u)
+				stack.append(u)
+	return len(seen) == graph.n
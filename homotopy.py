@@ -0,0 +1,217 @@
+#An in-process homotopy continuation solver for the power flow equations.
+#
+#For small graphs, starting ./bertini or ./phc and reading its output files costs more than
+#tracking the paths. This module solves the same systems as the drivers,
+#	f_i = sum_{j ~ i} B[i,j]*(x_j*y_i - x_i*y_j),	g_i = x_i^2 + y_i^2 - 1,	i = 1,...,n-1,
+#with x_0 = 1 and y_0 = 0, directly in NumPy.
+#
+#We use the total degree homotopy
+#	H(z,t) = (1-t)*F(z) + t*gamma*G(z),	G_i(z) = z_i^{d_i} - 1,
+#where d_i is the degree of the i-th equation and gamma is a random complex number.
+#At t = 1 the solutions are the tuples of roots of unity. The paths of all instances of a batch are
+#stacked into one array and tracked to t = 0 together, using a Runge-Kutta predictor, a Newton
+#corrector and step size control that is done separately for every path.
+#Paths whose norm blows up go to infinity and are dropped. At t = 0 the endpoints are refined
+#with Newton's method on F, and those with a small residual are the finite solutions.
+#
+#There is no endgame (as the power series or Cauchy endgames of Bertini): the paths are tracked to t = 0
+#and only refined there. This is enough for the instances of the drivers, whose susceptances are random,
+#so that their finite solutions are nonsingular with probability one. A path ending in a singular solution
+#cannot be finished reliably this way, so endpoints whose Jacobian is numerically singular (its condition
+#number, with the rows scaled to norm 1, is above COND_TOL) are rejected, like those with a large residual.
+#Large but regular solutions, eg. of instances with a tiny susceptance, have condition numbers up to about 1e11. An instance with such a path then has fewer finite
+#solutions than the generic count, and the drivers report it as a failure (see check_finite in bounds.py)
+#instead of counting a wrong number of real solutions.
+#
+
+import numpy as np
+import itertools
+
+MAX_PATHS = 20000 #Maximal number of paths tracked at once, instances are split into chunks accordingly
+DIVERGE = 1e7 #Paths whose norm exceeds this are considered to go to infinity
+MIN_STEP = 1e-13 #Paths whose step size falls below this are considered failed
+NEWTON_TOL = 1e-9 #A corrector step is accepted when the Newton update is smaller than this (relative to the point)
+RESIDUAL_TOL = 1e-8 #An endpoint is a solution when the residual of F is smaller than this
+COND_TOL = 1e13 #and the condition number of the Jacobian of F (with rows of norm 1) is smaller than this
+
+#Input: The number of buses n, the list of edges and an array b of shape (iters,|E|) of susceptances.
+#Output: An array of shape (iters,n,n) holding the symmetric susceptance matrix of every instance.
+#Complex susceptances (eg. generic parameters, see bounds.py) give complex matrices.
+def susceptance_matrices(n,edges,b):
+	b = np.atleast_2d(b)
+	B = np.zeros([b.shape[0],n,n],dtype=np.result_type(b,float))
+	rows = [e[0] for e in edges]
+	cols = [e[1] for e in edges]
+	B[:,rows,cols] = b
+	B[:,cols,rows] = b
+	return B
+
+#Input: The number of buses n and the list of edges.
+#Output: The degrees of f_1,...,f_{n-1},g_1,...,g_{n-1}.
+#f_i is linear when the only neighbour of bus i is the reference bus 0.
+def equation_degrees(n,edges):
+	neighbours = [set() for i in range(n)]
+	for i, j in edges:
+		neighbours[i].add(j)
+		neighbours[j].add(i)
+	return [1 if neighbours[i] <= set([0]) else 2 for i in range(1,n)]+[2]*(n-1)
+
+#Input: Points z of shape (M,2n-2), ordered (x_1,...,x_{n-1},y_1,...,y_{n-1}), and the susceptance matrices B of shape (M,n,n).
+#Output: F(z) of shape (M,2n-2) and its Jacobian of shape (M,2n-2,2n-2).
+def _system(z,B):
+	M, N = z.shape
+	m = N//2
+	X = np.concatenate([np.ones([M,1]),z[:,:m]],axis=1)
+	Y = np.concatenate([np.zeros([M,1]),z[:,m:]],axis=1)
+	BX = np.einsum('kij,kj->ki',B,X)[:,1:]
+	BY = np.einsum('kij,kj->ki',B,Y)[:,1:]
+	x, y = z[:,:m], z[:,m:]
+	Bs = B[:,1:,1:]
+
+	F = np.concatenate([y*BX-x*BY,x**2+y**2-1],axis=1)
+
+	J = np.zeros([M,N,N],dtype=complex)
+	diag = np.arange(m)
+	J[:,:m,:m] = y[:,:,None]*Bs
+	J[:,:m,m:] = -x[:,:,None]*Bs
+	J[:,diag,diag] -= BY
+	J[:,diag,m+diag] += BX
+	J[:,m+diag,diag] = 2*x
+	J[:,m+diag,m+diag] = 2*y
+	return F, J
+
+#Input: Points z of shape (M,N), the degrees d of the start system.
+#Output: G(z) and its (diagonal) Jacobian.
+def _start_system(z,d):
+	G = z**d-1
+	JG = np.zeros(z.shape+(z.shape[1],),dtype=complex)
+	diag = np.arange(z.shape[1])
+	JG[:,diag,diag] = d*z**(d-1)
+	return G, JG
+
+#Solves the stacked linear systems J*dz = r.
+#If some of the matrices are singular, the systems are solved one at a time in the least squares sense.
+def _solve(J,r):
+	try:
+		return np.linalg.solve(J,r[:,:,None])[:,:,0]
+	except np.linalg.LinAlgError:
+		return np.array([np.linalg.lstsq(J[k],r[k],rcond=None)[0] for k in range(J.shape[0])])
+
+#Output: The homotopy H(z,t), its derivative with respect to z, and the tangent dz/dt.
+def _homotopy(z,t,B,d,gamma):
+	F, JF = _system(z,B)
+	G, JG = _start_system(z,d)
+	s = t[:,None]
+	H = (1-s)*F+gamma*s*G
+	Hz = (1-s)[:,:,None]*JF+gamma*s[:,:,None]*JG
+	dz = -_solve(Hz,gamma*G-F)
+	return H, Hz, dz
+
+#Output: The start points of the total degree homotopy, an array of shape (prod(d),N).
+def start_points(d):
+	roots = [np.exp(2j*np.pi*np.arange(k)/k) for k in d]
+	return np.array(list(itertools.product(*roots)))
+
+#Tracks the stacked paths z from t = 1 to t = 0.
+#Output: The endpoints, and a boolean array which is False for paths that diverged or failed.
+def track(z,B,d,gamma):
+	M = z.shape[0]
+	t = np.ones(M)
+	h = np.full(M,0.05)
+	ok = np.ones(M,dtype=bool)
+	active = np.ones(M,dtype=bool)
+	while active.any():
+		idx = np.nonzero(active)[0]
+		z0, t0, B0 = z[idx], t[idx], B[idx]
+		h0 = np.minimum(h[idx],t0)
+
+		#Runge-Kutta predictor for dz/dt, going from t0 to t0-h0
+		step = -h0[:,None]
+		k1 = _homotopy(z0,t0,B0,d,gamma)[2]
+		k2 = _homotopy(z0+0.5*step*k1,t0-0.5*h0,B0,d,gamma)[2]
+		k3 = _homotopy(z0+0.5*step*k2,t0-0.5*h0,B0,d,gamma)[2]
+		k4 = _homotopy(z0+step*k3,t0-h0,B0,d,gamma)[2]
+		z1 = z0+step*(k1+2*k2+2*k3+k4)/6
+		t1 = t0-h0
+
+		#Newton corrector at t1
+		for it in range(3):
+			H, Hz = _homotopy(z1,t1,B0,d,gamma)[:2]
+			update = _solve(Hz,H)
+			z1 = z1-update
+		converged = np.linalg.norm(update,axis=1) <= NEWTON_TOL*(1+np.linalg.norm(z1,axis=1))
+		converged &= np.isfinite(z1).all(axis=1)
+
+		#Accepted steps move on and grow the step size, rejected steps shrink it
+		good = idx[converged]
+		z[good] = z1[converged]
+		t[good] = t1[converged]
+		h[good] = np.minimum(2*h0[converged],0.1)
+		bad = idx[~converged]
+		h[bad] = 0.5*h0[~converged]
+
+		#Paths that reached t = 0, went to infinity or whose step size became too small are finished
+		done = t[idx] <= 0
+		diverged = np.linalg.norm(z[idx],axis=1) > DIVERGE
+		failed = (h[idx] < MIN_STEP) & ~done
+		ok[idx[diverged | failed]] = False
+		active[idx[done | diverged | failed]] = False
+	return z, ok
+
+#Refines the endpoints with Newton's method on F.
+#Output: The refined points and a boolean array marking the nonsingular solutions, those with a small residual
+#and a well conditioned Jacobian.
+def refine(z,B,iterations=3):
+	for it in range(iterations):
+		F, J = _system(z,B)
+		z = z-_solve(J,F)
+	F, J = _system(z,B)
+	solution = np.linalg.norm(F,axis=1) <= RESIDUAL_TOL*(1+np.linalg.norm(z,axis=1))
+	with np.errstate(invalid='ignore',divide='ignore'):
+		solution &= np.linalg.cond(J/np.linalg.norm(J,axis=2)[:,:,None]) <= COND_TOL#A zero row gives nan, which is rejected
+	return z, solution
+
+#Input: An array of points of shape (k,N).
+#Output: The points with (numerical) duplicates removed.
+def _distinct(points,tol=1e-6):
+	keep = []
+	for k in range(points.shape[0]):
+		if all(np.linalg.norm(points[k]-points[j]) > tol*(1+np.linalg.norm(points[k])) for j in keep):
+			keep.append(k)
+	return points[keep]
+
+#Input: The number of buses n, the list of edges and an array b of shape (iters,|E|) of susceptances.
+#Output: A list with, for each instance, an array of shape (number of finite solutions,2n-2)
+#holding its solutions (x_1,...,x_{n-1},y_1,...,y_{n-1}).
+def solve_batch(n,edges,b,gamma=None):
+	b = np.atleast_2d(b)
+	d = np.array(equation_degrees(n,edges))
+	start = start_points(d)
+	P = start.shape[0]
+	if gamma is None:
+		gamma = np.exp(2j*np.pi*np.random.rand())
+	per_chunk = max(1,MAX_PATHS//P)
+
+	solutions = []
+	for s in range(0,b.shape[0],per_chunk):
+		B = susceptance_matrices(n,edges,b[s:s+per_chunk])
+		K = B.shape[0]
+		Bp = np.repeat(B,P,axis=0)#Every path carries the susceptances of its instance
+		z = np.tile(start,(K,1)).astype(complex)
+		z, ok = track(z,Bp,d,gamma)
+		z[~ok] = 0
+		z, finite = refine(z,Bp)
+		finite &= ok
+		for k in range(K):
+			paths = slice(k*P,(k+1)*P)
+			solutions.append(_distinct(z[paths][finite[paths]]))
+	return solutions
+
+#Input: The output of solve_batch and the tolerance for certifying a number is real.
+#Output: An array with the number of real solutions of each instance.
+def count_real(solutions,tol):
+	return np.array([int(np.sum(np.all(np.abs(sols.imag) <= tol,axis=1))) for sols in solutions],dtype=int)
+
+#Output: An array with the number of real solutions of each instance in b.
+def count_real_solutions(n,edges,b,tol):
+	return count_real(solve_batch(n,edges,b),tol)
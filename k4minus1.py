@@ -1,26 +1,216 @@
+#Eliminant of the power flow equations on K4 minus the edge (0,2).
+#The coefficients below are functions of b = [B[0,1],B[0,3],B[1,2],B[1,3],B[2,3]].
+#
+#The eliminant is an even polynomial of degree 8 in one variable t,
+#	c8*t^8 + c6*t^6 + c4*t^4 + c2*t^2 + c0,
+#and each ck is a polynomial in b. Each ck is stored as a table of terms
+#(coefficient, e01, e03, e12, e13, e23), standing for
+#	coefficient * b01^e01 * b03^e03 * b12^e12 * b13^e13 * b23^e23.
+#poly_coeff_batch evaluates all five of them for a whole array of b vectors at once.
+#
+
+import numpy as np
+
+B_EDGES = [(0,1),(0,3),(1,2),(1,3),(2,3)]#The edges whose susceptances make up b, in order
+
+C8_TERMS = (
+	(256,10,6,6,4,2),(-512,11,5,5,4,3),(-512,9,7,5,4,3),(256,12,4,4,4,4),(1024,10,6,4,4,4),(256,8,8,4,4,4),
+	(-512,11,5,3,4,5),(-512,9,7,3,4,5),(256,10,6,2,4,6),
+)
+
+C6_TERMS = (
+	(-128,9,7,7,4,1),(128,10,8,6,2,2),(-128,10,6,6,4,2),(-128,8,8,6,4,2),(128,10,4,6,6,2),(-256,8,6,6,6,2),
+	(128,6,8,6,6,2),(-256,11,7,5,2,3),(-256,9,9,5,2,3),(128,9,7,7,2,3),(512,11,5,5,4,3),(1152,9,7,5,4,3),
+	(512,7,9,5,4,3),(-256,11,3,5,6,3),(256,9,5,5,6,3),(256,7,7,5,6,3),(-256,5,9,5,6,3),(128,12,6,4,2,4),
+	(512,10,8,4,2,4),(128,8,10,4,2,4),(-256,10,6,6,2,4),(-256,8,8,6,2,4),(-256,12,4,4,4,4),(-1536,10,6,4,4,4),
+	(-1536,8,8,4,4,4),(-256,6,10,4,4,4),(128,10,4,6,4,4),(-256,8,6,6,4,4),(128,6,8,6,4,4),(128,12,2,4,6,4),
+	(256,10,4,4,6,4),(-768,8,6,4,6,4),(256,6,8,4,6,4),(128,4,10,4,6,4),(-256,11,7,3,2,5),(-256,9,9,3,2,5),
+	(128,11,5,5,2,5),(512,9,7,5,2,5),(128,7,9,5,2,5),(512,11,5,3,4,5),(1152,9,7,3,4,5),(512,7,9,3,4,5),
+	(-128,11,3,5,4,5),(128,9,5,5,4,5),(128,7,7,5,4,5),(-128,5,9,5,4,5),(-256,11,3,3,6,5),(256,9,5,3,6,5),
+	(256,7,7,3,6,5),(-256,5,9,3,6,5),(128,10,8,2,2,6),(-256,10,6,4,2,6),(-256,8,8,4,2,6),(-128,10,6,2,4,6),
+	(-128,8,8,2,4,6),(128,10,4,4,4,6),(-256,8,6,4,4,6),(128,6,8,4,4,6),(128,10,4,2,6,6),(-256,8,6,2,6,6),
+	(128,6,8,2,6,6),(128,9,7,3,2,7),(-128,9,7,1,4,7),
+)
+
+C4_TERMS = (
+	(16,8,8,8,4,0),(-64,9,9,7,2,1),(128,9,7,7,4,1),(128,7,9,7,4,1),(-64,9,5,7,6,1),(128,7,7,7,6,1),
+	(-64,5,9,7,6,1),(16,10,10,6,0,2),(-32,8,8,8,2,2),(-32,10,6,6,4,2),(-256,8,8,6,4,2),(-32,6,10,6,4,2),
+	(16,10,2,6,8,2),(-64,8,4,6,8,2),(96,6,6,6,8,2),(-64,4,8,6,8,2),(16,2,10,6,8,2),(-32,11,9,5,0,3),
+	(-32,9,11,5,0,3),(-32,9,9,7,0,3),(128,11,7,5,2,3),(320,9,9,5,2,3),(128,7,11,5,2,3),(-96,9,7,7,2,3),
+	(-96,7,9,7,2,3),(-192,11,5,5,4,3),(-448,9,7,5,4,3),(-448,7,9,5,4,3),(-192,5,11,5,4,3),(128,11,3,5,6,3),
+	(64,9,5,5,6,3),(-384,7,7,5,6,3),(64,5,9,5,6,3),(128,3,11,5,6,3),(-32,11,1,5,8,3),(96,9,3,5,8,3),
+	(-64,7,5,5,8,3),(-64,5,7,5,8,3),(96,3,9,5,8,3),(-32,1,11,5,8,3),(16,12,8,4,0,4),(64,10,10,4,0,4),
+	(16,8,12,4,0,4),(64,10,8,6,0,4),(64,8,10,6,0,4),(16,8,8,8,0,4),(-64,12,6,4,2,4),(-448,10,8,4,2,4),
+	(-448,8,10,4,2,4),(-64,6,12,4,2,4),(288,10,6,6,2,4),(480,8,8,6,2,4),(288,6,10,6,2,4),(96,12,4,4,4,4),
+	(704,10,6,4,4,4),(1056,8,8,4,4,4),(704,6,10,4,4,4),(96,4,12,4,4,4),(-192,10,4,6,4,4),(192,8,6,6,4,4),
+	(192,6,8,6,4,4),(-192,4,10,6,4,4),(-64,12,2,4,6,4),(-320,10,4,4,6,4),(384,8,6,4,6,4),(384,6,8,4,6,4),
+	(-320,4,10,4,6,4),(-64,2,12,4,6,4),(-32,10,2,6,6,4),(128,8,4,6,6,4),(-192,6,6,6,6,4),(128,4,8,6,6,4),
+	(-32,2,10,6,6,4),(16,12,0,4,8,4),(-144,8,4,4,8,4),(256,6,6,4,8,4),(-144,4,8,4,8,4),(16,0,12,4,8,4),
+	(-32,11,9,3,0,5),(-32,9,11,3,0,5),(-32,11,7,5,0,5),(-128,9,9,5,0,5),(-32,7,11,5,0,5),(-32,9,7,7,0,5),
+	(-32,7,9,7,0,5),(128,11,7,3,2,5),(320,9,9,3,2,5),(128,7,11,3,2,5),(-160,11,5,5,2,5),(-672,9,7,5,2,5),
+	(-672,7,9,5,2,5),(-160,5,11,5,2,5),(64,9,5,7,2,5),(-128,7,7,7,2,5),(64,5,9,7,2,5),(-192,11,5,3,4,5),
+	(-448,9,7,3,4,5),(-448,7,9,3,4,5),(-192,5,11,3,4,5),(160,11,3,5,4,5),(128,9,5,5,4,5),(-576,7,7,5,4,5),
+	(128,5,9,5,4,5),(160,3,11,5,4,5),(128,11,3,3,6,5),(64,9,5,3,6,5),(-384,7,7,3,6,5),(64,5,9,3,6,5),
+	(128,3,11,3,6,5),(32,11,1,5,6,5),(-96,9,3,5,6,5),(64,7,5,5,6,5),(64,5,7,5,6,5),(-96,3,9,5,6,5),
+	(32,1,11,5,6,5),(-32,11,1,3,8,5),(96,9,3,3,8,5),(-64,7,5,3,8,5),(-64,5,7,3,8,5),(96,3,9,3,8,5),
+	(-32,1,11,3,8,5),(16,10,10,2,0,6),(64,10,8,4,0,6),(64,8,10,4,0,6),(16,10,6,6,0,6),(64,8,8,6,0,6),
+	(16,6,10,6,0,6),(288,10,6,4,2,6),(480,8,8,4,2,6),(288,6,10,4,2,6),(-64,10,4,6,2,6),(64,8,6,6,2,6),
+	(64,6,8,6,2,6),(-64,4,10,6,2,6),(-32,10,6,2,4,6),(-256,8,8,2,4,6),(-32,6,10,2,4,6),(-192,10,4,4,4,6),
+	(192,8,6,4,4,6),(192,6,8,4,4,6),(-192,4,10,4,4,6),(16,10,2,6,4,6),(-64,8,4,6,4,6),(96,6,6,6,4,6),
+	(-64,4,8,6,4,6),(16,2,10,6,4,6),(-32,10,2,4,6,6),(128,8,4,4,6,6),(-192,6,6,4,6,6),(128,4,8,4,6,6),
+	(-32,2,10,4,6,6),(16,10,2,2,8,6),(-64,8,4,2,8,6),(96,6,6,2,8,6),(-64,4,8,2,8,6),(16,2,10,2,8,6),
+	(-32,9,9,3,0,7),(-32,9,7,5,0,7),(-32,7,9,5,0,7),(-64,9,9,1,2,7),(-96,9,7,3,2,7),(-96,7,9,3,2,7),
+	(64,9,5,5,2,7),(-128,7,7,5,2,7),(64,5,9,5,2,7),(128,9,7,1,4,7),(128,7,9,1,4,7),(-64,9,5,1,6,7),
+	(128,7,7,1,6,7),(-64,5,9,1,6,7),(16,8,8,4,0,8),(-32,8,8,2,2,8),(16,8,8,0,4,8),
+)
+
+C2_TERMS = (
+	(8,8,10,8,2,0),(-16,8,8,8,4,0),(-16,6,10,8,4,0),(8,8,6,8,6,0),(-16,6,8,8,6,0),(8,4,10,8,6,0),
+	(-8,9,11,7,0,1),(32,9,9,7,2,1),(32,7,11,7,2,1),(-48,9,7,7,4,1),(-32,7,9,7,4,1),(-48,5,11,7,4,1),
+	(32,9,5,7,6,1),(-32,7,7,7,6,1),(-32,5,9,7,6,1),(32,3,11,7,6,1),(-8,9,3,7,8,1),(32,7,5,7,8,1),
+	(-48,5,7,7,8,1),(32,3,9,7,8,1),(-8,1,11,7,8,1),(8,10,10,6,0,2),(8,8,12,6,0,2),(8,8,10,8,0,2),
+	(-32,10,8,6,2,2),(-96,8,10,6,2,2),(-32,6,12,6,2,2),(32,8,8,8,2,2),(32,6,10,8,2,2),(48,10,6,6,4,2),
+	(144,8,8,6,4,2),(144,6,10,6,4,2),(48,4,12,6,4,2),(-8,8,6,8,4,2),(16,6,8,8,4,2),(-8,4,10,8,4,2),
+	(-32,10,4,6,6,2),(-32,8,6,6,6,2),(128,6,8,6,6,2),(-32,4,10,6,6,2),(-32,2,12,6,6,2),(8,10,2,6,8,2),
+	(-24,8,4,6,8,2),(16,6,6,6,8,2),(16,4,8,6,8,2),(-24,2,10,6,8,2),(8,0,12,6,8,2),(8,9,11,5,0,3),
+	(8,9,9,7,0,3),(8,7,11,7,0,3),(-32,9,9,5,2,3),(-32,7,11,5,2,3),(-56,9,7,7,2,3),(112,7,9,7,2,3),
+	(-56,5,11,7,2,3),(48,9,7,5,4,3),(32,7,9,5,4,3),(48,5,11,5,4,3),(24,9,5,7,4,3),(-24,7,7,7,4,3),
+	(-24,5,9,7,4,3),(24,3,11,7,4,3),(-32,9,5,5,6,3),(32,7,7,5,6,3),(32,5,9,5,6,3),(-32,3,11,5,6,3),
+	(24,9,3,7,6,3),(-96,7,5,7,6,3),(144,5,7,7,6,3),(-96,3,9,7,6,3),(24,1,11,7,6,3),(8,9,3,5,8,3),
+	(-32,7,5,5,8,3),(48,5,7,5,8,3),(-32,3,9,5,8,3),(8,1,11,5,8,3),(-16,10,10,4,0,4),(-16,8,12,4,0,4),
+	(-16,10,8,6,0,4),(-104,8,10,6,0,4),(-16,6,12,6,0,4),(-16,8,8,8,0,4),(-16,6,10,8,0,4),(64,10,8,4,2,4),
+	(176,8,10,4,2,4),(64,6,12,4,2,4),(16,10,6,6,2,4),(-304,8,8,6,2,4),(-304,6,10,6,2,4),(16,4,12,6,2,4),
+	(-8,8,6,8,2,4),(16,6,8,8,2,4),(-8,4,10,8,2,4),(-96,10,6,4,4,4),(-256,8,8,4,4,4),(-256,6,10,4,4,4),
+	(-96,4,12,4,4,4),(16,10,4,6,4,4),(200,8,6,6,4,4),(-432,6,8,6,4,4),(200,4,10,6,4,4),(16,2,12,6,4,4),
+	(64,10,4,4,6,4),(48,8,6,4,6,4),(-224,6,8,4,6,4),(48,4,10,4,6,4),(64,2,12,4,6,4),(-16,10,2,6,6,4),
+	(48,8,4,6,6,4),(-32,6,6,6,6,4),(-32,4,8,6,6,4),(48,2,10,6,6,4),(-16,0,12,6,6,4),(-16,10,2,4,8,4),
+	(48,8,4,4,8,4),(-32,6,6,4,8,4),(-32,4,8,4,8,4),(48,2,10,4,8,4),(-16,0,12,4,8,4),(8,9,11,3,0,5),
+	(112,9,9,5,0,5),(112,7,11,5,0,5),(8,9,7,7,0,5),(112,7,9,7,0,5),(8,5,11,7,0,5),(-32,9,9,3,2,5),
+	(-32,7,11,3,2,5),(176,9,7,5,2,5),(672,7,9,5,2,5),(176,5,11,5,2,5),(-48,9,5,7,2,5),(48,7,7,7,2,5),
+	(48,5,9,7,2,5),(-48,3,11,7,2,5),(48,9,7,3,4,5),(32,7,9,3,4,5),(48,5,11,3,4,5),(-304,9,5,5,4,5),
+	(304,7,7,5,4,5),(304,5,9,5,4,5),(-304,3,11,5,4,5),(-24,9,3,7,4,5),(96,7,5,7,4,5),(-144,5,7,7,4,5),
+	(96,3,9,7,4,5),(-24,1,11,7,4,5),(-32,9,5,3,6,5),(32,7,7,3,6,5),(32,5,9,3,6,5),(-32,3,11,3,6,5),
+	(16,9,3,5,6,5),(-64,7,5,5,6,5),(96,5,7,5,6,5),(-64,3,9,5,6,5),(16,1,11,5,6,5),(8,9,3,3,8,5),
+	(-32,7,5,3,8,5),(48,5,7,3,8,5),(-32,3,9,3,8,5),(8,1,11,3,8,5),(8,10,10,2,0,6),(8,8,12,2,0,6),
+	(-16,10,8,4,0,6),(-104,8,10,4,0,6),(-16,6,12,4,0,6),(8,10,6,6,0,6),(-104,8,8,6,0,6),(-104,6,10,6,0,6),
+	(8,4,12,6,0,6),(8,8,6,8,0,6),(-16,6,8,8,0,6),(8,4,10,8,0,6),(-32,10,8,2,2,6),(-96,8,10,2,2,6),
+	(-32,6,12,2,2,6),(16,10,6,4,2,6),(-304,8,8,4,2,6),(-304,6,10,4,2,6),(16,4,12,4,2,6),(48,10,4,6,2,6),
+	(16,8,6,6,2,6),(-128,6,8,6,2,6),(16,4,10,6,2,6),(48,2,12,6,2,6),(48,10,6,2,4,6),(144,8,8,2,4,6),
+	(144,6,10,2,4,6),(48,4,12,2,4,6),(16,10,4,4,4,6),(200,8,6,4,4,6),(-432,6,8,4,4,6),(200,4,10,4,4,6),
+	(16,2,12,4,4,6),(8,10,2,6,4,6),(-24,8,4,6,4,6),(16,6,6,6,4,6),(16,4,8,6,4,6),(-24,2,10,6,4,6),
+	(8,0,12,6,4,6),(-32,10,4,2,6,6),(-32,8,6,2,6,6),(128,6,8,2,6,6),(-32,4,10,2,6,6),(-32,2,12,2,6,6),
+	(-16,10,2,4,6,6),(48,8,4,4,6,6),(-32,6,6,4,6,6),(-32,4,8,4,6,6),(48,2,10,4,6,6),(-16,0,12,4,6,6),
+	(8,10,2,2,8,6),(-24,8,4,2,8,6),(16,6,6,2,8,6),(16,4,8,2,8,6),(-24,2,10,2,8,6),(8,0,12,2,8,6),
+	(-8,9,11,1,0,7),(8,9,9,3,0,7),(8,7,11,3,0,7),(8,9,7,5,0,7),(112,7,9,5,0,7),(8,5,11,5,0,7),
+	(-8,9,5,7,0,7),(8,7,7,7,0,7),(8,5,9,7,0,7),(-8,3,11,7,0,7),(32,9,9,1,2,7),(32,7,11,1,2,7),
+	(-56,9,7,3,2,7),(112,7,9,3,2,7),(-56,5,11,3,2,7),(-48,9,5,5,2,7),(48,7,7,5,2,7),(48,5,9,5,2,7),
+	(-48,3,11,5,2,7),(8,9,3,7,2,7),(-32,7,5,7,2,7),(48,5,7,7,2,7),(-32,3,9,7,2,7),(8,1,11,7,2,7),
+	(-48,9,7,1,4,7),(-32,7,9,1,4,7),(-48,5,11,1,4,7),(24,9,5,3,4,7),(-24,7,7,3,4,7),(-24,5,9,3,4,7),
+	(24,3,11,3,4,7),(-24,9,3,5,4,7),(96,7,5,5,4,7),(-144,5,7,5,4,7),(96,3,9,5,4,7),(-24,1,11,5,4,7),
+	(32,9,5,1,6,7),(-32,7,7,1,6,7),(-32,5,9,1,6,7),(32,3,11,1,6,7),(24,9,3,3,6,7),(-96,7,5,3,6,7),
+	(144,5,7,3,6,7),(-96,3,9,3,6,7),(24,1,11,3,6,7),(-8,9,3,1,8,7),(32,7,5,1,8,7),(-48,5,7,1,8,7),
+	(32,3,9,1,8,7),(-8,1,11,1,8,7),(8,8,10,2,0,8),(-16,8,8,4,0,8),(-16,6,10,4,0,8),(8,8,6,6,0,8),
+	(-16,6,8,6,0,8),(8,4,10,6,0,8),(8,8,10,0,2,8),(32,8,8,2,2,8),(32,6,10,2,2,8),(-8,8,6,4,2,8),
+	(16,6,8,4,2,8),(-8,4,10,4,2,8),(-16,8,8,0,4,8),(-16,6,10,0,4,8),(-8,8,6,2,4,8),(16,6,8,2,4,8),
+	(-8,4,10,2,4,8),(8,8,6,0,6,8),(-16,6,8,0,6,8),(8,4,10,0,6,8),
+)
+
+C0_TERMS = (
+	(1,8,12,8,0,0),(-4,8,10,8,2,0),(-4,6,12,8,2,0),(6,8,8,8,4,0),(4,6,10,8,4,0),(6,4,12,8,4,0),
+	(-4,8,6,8,6,0),(4,6,8,8,6,0),(4,4,10,8,6,0),(-4,2,12,8,6,0),(1,8,4,8,8,0),(-4,6,6,8,8,0),
+	(6,4,8,8,8,0),(-4,2,10,8,8,0),(1,0,12,8,8,0),(-4,8,12,6,0,2),(-4,8,10,8,0,2),(-4,6,12,8,0,2),
+	(16,8,10,6,2,2),(16,6,12,6,2,2),(4,8,8,8,2,2),(-40,6,10,8,2,2),(4,4,12,8,2,2),(-24,8,8,6,4,2),
+	(-16,6,10,6,4,2),(-24,4,12,6,4,2),(4,8,6,8,4,2),(-4,6,8,8,4,2),(-4,4,10,8,4,2),(4,2,12,8,4,2),
+	(16,8,6,6,6,2),(-16,6,8,6,6,2),(-16,4,10,6,6,2),(16,2,12,6,6,2),(-4,8,4,8,6,2),(16,6,6,8,6,2),
+	(-24,4,8,8,6,2),(16,2,10,8,6,2),(-4,0,12,8,6,2),(-4,8,4,6,8,2),(16,6,6,6,8,2),(-24,4,8,6,8,2),
+	(16,2,10,6,8,2),(-4,0,12,6,8,2),(16,7,11,7,0,3),(32,7,9,7,2,3),(32,5,11,7,2,3),(-48,7,7,7,4,3),
+	(96,5,9,7,4,3),(-48,3,11,7,4,3),(6,8,12,4,0,4),(4,8,10,6,0,4),(4,6,12,6,0,4),(6,8,8,8,0,4),
+	(4,6,10,8,0,4),(6,4,12,8,0,4),(-24,8,10,4,2,4),(-24,6,12,4,2,4),(-4,8,8,6,2,4),(40,6,10,6,2,4),
+	(-4,4,12,6,2,4),(4,8,6,8,2,4),(-4,6,8,8,2,4),(-4,4,10,8,2,4),(4,2,12,8,2,4),(36,8,8,4,4,4),
+	(24,6,10,4,4,4),(36,4,12,4,4,4),(-4,8,6,6,4,4),(4,6,8,6,4,4),(4,4,10,6,4,4),(-4,2,12,6,4,4),
+	(6,8,4,8,4,4),(-24,6,6,8,4,4),(36,4,8,8,4,4),(-24,2,10,8,4,4),(6,0,12,8,4,4),(-24,8,6,4,6,4),
+	(24,6,8,4,6,4),(24,4,10,4,6,4),(-24,2,12,4,6,4),(4,8,4,6,6,4),(-16,6,6,6,6,4),(24,4,8,6,6,4),
+	(-16,2,10,6,6,4),(4,0,12,6,6,4),(6,8,4,4,8,4),(-24,6,6,4,8,4),(36,4,8,4,8,4),(-24,2,10,4,8,4),
+	(6,0,12,4,8,4),(-32,7,11,5,0,5),(-32,7,9,7,0,5),(-32,5,11,7,0,5),(-64,7,9,5,2,5),(-64,5,11,5,2,5),
+	(32,7,7,7,2,5),(-64,5,9,7,2,5),(32,3,11,7,2,5),(96,7,7,5,4,5),(-192,5,9,5,4,5),(96,3,11,5,4,5),
+	(-4,8,12,2,0,6),(4,8,10,4,0,6),(4,6,12,4,0,6),(4,8,8,6,0,6),(88,6,10,6,0,6),(4,4,12,6,0,6),
+	(-4,8,6,8,0,6),(4,6,8,8,0,6),(4,4,10,8,0,6),(-4,2,12,8,0,6),(16,8,10,2,2,6),(16,6,12,2,2,6),
+	(-4,8,8,4,2,6),(40,6,10,4,2,6),(-4,4,12,4,2,6),(-40,8,6,6,2,6),(40,6,8,6,2,6),(40,4,10,6,2,6),
+	(-40,2,12,6,2,6),(-4,8,4,8,2,6),(16,6,6,8,2,6),(-24,4,8,8,2,6),(16,2,10,8,2,6),(-4,0,12,8,2,6),
+	(-24,8,8,2,4,6),(-16,6,10,2,4,6),(-24,4,12,2,4,6),(-4,8,6,4,4,6),(4,6,8,4,4,6),(4,4,10,4,4,6),
+	(-4,2,12,4,4,6),(4,8,4,6,4,6),(-16,6,6,6,4,6),(24,4,8,6,4,6),(-16,2,10,6,4,6),(4,0,12,6,4,6),
+	(16,8,6,2,6,6),(-16,6,8,2,6,6),(-16,4,10,2,6,6),(16,2,12,2,6,6),(4,8,4,4,6,6),(-16,6,6,4,6,6),
+	(24,4,8,4,6,6),(-16,2,10,4,6,6),(4,0,12,4,6,6),(-4,8,4,2,8,6),(16,6,6,2,8,6),(-24,4,8,2,8,6),
+	(16,2,10,2,8,6),(-4,0,12,2,8,6),(16,7,11,3,0,7),(-32,7,9,5,0,7),(-32,5,11,5,0,7),(16,7,7,7,0,7),
+	(-32,5,9,7,0,7),(16,3,11,7,0,7),(32,7,9,3,2,7),(32,5,11,3,2,7),(32,7,7,5,2,7),(-64,5,9,5,2,7),
+	(32,3,11,5,2,7),(-48,7,7,3,4,7),(96,5,9,3,4,7),(-48,3,11,3,4,7),(1,8,12,0,0,8),(-4,8,10,2,0,8),
+	(-4,6,12,2,0,8),(6,8,8,4,0,8),(4,6,10,4,0,8),(6,4,12,4,0,8),(-4,8,6,6,0,8),(4,6,8,6,0,8),
+	(4,4,10,6,0,8),(-4,2,12,6,0,8),(1,8,4,8,0,8),(-4,6,6,8,0,8),(6,4,8,8,0,8),(-4,2,10,8,0,8),
+	(1,0,12,8,0,8),(-4,8,10,0,2,8),(-4,6,12,0,2,8),(4,8,8,2,2,8),(-40,6,10,2,2,8),(4,4,12,2,2,8),
+	(4,8,6,4,2,8),(-4,6,8,4,2,8),(-4,4,10,4,2,8),(4,2,12,4,2,8),(-4,8,4,6,2,8),(16,6,6,6,2,8),
+	(-24,4,8,6,2,8),(16,2,10,6,2,8),(-4,0,12,6,2,8),(6,8,8,0,4,8),(4,6,10,0,4,8),(6,4,12,0,4,8),
+	(4,8,6,2,4,8),(-4,6,8,2,4,8),(-4,4,10,2,4,8),(4,2,12,2,4,8),(6,8,4,4,4,8),(-24,6,6,4,4,8),
+	(36,4,8,4,4,8),(-24,2,10,4,4,8),(6,0,12,4,4,8),(-4,8,6,0,6,8),(4,6,8,0,6,8),(4,4,10,0,6,8),
+	(-4,2,12,0,6,8),(-4,8,4,2,6,8),(16,6,6,2,6,8),(-24,4,8,2,6,8),(16,2,10,2,6,8),(-4,0,12,2,6,8),
+	(1,8,4,0,8,8),(-4,6,6,0,8,8),(6,4,8,0,8,8),(-4,2,10,0,8,8),(1,0,12,0,8,8),
+)
+
+#All terms stacked into arrays, together with the index (0 for c8, ..., 4 for c0) of the coefficient each term belongs to.
+_TABLES = [C8_TERMS,C6_TERMS,C4_TERMS,C2_TERMS,C0_TERMS]
+_COEFF = np.array([t[0] for table in _TABLES for t in table],dtype=float)
+_EXPONENTS = np.array([t[1:] for table in _TABLES for t in table],dtype=int)
+_SLOT = np.array([k for k, table in enumerate(_TABLES) for t in table],dtype=int)
+_MAX_EXP = _EXPONENTS.max()
+
+#_WEIGHTS[k,t] is the coefficient of term t in the k-th eliminant coefficient, so that
+#the coefficients are a single matrix product with the monomial values.
+_WEIGHTS = np.zeros([len(_TABLES),len(_COEFF)])
+_WEIGHTS[_SLOT,np.arange(len(_COEFF))] = _COEFF
+
+CHUNK_SIZE = 1024 #Number of instances evaluated at a time, this bounds the size of the monomial array
+
+#Input: An array b of shape (iters,5), one row [b01,b03,b12,b13,b23] per instance.
+#Output: An array of shape (iters,5) with the columns c8,c6,c4,c2,c0.
+def eliminant_coeffs(b):
+	b = np.atleast_2d(np.asarray(b,dtype=float))
+	iters = b.shape[0]
+	coeffs = np.zeros([iters,len(_TABLES)])
+	for start in range(0,iters,CHUNK_SIZE):
+		chunk = b[start:start+CHUNK_SIZE]
+		#powers[e,k,j] = chunk[k,j]**e
+		powers = np.ones([_MAX_EXP+1]+list(chunk.shape))
+		for e in range(1,_MAX_EXP+1):
+			powers[e] = powers[e-1]*chunk
+		#monomials[t,k] is the value of term t on instance k
+		monomials = powers[_EXPONENTS[:,0],:,0]
+		for j in range(1,chunk.shape[1]):
+			monomials = monomials*powers[_EXPONENTS[:,j],:,j]
+		coeffs[start:start+CHUNK_SIZE] = _WEIGHTS.dot(monomials).T
+	return coeffs
+
+#Input: An array b of shape (iters,5).
+#Output: An array of shape (iters,9) with the coefficients of the eliminant in t, highest degree first.
+def poly_coeff_batch(b):
+	coeffs = eliminant_coeffs(b)
+	full = np.zeros([coeffs.shape[0],9])
+	full[:,0::2] = coeffs
+	return full
+
+#The single-instance versions, for code that evaluates one b vector at a time.
 def c8(b):
-	b01,b03,b12,b13,b23 = b
-	return 256*b01**10*b03**6*b12**6*b13**4*b23**2 - 512*b01**11*b03**5*b12**5*b13**4*b23**3 - 512*b01**9*b03**7*b12**5*b13**4*b23**3 + 256*b01**12*b03**4*b12**4*b13**4*b23**4 + 1024*b01**10*b03**6*b12**4*b13**4*b23**4 + 256*b01**8*b03**8*b12**4*b13**4*b23**4 - 512*b01**11*b03**5*b12**3*b13**4*b23**5 - 512*b01**9*b03**7*b12**3*b13**4*b23**5 + 256*b01**10*b03**6*b12**2*b13**4*b23**6
+	return eliminant_coeffs(b)[0,0]
 
 def c6(b):
-	b01,b03,b12,b13,b23 = b
-	return -128*b01**9*b03**7*b12**7*b13**4*b23 + 128*b01**10*b03**8*b12**6*b13**2*b23**2 - 128*b01**10*b03**6*b12**6*b13**4*b23**2 - 128*b01**8*b03**8*b12**6*b13**4*b23**2 + 128*b01**10*b03**4*b12**6*b13**6*b23**2 - 256*b01**8*b03**6*b12**6*b13**6*b23**2 + 128*b01**6*b03**8*b12**6*b13**6*b23**2 - 256*b01**11*b03**7*b12**5*b13**2*b23**3 - 256*b01**9*b03**9*b12**5*b13**2*b23**3 + 128*b01**9*b03**7*b12**7*b13**2*b23**3 + 512*b01**11*b03**5*b12**5*b13**4*b23**3 + 1152*b01**9*b03**7*b12**5*b13**4*b23**3 + 512*b01**7*b03**9*b12**5*b13**4*b23**3 - 256*b01**11*b03**3*b12**5*b13**6*b23**3 + 256*b01**9*b03**5*b12**5*b13**6*b23**3 + 256*b01**7*b03**7*b12**5*b13**6*b23**3 - 256*b01**5*b03**9*b12**5*b13**6*b23**3 + 128*b01**12*b03**6*b12**4*b13**2*b23**4 + 512*b01**10*b03**8*b12**4*b13**2*b23**4 + 128*b01**8*b03**10*b12**4*b13**2*b23**4 - 256*b01**10*b03**6*b12**6*b13**2*b23**4 - 256*b01**8*b03**8*b12**6*b13**2*b23**4 - 256*b01**12*b03**4*b12**4*b13**4*b23**4 - 1536*b01**10*b03**6*b12**4*b13**4*b23**4 - 1536*b01**8*b03**8*b12**4*b13**4*b23**4 - 256*b01**6*b03**10*b12**4*b13**4*b23**4 + 128*b01**10*b03**4*b12**6*b13**4*b23**4 - 256*b01**8*b03**6*b12**6*b13**4*b23**4 + 128*b01**6*b03**8*b12**6*b13**4*b23**4 + 128*b01**12*b03**2*b12**4*b13**6*b23**4 + 256*b01**10*b03**4*b12**4*b13**6*b23**4 - 768*b01**8*b03**6*b12**4*b13**6*b23**4 + 256*b01**6*b03**8*b12**4*b13**6*b23**4 + 128*b01**4*b03**10*b12**4*b13**6*b23**4 - 256*b01**11*b03**7*b12**3*b13**2*b23**5 - 256*b01**9*b03**9*b12**3*b13**2*b23**5 + 128*b01**11*b03**5*b12**5*b13**2*b23**5 + 512*b01**9*b03**7*b12**5*b13**2*b23**5 + 128*b01**7*b03**9*b12**5*b13**2*b23**5 + 512*b01**11*b03**5*b12**3*b13**4*b23**5 + 1152*b01**9*b03**7*b12**3*b13**4*b23**5 + 512*b01**7*b03**9*b12**3*b13**4*b23**5 - 128*b01**11*b03**3*b12**5*b13**4*b23**5 + 128*b01**9*b03**5*b12**5*b13**4*b23**5 + 128*b01**7*b03**7*b12**5*b13**4*b23**5 - 128*b01**5*b03**9*b12**5*b13**4*b23**5 - 256*b01**11*b03**3*b12**3*b13**6*b23**5 + 256*b01**9*b03**5*b12**3*b13**6*b23**5 + 256*b01**7*b03**7*b12**3*b13**6*b23**5 - 256*b01**5*b03**9*b12**3*b13**6*b23**5 + 128*b01**10*b03**8*b12**2*b13**2*b23**6 - 256*b01**10*b03**6*b12**4*b13**2*b23**6 - 256*b01**8*b03**8*b12**4*b13**2*b23**6 - 128*b01**10*b03**6*b12**2*b13**4*b23**6 - 128*b01**8*b03**8*b12**2*b13**4*b23**6 + 128*b01**10*b03**4*b12**4*b13**4*b23**6 - 256*b01**8*b03**6*b12**4*b13**4*b23**6 + 128*b01**6*b03**8*b12**4*b13**4*b23**6 + 128*b01**10*b03**4*b12**2*b13**6*b23**6 - 256*b01**8*b03**6*b12**2*b13**6*b23**6 + 128*b01**6*b03**8*b12**2*b13**6*b23**6 + 128*b01**9*b03**7*b12**3*b13**2*b23**7 - 128*b01**9*b03**7*b12*b13**4*b23**7
+	return eliminant_coeffs(b)[0,1]
 
 def c4(b):
-	b01,b03,b12,b13,b23 = b
-	return 16*b01**8*b03**8*b12**8*b13**4 - 64*b01**9*b03**9*b12**7*b13**2*b23 + 128*b01**9*b03**7*b12**7*b13**4*b23 + 128*b01**7*b03**9*b12**7*b13**4*b23 - 64*b01**9*b03**5*b12**7*b13**6*b23 + 128*b01**7*b03**7*b12**7*b13**6*b23 - 64*b01**5*b03**9*b12**7*b13**6*b23 + 16*b01**10*b03**10*b12**6*b23**2 - 32*b01**8*b03**8*b12**8*b13**2*b23**2 - 32*b01**10*b03**6*b12**6*b13**4*b23**2 - 256*b01**8*b03**8*b12**6*b13**4*b23**2 - 32*b01**6*b03**10*b12**6*b13**4*b23**2 + 16*b01**10*b03**2*b12**6*b13**8*b23**2 - 64*b01**8*b03**4*b12**6*b13**8*b23**2 + 96*b01**6*b03**6*b12**6*b13**8*b23**2 - 64*b01**4*b03**8*b12**6*b13**8*b23**2 + 16*b01**2*b03**10*b12**6*b13**8*b23**2 - 32*b01**11*b03**9*b12**5*b23**3 - 32*b01**9*b03**11*b12**5*b23**3 - 32*b01**9*b03**9*b12**7*b23**3 + 128*b01**11*b03**7*b12**5*b13**2*b23**3 + 320*b01**9*b03**9*b12**5*b13**2*b23**3 + 128*b01**7*b03**11*b12**5*b13**2*b23**3 - 96*b01**9*b03**7*b12**7*b13**2*b23**3 - 96*b01**7*b03**9*b12**7*b13**2*b23**3 - 192*b01**11*b03**5*b12**5*b13**4*b23**3 - 448*b01**9*b03**7*b12**5*b13**4*b23**3 - 448*b01**7*b03**9*b12**5*b13**4*b23**3 - 192*b01**5*b03**11*b12**5*b13**4*b23**3 + 128*b01**11*b03**3*b12**5*b13**6*b23**3 + 64*b01**9*b03**5*b12**5*b13**6*b23**3 - 384*b01**7*b03**7*b12**5*b13**6*b23**3 + 64*b01**5*b03**9*b12**5*b13**6*b23**3 + 128*b01**3*b03**11*b12**5*b13**6*b23**3 - 32*b01**11*b03*b12**5*b13**8*b23**3 + 96*b01**9*b03**3*b12**5*b13**8*b23**3 - 64*b01**7*b03**5*b12**5*b13**8*b23**3 - 64*b01**5*b03**7*b12**5*b13**8*b23**3 + 96*b01**3*b03**9*b12**5*b13**8*b23**3 - 32*b01*b03**11*b12**5*b13**8*b23**3 + 16*b01**12*b03**8*b12**4*b23**4 + 64*b01**10*b03**10*b12**4*b23**4 + 16*b01**8*b03**12*b12**4*b23**4 + 64*b01**10*b03**8*b12**6*b23**4 + 64*b01**8*b03**10*b12**6*b23**4 + 16*b01**8*b03**8*b12**8*b23**4 - 64*b01**12*b03**6*b12**4*b13**2*b23**4 - 448*b01**10*b03**8*b12**4*b13**2*b23**4 - 448*b01**8*b03**10*b12**4*b13**2*b23**4 - 64*b01**6*b03**12*b12**4*b13**2*b23**4 + 288*b01**10*b03**6*b12**6*b13**2*b23**4 + 480*b01**8*b03**8*b12**6*b13**2*b23**4 + 288*b01**6*b03**10*b12**6*b13**2*b23**4 + 96*b01**12*b03**4*b12**4*b13**4*b23**4 + 704*b01**10*b03**6*b12**4*b13**4*b23**4 + 1056*b01**8*b03**8*b12**4*b13**4*b23**4 + 704*b01**6*b03**10*b12**4*b13**4*b23**4 + 96*b01**4*b03**12*b12**4*b13**4*b23**4 - 192*b01**10*b03**4*b12**6*b13**4*b23**4 + 192*b01**8*b03**6*b12**6*b13**4*b23**4 + 192*b01**6*b03**8*b12**6*b13**4*b23**4 - 192*b01**4*b03**10*b12**6*b13**4*b23**4 - 64*b01**12*b03**2*b12**4*b13**6*b23**4 - 320*b01**10*b03**4*b12**4*b13**6*b23**4 + 384*b01**8*b03**6*b12**4*b13**6*b23**4 + 384*b01**6*b03**8*b12**4*b13**6*b23**4 - 320*b01**4*b03**10*b12**4*b13**6*b23**4 - 64*b01**2*b03**12*b12**4*b13**6*b23**4 - 32*b01**10*b03**2*b12**6*b13**6*b23**4 + 128*b01**8*b03**4*b12**6*b13**6*b23**4 - 192*b01**6*b03**6*b12**6*b13**6*b23**4 + 128*b01**4*b03**8*b12**6*b13**6*b23**4 - 32*b01**2*b03**10*b12**6*b13**6*b23**4 + 16*b01**12*b12**4*b13**8*b23**4 - 144*b01**8*b03**4*b12**4*b13**8*b23**4 + 256*b01**6*b03**6*b12**4*b13**8*b23**4 - 144*b01**4*b03**8*b12**4*b13**8*b23**4 + 16*b03**12*b12**4*b13**8*b23**4 - 32*b01**11*b03**9*b12**3*b23**5 - 32*b01**9*b03**11*b12**3*b23**5 - 32*b01**11*b03**7*b12**5*b23**5 - 128*b01**9*b03**9*b12**5*b23**5 - 32*b01**7*b03**11*b12**5*b23**5 - 32*b01**9*b03**7*b12**7*b23**5 - 32*b01**7*b03**9*b12**7*b23**5 + 128*b01**11*b03**7*b12**3*b13**2*b23**5 + 320*b01**9*b03**9*b12**3*b13**2*b23**5 + 128*b01**7*b03**11*b12**3*b13**2*b23**5 - 160*b01**11*b03**5*b12**5*b13**2*b23**5 - 672*b01**9*b03**7*b12**5*b13**2*b23**5 - 672*b01**7*b03**9*b12**5*b13**2*b23**5 - 160*b01**5*b03**11*b12**5*b13**2*b23**5 + 64*b01**9*b03**5*b12**7*b13**2*b23**5 - 128*b01**7*b03**7*b12**7*b13**2*b23**5 + 64*b01**5*b03**9*b12**7*b13**2*b23**5 - 192*b01**11*b03**5*b12**3*b13**4*b23**5 - 448*b01**9*b03**7*b12**3*b13**4*b23**5 - 448*b01**7*b03**9*b12**3*b13**4*b23**5 - 192*b01**5*b03**11*b12**3*b13**4*b23**5 + 160*b01**11*b03**3*b12**5*b13**4*b23**5 + 128*b01**9*b03**5*b12**5*b13**4*b23**5 - 576*b01**7*b03**7*b12**5*b13**4*b23**5 + 128*b01**5*b03**9*b12**5*b13**4*b23**5 + 160*b01**3*b03**11*b12**5*b13**4*b23**5 + 128*b01**11*b03**3*b12**3*b13**6*b23**5 + 64*b01**9*b03**5*b12**3*b13**6*b23**5 - 384*b01**7*b03**7*b12**3*b13**6*b23**5 + 64*b01**5*b03**9*b12**3*b13**6*b23**5 + 128*b01**3*b03**11*b12**3*b13**6*b23**5 + 32*b01**11*b03*b12**5*b13**6*b23**5 - 96*b01**9*b03**3*b12**5*b13**6*b23**5 + 64*b01**7*b03**5*b12**5*b13**6*b23**5 + 64*b01**5*b03**7*b12**5*b13**6*b23**5 - 96*b01**3*b03**9*b12**5*b13**6*b23**5 + 32*b01*b03**11*b12**5*b13**6*b23**5 - 32*b01**11*b03*b12**3*b13**8*b23**5 + 96*b01**9*b03**3*b12**3*b13**8*b23**5 - 64*b01**7*b03**5*b12**3*b13**8*b23**5 - 64*b01**5*b03**7*b12**3*b13**8*b23**5 + 96*b01**3*b03**9*b12**3*b13**8*b23**5 - 32*b01*b03**11*b12**3*b13**8*b23**5 + 16*b01**10*b03**10*b12**2*b23**6 + 64*b01**10*b03**8*b12**4*b23**6 + 64*b01**8*b03**10*b12**4*b23**6 + 16*b01**10*b03**6*b12**6*b23**6 + 64*b01**8*b03**8*b12**6*b23**6 + 16*b01**6*b03**10*b12**6*b23**6 + 288*b01**10*b03**6*b12**4*b13**2*b23**6 + 480*b01**8*b03**8*b12**4*b13**2*b23**6 + 288*b01**6*b03**10*b12**4*b13**2*b23**6 - 64*b01**10*b03**4*b12**6*b13**2*b23**6 + 64*b01**8*b03**6*b12**6*b13**2*b23**6 + 64*b01**6*b03**8*b12**6*b13**2*b23**6 - 64*b01**4*b03**10*b12**6*b13**2*b23**6 - 32*b01**10*b03**6*b12**2*b13**4*b23**6 - 256*b01**8*b03**8*b12**2*b13**4*b23**6 - 32*b01**6*b03**10*b12**2*b13**4*b23**6 - 192*b01**10*b03**4*b12**4*b13**4*b23**6 + 192*b01**8*b03**6*b12**4*b13**4*b23**6 + 192*b01**6*b03**8*b12**4*b13**4*b23**6 - 192*b01**4*b03**10*b12**4*b13**4*b23**6 + 16*b01**10*b03**2*b12**6*b13**4*b23**6 - 64*b01**8*b03**4*b12**6*b13**4*b23**6 + 96*b01**6*b03**6*b12**6*b13**4*b23**6 - 64*b01**4*b03**8*b12**6*b13**4*b23**6 + 16*b01**2*b03**10*b12**6*b13**4*b23**6 - 32*b01**10*b03**2*b12**4*b13**6*b23**6 + 128*b01**8*b03**4*b12**4*b13**6*b23**6 - 192*b01**6*b03**6*b12**4*b13**6*b23**6 + 128*b01**4*b03**8*b12**4*b13**6*b23**6 - 32*b01**2*b03**10*b12**4*b13**6*b23**6 + 16*b01**10*b03**2*b12**2*b13**8*b23**6 - 64*b01**8*b03**4*b12**2*b13**8*b23**6 + 96*b01**6*b03**6*b12**2*b13**8*b23**6 - 64*b01**4*b03**8*b12**2*b13**8*b23**6 + 16*b01**2*b03**10*b12**2*b13**8*b23**6 - 32*b01**9*b03**9*b12**3*b23**7 - 32*b01**9*b03**7*b12**5*b23**7 - 32*b01**7*b03**9*b12**5*b23**7 - 64*b01**9*b03**9*b12*b13**2*b23**7 - 96*b01**9*b03**7*b12**3*b13**2*b23**7 - 96*b01**7*b03**9*b12**3*b13**2*b23**7 + 64*b01**9*b03**5*b12**5*b13**2*b23**7 - 128*b01**7*b03**7*b12**5*b13**2*b23**7 + 64*b01**5*b03**9*b12**5*b13**2*b23**7 + 128*b01**9*b03**7*b12*b13**4*b23**7 + 128*b01**7*b03**9*b12*b13**4*b23**7 - 64*b01**9*b03**5*b12*b13**6*b23**7 + 128*b01**7*b03**7*b12*b13**6*b23**7 - 64*b01**5*b03**9*b12*b13**6*b23**7 + 16*b01**8*b03**8*b12**4*b23**8 - 32*b01**8*b03**8*b12**2*b13**2*b23**8 + 16*b01**8*b03**8*b13**4*b23**8
+	return eliminant_coeffs(b)[0,2]
 
 def c2(b):
-	b01,b03,b12,b13,b23 = b
-	return 8*b01**8*b03**10*b12**8*b13**2 - 16*b01**8*b03**8*b12**8*b13**4 - 16*b01**6*b03**10*b12**8*b13**4 + 8*b01**8*b03**6*b12**8*b13**6 - 16*b01**6*b03**8*b12**8*b13**6 + 8*b01**4*b03**10*b12**8*b13**6 - 8*b01**9*b03**11*b12**7*b23 + 32*b01**9*b03**9*b12**7*b13**2*b23 + 32*b01**7*b03**11*b12**7*b13**2*b23 - 48*b01**9*b03**7*b12**7*b13**4*b23 - 32*b01**7*b03**9*b12**7*b13**4*b23 - 48*b01**5*b03**11*b12**7*b13**4*b23 + 32*b01**9*b03**5*b12**7*b13**6*b23 - 32*b01**7*b03**7*b12**7*b13**6*b23 - 32*b01**5*b03**9*b12**7*b13**6*b23 + 32*b01**3*b03**11*b12**7*b13**6*b23 - 8*b01**9*b03**3*b12**7*b13**8*b23 + 32*b01**7*b03**5*b12**7*b13**8*b23 - 48*b01**5*b03**7*b12**7*b13**8*b23 + 32*b01**3*b03**9*b12**7*b13**8*b23 - 8*b01*b03**11*b12**7*b13**8*b23 + 8*b01**10*b03**10*b12**6*b23**2 + 8*b01**8*b03**12*b12**6*b23**2 + 8*b01**8*b03**10*b12**8*b23**2 - 32*b01**10*b03**8*b12**6*b13**2*b23**2 - 96*b01**8*b03**10*b12**6*b13**2*b23**2 - 32*b01**6*b03**12*b12**6*b13**2*b23**2 + 32*b01**8*b03**8*b12**8*b13**2*b23**2 + 32*b01**6*b03**10*b12**8*b13**2*b23**2 + 48*b01**10*b03**6*b12**6*b13**4*b23**2 + 144*b01**8*b03**8*b12**6*b13**4*b23**2 + 144*b01**6*b03**10*b12**6*b13**4*b23**2 + 48*b01**4*b03**12*b12**6*b13**4*b23**2 - 8*b01**8*b03**6*b12**8*b13**4*b23**2 + 16*b01**6*b03**8*b12**8*b13**4*b23**2 - 8*b01**4*b03**10*b12**8*b13**4*b23**2 - 32*b01**10*b03**4*b12**6*b13**6*b23**2 - 32*b01**8*b03**6*b12**6*b13**6*b23**2 + 128*b01**6*b03**8*b12**6*b13**6*b23**2 - 32*b01**4*b03**10*b12**6*b13**6*b23**2 - 32*b01**2*b03**12*b12**6*b13**6*b23**2 + 8*b01**10*b03**2*b12**6*b13**8*b23**2 - 24*b01**8*b03**4*b12**6*b13**8*b23**2 + 16*b01**6*b03**6*b12**6*b13**8*b23**2 + 16*b01**4*b03**8*b12**6*b13**8*b23**2 - 24*b01**2*b03**10*b12**6*b13**8*b23**2 + 8*b03**12*b12**6*b13**8*b23**2 + 8*b01**9*b03**11*b12**5*b23**3 + 8*b01**9*b03**9*b12**7*b23**3 + 8*b01**7*b03**11*b12**7*b23**3 - 32*b01**9*b03**9*b12**5*b13**2*b23**3 - 32*b01**7*b03**11*b12**5*b13**2*b23**3 - 56*b01**9*b03**7*b12**7*b13**2*b23**3 + 112*b01**7*b03**9*b12**7*b13**2*b23**3 - 56*b01**5*b03**11*b12**7*b13**2*b23**3 + 48*b01**9*b03**7*b12**5*b13**4*b23**3 + 32*b01**7*b03**9*b12**5*b13**4*b23**3 + 48*b01**5*b03**11*b12**5*b13**4*b23**3 + 24*b01**9*b03**5*b12**7*b13**4*b23**3 - 24*b01**7*b03**7*b12**7*b13**4*b23**3 - 24*b01**5*b03**9*b12**7*b13**4*b23**3 + 24*b01**3*b03**11*b12**7*b13**4*b23**3 - 32*b01**9*b03**5*b12**5*b13**6*b23**3 + 32*b01**7*b03**7*b12**5*b13**6*b23**3 + 32*b01**5*b03**9*b12**5*b13**6*b23**3 - 32*b01**3*b03**11*b12**5*b13**6*b23**3 + 24*b01**9*b03**3*b12**7*b13**6*b23**3 - 96*b01**7*b03**5*b12**7*b13**6*b23**3 + 144*b01**5*b03**7*b12**7*b13**6*b23**3 - 96*b01**3*b03**9*b12**7*b13**6*b23**3 + 24*b01*b03**11*b12**7*b13**6*b23**3 + 8*b01**9*b03**3*b12**5*b13**8*b23**3 - 32*b01**7*b03**5*b12**5*b13**8*b23**3 + 48*b01**5*b03**7*b12**5*b13**8*b23**3 - 32*b01**3*b03**9*b12**5*b13**8*b23**3 + 8*b01*b03**11*b12**5*b13**8*b23**3 - 16*b01**10*b03**10*b12**4*b23**4 - 16*b01**8*b03**12*b12**4*b23**4 - 16*b01**10*b03**8*b12**6*b23**4 - 104*b01**8*b03**10*b12**6*b23**4 - 16*b01**6*b03**12*b12**6*b23**4 - 16*b01**8*b03**8*b12**8*b23**4 - 16*b01**6*b03**10*b12**8*b23**4 + 64*b01**10*b03**8*b12**4*b13**2*b23**4 + 176*b01**8*b03**10*b12**4*b13**2*b23**4 + 64*b01**6*b03**12*b12**4*b13**2*b23**4 + 16*b01**10*b03**6*b12**6*b13**2*b23**4 - 304*b01**8*b03**8*b12**6*b13**2*b23**4 - 304*b01**6*b03**10*b12**6*b13**2*b23**4 + 16*b01**4*b03**12*b12**6*b13**2*b23**4 - 8*b01**8*b03**6*b12**8*b13**2*b23**4 + 16*b01**6*b03**8*b12**8*b13**2*b23**4 - 8*b01**4*b03**10*b12**8*b13**2*b23**4 - 96*b01**10*b03**6*b12**4*b13**4*b23**4 - 256*b01**8*b03**8*b12**4*b13**4*b23**4 - 256*b01**6*b03**10*b12**4*b13**4*b23**4 - 96*b01**4*b03**12*b12**4*b13**4*b23**4 + 16*b01**10*b03**4*b12**6*b13**4*b23**4 + 200*b01**8*b03**6*b12**6*b13**4*b23**4 - 432*b01**6*b03**8*b12**6*b13**4*b23**4 + 200*b01**4*b03**10*b12**6*b13**4*b23**4 + 16*b01**2*b03**12*b12**6*b13**4*b23**4 + 64*b01**10*b03**4*b12**4*b13**6*b23**4 + 48*b01**8*b03**6*b12**4*b13**6*b23**4 - 224*b01**6*b03**8*b12**4*b13**6*b23**4 + 48*b01**4*b03**10*b12**4*b13**6*b23**4 + 64*b01**2*b03**12*b12**4*b13**6*b23**4 - 16*b01**10*b03**2*b12**6*b13**6*b23**4 + 48*b01**8*b03**4*b12**6*b13**6*b23**4 - 32*b01**6*b03**6*b12**6*b13**6*b23**4 - 32*b01**4*b03**8*b12**6*b13**6*b23**4 + 48*b01**2*b03**10*b12**6*b13**6*b23**4 - 16*b03**12*b12**6*b13**6*b23**4 - 16*b01**10*b03**2*b12**4*b13**8*b23**4 + 48*b01**8*b03**4*b12**4*b13**8*b23**4 - 32*b01**6*b03**6*b12**4*b13**8*b23**4 - 32*b01**4*b03**8*b12**4*b13**8*b23**4 + 48*b01**2*b03**10*b12**4*b13**8*b23**4 - 16*b03**12*b12**4*b13**8*b23**4 + 8*b01**9*b03**11*b12**3*b23**5 + 112*b01**9*b03**9*b12**5*b23**5 + 112*b01**7*b03**11*b12**5*b23**5 + 8*b01**9*b03**7*b12**7*b23**5 + 112*b01**7*b03**9*b12**7*b23**5 + 8*b01**5*b03**11*b12**7*b23**5 - 32*b01**9*b03**9*b12**3*b13**2*b23**5 - 32*b01**7*b03**11*b12**3*b13**2*b23**5 + 176*b01**9*b03**7*b12**5*b13**2*b23**5 + 672*b01**7*b03**9*b12**5*b13**2*b23**5 + 176*b01**5*b03**11*b12**5*b13**2*b23**5 - 48*b01**9*b03**5*b12**7*b13**2*b23**5 + 48*b01**7*b03**7*b12**7*b13**2*b23**5 + 48*b01**5*b03**9*b12**7*b13**2*b23**5 - 48*b01**3*b03**11*b12**7*b13**2*b23**5 + 48*b01**9*b03**7*b12**3*b13**4*b23**5 + 32*b01**7*b03**9*b12**3*b13**4*b23**5 + 48*b01**5*b03**11*b12**3*b13**4*b23**5 - 304*b01**9*b03**5*b12**5*b13**4*b23**5 + 304*b01**7*b03**7*b12**5*b13**4*b23**5 + 304*b01**5*b03**9*b12**5*b13**4*b23**5 - 304*b01**3*b03**11*b12**5*b13**4*b23**5 - 24*b01**9*b03**3*b12**7*b13**4*b23**5 + 96*b01**7*b03**5*b12**7*b13**4*b23**5 - 144*b01**5*b03**7*b12**7*b13**4*b23**5 + 96*b01**3*b03**9*b12**7*b13**4*b23**5 - 24*b01*b03**11*b12**7*b13**4*b23**5 - 32*b01**9*b03**5*b12**3*b13**6*b23**5 + 32*b01**7*b03**7*b12**3*b13**6*b23**5 + 32*b01**5*b03**9*b12**3*b13**6*b23**5 - 32*b01**3*b03**11*b12**3*b13**6*b23**5 + 16*b01**9*b03**3*b12**5*b13**6*b23**5 - 64*b01**7*b03**5*b12**5*b13**6*b23**5 + 96*b01**5*b03**7*b12**5*b13**6*b23**5 - 64*b01**3*b03**9*b12**5*b13**6*b23**5 + 16*b01*b03**11*b12**5*b13**6*b23**5 + 8*b01**9*b03**3*b12**3*b13**8*b23**5 - 32*b01**7*b03**5*b12**3*b13**8*b23**5 + 48*b01**5*b03**7*b12**3*b13**8*b23**5 - 32*b01**3*b03**9*b12**3*b13**8*b23**5 + 8*b01*b03**11*b12**3*b13**8*b23**5 + 8*b01**10*b03**10*b12**2*b23**6 + 8*b01**8*b03**12*b12**2*b23**6 - 16*b01**10*b03**8*b12**4*b23**6 - 104*b01**8*b03**10*b12**4*b23**6 - 16*b01**6*b03**12*b12**4*b23**6 + 8*b01**10*b03**6*b12**6*b23**6 - 104*b01**8*b03**8*b12**6*b23**6 - 104*b01**6*b03**10*b12**6*b23**6 + 8*b01**4*b03**12*b12**6*b23**6 + 8*b01**8*b03**6*b12**8*b23**6 - 16*b01**6*b03**8*b12**8*b23**6 + 8*b01**4*b03**10*b12**8*b23**6 - 32*b01**10*b03**8*b12**2*b13**2*b23**6 - 96*b01**8*b03**10*b12**2*b13**2*b23**6 - 32*b01**6*b03**12*b12**2*b13**2*b23**6 + 16*b01**10*b03**6*b12**4*b13**2*b23**6 - 304*b01**8*b03**8*b12**4*b13**2*b23**6 - 304*b01**6*b03**10*b12**4*b13**2*b23**6 + 16*b01**4*b03**12*b12**4*b13**2*b23**6 + 48*b01**10*b03**4*b12**6*b13**2*b23**6 + 16*b01**8*b03**6*b12**6*b13**2*b23**6 - 128*b01**6*b03**8*b12**6*b13**2*b23**6 + 16*b01**4*b03**10*b12**6*b13**2*b23**6 + 48*b01**2*b03**12*b12**6*b13**2*b23**6 + 48*b01**10*b03**6*b12**2*b13**4*b23**6 + 144*b01**8*b03**8*b12**2*b13**4*b23**6 + 144*b01**6*b03**10*b12**2*b13**4*b23**6 + 48*b01**4*b03**12*b12**2*b13**4*b23**6 + 16*b01**10*b03**4*b12**4*b13**4*b23**6 + 200*b01**8*b03**6*b12**4*b13**4*b23**6 - 432*b01**6*b03**8*b12**4*b13**4*b23**6 + 200*b01**4*b03**10*b12**4*b13**4*b23**6 + 16*b01**2*b03**12*b12**4*b13**4*b23**6 + 8*b01**10*b03**2*b12**6*b13**4*b23**6 - 24*b01**8*b03**4*b12**6*b13**4*b23**6 + 16*b01**6*b03**6*b12**6*b13**4*b23**6 + 16*b01**4*b03**8*b12**6*b13**4*b23**6 - 24*b01**2*b03**10*b12**6*b13**4*b23**6 + 8*b03**12*b12**6*b13**4*b23**6 - 32*b01**10*b03**4*b12**2*b13**6*b23**6 - 32*b01**8*b03**6*b12**2*b13**6*b23**6 + 128*b01**6*b03**8*b12**2*b13**6*b23**6 - 32*b01**4*b03**10*b12**2*b13**6*b23**6 - 32*b01**2*b03**12*b12**2*b13**6*b23**6 - 16*b01**10*b03**2*b12**4*b13**6*b23**6 + 48*b01**8*b03**4*b12**4*b13**6*b23**6 - 32*b01**6*b03**6*b12**4*b13**6*b23**6 - 32*b01**4*b03**8*b12**4*b13**6*b23**6 + 48*b01**2*b03**10*b12**4*b13**6*b23**6 - 16*b03**12*b12**4*b13**6*b23**6 + 8*b01**10*b03**2*b12**2*b13**8*b23**6 - 24*b01**8*b03**4*b12**2*b13**8*b23**6 + 16*b01**6*b03**6*b12**2*b13**8*b23**6 + 16*b01**4*b03**8*b12**2*b13**8*b23**6 - 24*b01**2*b03**10*b12**2*b13**8*b23**6 + 8*b03**12*b12**2*b13**8*b23**6 - 8*b01**9*b03**11*b12*b23**7 + 8*b01**9*b03**9*b12**3*b23**7 + 8*b01**7*b03**11*b12**3*b23**7 + 8*b01**9*b03**7*b12**5*b23**7 + 112*b01**7*b03**9*b12**5*b23**7 + 8*b01**5*b03**11*b12**5*b23**7 - 8*b01**9*b03**5*b12**7*b23**7 + 8*b01**7*b03**7*b12**7*b23**7 + 8*b01**5*b03**9*b12**7*b23**7 - 8*b01**3*b03**11*b12**7*b23**7 + 32*b01**9*b03**9*b12*b13**2*b23**7 + 32*b01**7*b03**11*b12*b13**2*b23**7 - 56*b01**9*b03**7*b12**3*b13**2*b23**7 + 112*b01**7*b03**9*b12**3*b13**2*b23**7 - 56*b01**5*b03**11*b12**3*b13**2*b23**7 - 48*b01**9*b03**5*b12**5*b13**2*b23**7 + 48*b01**7*b03**7*b12**5*b13**2*b23**7 + 48*b01**5*b03**9*b12**5*b13**2*b23**7 - 48*b01**3*b03**11*b12**5*b13**2*b23**7 + 8*b01**9*b03**3*b12**7*b13**2*b23**7 - 32*b01**7*b03**5*b12**7*b13**2*b23**7 + 48*b01**5*b03**7*b12**7*b13**2*b23**7 - 32*b01**3*b03**9*b12**7*b13**2*b23**7 + 8*b01*b03**11*b12**7*b13**2*b23**7 - 48*b01**9*b03**7*b12*b13**4*b23**7 - 32*b01**7*b03**9*b12*b13**4*b23**7 - 48*b01**5*b03**11*b12*b13**4*b23**7 + 24*b01**9*b03**5*b12**3*b13**4*b23**7 - 24*b01**7*b03**7*b12**3*b13**4*b23**7 - 24*b01**5*b03**9*b12**3*b13**4*b23**7 + 24*b01**3*b03**11*b12**3*b13**4*b23**7 - 24*b01**9*b03**3*b12**5*b13**4*b23**7 + 96*b01**7*b03**5*b12**5*b13**4*b23**7 - 144*b01**5*b03**7*b12**5*b13**4*b23**7 + 96*b01**3*b03**9*b12**5*b13**4*b23**7 - 24*b01*b03**11*b12**5*b13**4*b23**7 + 32*b01**9*b03**5*b12*b13**6*b23**7 - 32*b01**7*b03**7*b12*b13**6*b23**7 - 32*b01**5*b03**9*b12*b13**6*b23**7 + 32*b01**3*b03**11*b12*b13**6*b23**7 + 24*b01**9*b03**3*b12**3*b13**6*b23**7 - 96*b01**7*b03**5*b12**3*b13**6*b23**7 + 144*b01**5*b03**7*b12**3*b13**6*b23**7 - 96*b01**3*b03**9*b12**3*b13**6*b23**7 + 24*b01*b03**11*b12**3*b13**6*b23**7 - 8*b01**9*b03**3*b12*b13**8*b23**7 + 32*b01**7*b03**5*b12*b13**8*b23**7 - 48*b01**5*b03**7*b12*b13**8*b23**7 + 32*b01**3*b03**9*b12*b13**8*b23**7 - 8*b01*b03**11*b12*b13**8*b23**7 + 8*b01**8*b03**10*b12**2*b23**8 - 16*b01**8*b03**8*b12**4*b23**8 - 16*b01**6*b03**10*b12**4*b23**8 + 8*b01**8*b03**6*b12**6*b23**8 - 16*b01**6*b03**8*b12**6*b23**8 + 8*b01**4*b03**10*b12**6*b23**8 + 8*b01**8*b03**10*b13**2*b23**8 + 32*b01**8*b03**8*b12**2*b13**2*b23**8 + 32*b01**6*b03**10*b12**2*b13**2*b23**8 - 8*b01**8*b03**6*b12**4*b13**2*b23**8 + 16*b01**6*b03**8*b12**4*b13**2*b23**8 - 8*b01**4*b03**10*b12**4*b13**2*b23**8 - 16*b01**8*b03**8*b13**4*b23**8 - 16*b01**6*b03**10*b13**4*b23**8 - 8*b01**8*b03**6*b12**2*b13**4*b23**8 + 16*b01**6*b03**8*b12**2*b13**4*b23**8 - 8*b01**4*b03**10*b12**2*b13**4*b23**8 + 8*b01**8*b03**6*b13**6*b23**8 - 16*b01**6*b03**8*b13**6*b23**8 + 8*b01**4*b03**10*b13**6*b23**8
+	return eliminant_coeffs(b)[0,3]
 
 def c0(b):
-	b01,b03,b12,b13,b23 = b
-	return b01**8*b03**12*b12**8 - 4*b01**8*b03**10*b12**8*b13**2 - 4*b01**6*b03**12*b12**8*b13**2 + 6*b01**8*b03**8*b12**8*b13**4 + 4*b01**6*b03**10*b12**8*b13**4 + 6*b01**4*b03**12*b12**8*b13**4 - 4*b01**8*b03**6*b12**8*b13**6 + 4*b01**6*b03**8*b12**8*b13**6 + 4*b01**4*b03**10*b12**8*b13**6 - 4*b01**2*b03**12*b12**8*b13**6 + b01**8*b03**4*b12**8*b13**8 - 4*b01**6*b03**6*b12**8*b13**8 + 6*b01**4*b03**8*b12**8*b13**8 - 4*b01**2*b03**10*b12**8*b13**8 + b03**12*b12**8*b13**8 - 4*b01**8*b03**12*b12**6*b23**2 - 4*b01**8*b03**10*b12**8*b23**2 - 4*b01**6*b03**12*b12**8*b23**2 + 16*b01**8*b03**10*b12**6*b13**2*b23**2 + 16*b01**6*b03**12*b12**6*b13**2*b23**2 + 4*b01**8*b03**8*b12**8*b13**2*b23**2 - 40*b01**6*b03**10*b12**8*b13**2*b23**2 + 4*b01**4*b03**12*b12**8*b13**2*b23**2 - 24*b01**8*b03**8*b12**6*b13**4*b23**2 - 16*b01**6*b03**10*b12**6*b13**4*b23**2 - 24*b01**4*b03**12*b12**6*b13**4*b23**2 + 4*b01**8*b03**6*b12**8*b13**4*b23**2 - 4*b01**6*b03**8*b12**8*b13**4*b23**2 - 4*b01**4*b03**10*b12**8*b13**4*b23**2 + 4*b01**2*b03**12*b12**8*b13**4*b23**2 + 16*b01**8*b03**6*b12**6*b13**6*b23**2 - 16*b01**6*b03**8*b12**6*b13**6*b23**2 - 16*b01**4*b03**10*b12**6*b13**6*b23**2 + 16*b01**2*b03**12*b12**6*b13**6*b23**2 - 4*b01**8*b03**4*b12**8*b13**6*b23**2 + 16*b01**6*b03**6*b12**8*b13**6*b23**2 - 24*b01**4*b03**8*b12**8*b13**6*b23**2 + 16*b01**2*b03**10*b12**8*b13**6*b23**2 - 4*b03**12*b12**8*b13**6*b23**2 - 4*b01**8*b03**4*b12**6*b13**8*b23**2 + 16*b01**6*b03**6*b12**6*b13**8*b23**2 - 24*b01**4*b03**8*b12**6*b13**8*b23**2 + 16*b01**2*b03**10*b12**6*b13**8*b23**2 - 4*b03**12*b12**6*b13**8*b23**2 + 16*b01**7*b03**11*b12**7*b23**3 + 32*b01**7*b03**9*b12**7*b13**2*b23**3 + 32*b01**5*b03**11*b12**7*b13**2*b23**3 - 48*b01**7*b03**7*b12**7*b13**4*b23**3 + 96*b01**5*b03**9*b12**7*b13**4*b23**3 - 48*b01**3*b03**11*b12**7*b13**4*b23**3 + 6*b01**8*b03**12*b12**4*b23**4 + 4*b01**8*b03**10*b12**6*b23**4 + 4*b01**6*b03**12*b12**6*b23**4 + 6*b01**8*b03**8*b12**8*b23**4 + 4*b01**6*b03**10*b12**8*b23**4 + 6*b01**4*b03**12*b12**8*b23**4 - 24*b01**8*b03**10*b12**4*b13**2*b23**4 - 24*b01**6*b03**12*b12**4*b13**2*b23**4 - 4*b01**8*b03**8*b12**6*b13**2*b23**4 + 40*b01**6*b03**10*b12**6*b13**2*b23**4 - 4*b01**4*b03**12*b12**6*b13**2*b23**4 + 4*b01**8*b03**6*b12**8*b13**2*b23**4 - 4*b01**6*b03**8*b12**8*b13**2*b23**4 - 4*b01**4*b03**10*b12**8*b13**2*b23**4 + 4*b01**2*b03**12*b12**8*b13**2*b23**4 + 36*b01**8*b03**8*b12**4*b13**4*b23**4 + 24*b01**6*b03**10*b12**4*b13**4*b23**4 + 36*b01**4*b03**12*b12**4*b13**4*b23**4 - 4*b01**8*b03**6*b12**6*b13**4*b23**4 + 4*b01**6*b03**8*b12**6*b13**4*b23**4 + 4*b01**4*b03**10*b12**6*b13**4*b23**4 - 4*b01**2*b03**12*b12**6*b13**4*b23**4 + 6*b01**8*b03**4*b12**8*b13**4*b23**4 - 24*b01**6*b03**6*b12**8*b13**4*b23**4 + 36*b01**4*b03**8*b12**8*b13**4*b23**4 - 24*b01**2*b03**10*b12**8*b13**4*b23**4 + 6*b03**12*b12**8*b13**4*b23**4 - 24*b01**8*b03**6*b12**4*b13**6*b23**4 + 24*b01**6*b03**8*b12**4*b13**6*b23**4 + 24*b01**4*b03**10*b12**4*b13**6*b23**4 - 24*b01**2*b03**12*b12**4*b13**6*b23**4 + 4*b01**8*b03**4*b12**6*b13**6*b23**4 - 16*b01**6*b03**6*b12**6*b13**6*b23**4 + 24*b01**4*b03**8*b12**6*b13**6*b23**4 - 16*b01**2*b03**10*b12**6*b13**6*b23**4 + 4*b03**12*b12**6*b13**6*b23**4 + 6*b01**8*b03**4*b12**4*b13**8*b23**4 - 24*b01**6*b03**6*b12**4*b13**8*b23**4 + 36*b01**4*b03**8*b12**4*b13**8*b23**4 - 24*b01**2*b03**10*b12**4*b13**8*b23**4 + 6*b03**12*b12**4*b13**8*b23**4 - 32*b01**7*b03**11*b12**5*b23**5 - 32*b01**7*b03**9*b12**7*b23**5 - 32*b01**5*b03**11*b12**7*b23**5 - 64*b01**7*b03**9*b12**5*b13**2*b23**5 - 64*b01**5*b03**11*b12**5*b13**2*b23**5 + 32*b01**7*b03**7*b12**7*b13**2*b23**5 - 64*b01**5*b03**9*b12**7*b13**2*b23**5 + 32*b01**3*b03**11*b12**7*b13**2*b23**5 + 96*b01**7*b03**7*b12**5*b13**4*b23**5 - 192*b01**5*b03**9*b12**5*b13**4*b23**5 + 96*b01**3*b03**11*b12**5*b13**4*b23**5 - 4*b01**8*b03**12*b12**2*b23**6 + 4*b01**8*b03**10*b12**4*b23**6 + 4*b01**6*b03**12*b12**4*b23**6 + 4*b01**8*b03**8*b12**6*b23**6 + 88*b01**6*b03**10*b12**6*b23**6 + 4*b01**4*b03**12*b12**6*b23**6 - 4*b01**8*b03**6*b12**8*b23**6 + 4*b01**6*b03**8*b12**8*b23**6 + 4*b01**4*b03**10*b12**8*b23**6 - 4*b01**2*b03**12*b12**8*b23**6 + 16*b01**8*b03**10*b12**2*b13**2*b23**6 + 16*b01**6*b03**12*b12**2*b13**2*b23**6 - 4*b01**8*b03**8*b12**4*b13**2*b23**6 + 40*b01**6*b03**10*b12**4*b13**2*b23**6 - 4*b01**4*b03**12*b12**4*b13**2*b23**6 - 40*b01**8*b03**6*b12**6*b13**2*b23**6 + 40*b01**6*b03**8*b12**6*b13**2*b23**6 + 40*b01**4*b03**10*b12**6*b13**2*b23**6 - 40*b01**2*b03**12*b12**6*b13**2*b23**6 - 4*b01**8*b03**4*b12**8*b13**2*b23**6 + 16*b01**6*b03**6*b12**8*b13**2*b23**6 - 24*b01**4*b03**8*b12**8*b13**2*b23**6 + 16*b01**2*b03**10*b12**8*b13**2*b23**6 - 4*b03**12*b12**8*b13**2*b23**6 - 24*b01**8*b03**8*b12**2*b13**4*b23**6 - 16*b01**6*b03**10*b12**2*b13**4*b23**6 - 24*b01**4*b03**12*b12**2*b13**4*b23**6 - 4*b01**8*b03**6*b12**4*b13**4*b23**6 + 4*b01**6*b03**8*b12**4*b13**4*b23**6 + 4*b01**4*b03**10*b12**4*b13**4*b23**6 - 4*b01**2*b03**12*b12**4*b13**4*b23**6 + 4*b01**8*b03**4*b12**6*b13**4*b23**6 - 16*b01**6*b03**6*b12**6*b13**4*b23**6 + 24*b01**4*b03**8*b12**6*b13**4*b23**6 - 16*b01**2*b03**10*b12**6*b13**4*b23**6 + 4*b03**12*b12**6*b13**4*b23**6 + 16*b01**8*b03**6*b12**2*b13**6*b23**6 - 16*b01**6*b03**8*b12**2*b13**6*b23**6 - 16*b01**4*b03**10*b12**2*b13**6*b23**6 + 16*b01**2*b03**12*b12**2*b13**6*b23**6 + 4*b01**8*b03**4*b12**4*b13**6*b23**6 - 16*b01**6*b03**6*b12**4*b13**6*b23**6 + 24*b01**4*b03**8*b12**4*b13**6*b23**6 - 16*b01**2*b03**10*b12**4*b13**6*b23**6 + 4*b03**12*b12**4*b13**6*b23**6 - 4*b01**8*b03**4*b12**2*b13**8*b23**6 + 16*b01**6*b03**6*b12**2*b13**8*b23**6 - 24*b01**4*b03**8*b12**2*b13**8*b23**6 + 16*b01**2*b03**10*b12**2*b13**8*b23**6 - 4*b03**12*b12**2*b13**8*b23**6 + 16*b01**7*b03**11*b12**3*b23**7 - 32*b01**7*b03**9*b12**5*b23**7 - 32*b01**5*b03**11*b12**5*b23**7 + 16*b01**7*b03**7*b12**7*b23**7 - 32*b01**5*b03**9*b12**7*b23**7 + 16*b01**3*b03**11*b12**7*b23**7 + 32*b01**7*b03**9*b12**3*b13**2*b23**7 + 32*b01**5*b03**11*b12**3*b13**2*b23**7 + 32*b01**7*b03**7*b12**5*b13**2*b23**7 - 64*b01**5*b03**9*b12**5*b13**2*b23**7 + 32*b01**3*b03**11*b12**5*b13**2*b23**7 - 48*b01**7*b03**7*b12**3*b13**4*b23**7 + 96*b01**5*b03**9*b12**3*b13**4*b23**7 - 48*b01**3*b03**11*b12**3*b13**4*b23**7 + b01**8*b03**12*b23**8 - 4*b01**8*b03**10*b12**2*b23**8 - 4*b01**6*b03**12*b12**2*b23**8 + 6*b01**8*b03**8*b12**4*b23**8 + 4*b01**6*b03**10*b12**4*b23**8 + 6*b01**4*b03**12*b12**4*b23**8 - 4*b01**8*b03**6*b12**6*b23**8 + 4*b01**6*b03**8*b12**6*b23**8 + 4*b01**4*b03**10*b12**6*b23**8 - 4*b01**2*b03**12*b12**6*b23**8 + b01**8*b03**4*b12**8*b23**8 - 4*b01**6*b03**6*b12**8*b23**8 + 6*b01**4*b03**8*b12**8*b23**8 - 4*b01**2*b03**10*b12**8*b23**8 + b03**12*b12**8*b23**8 - 4*b01**8*b03**10*b13**2*b23**8 - 4*b01**6*b03**12*b13**2*b23**8 + 4*b01**8*b03**8*b12**2*b13**2*b23**8 - 40*b01**6*b03**10*b12**2*b13**2*b23**8 + 4*b01**4*b03**12*b12**2*b13**2*b23**8 + 4*b01**8*b03**6*b12**4*b13**2*b23**8 - 4*b01**6*b03**8*b12**4*b13**2*b23**8 - 4*b01**4*b03**10*b12**4*b13**2*b23**8 + 4*b01**2*b03**12*b12**4*b13**2*b23**8 - 4*b01**8*b03**4*b12**6*b13**2*b23**8 + 16*b01**6*b03**6*b12**6*b13**2*b23**8 - 24*b01**4*b03**8*b12**6*b13**2*b23**8 + 16*b01**2*b03**10*b12**6*b13**2*b23**8 - 4*b03**12*b12**6*b13**2*b23**8 + 6*b01**8*b03**8*b13**4*b23**8 + 4*b01**6*b03**10*b13**4*b23**8 + 6*b01**4*b03**12*b13**4*b23**8 + 4*b01**8*b03**6*b12**2*b13**4*b23**8 - 4*b01**6*b03**8*b12**2*b13**4*b23**8 - 4*b01**4*b03**10*b12**2*b13**4*b23**8 + 4*b01**2*b03**12*b12**2*b13**4*b23**8 + 6*b01**8*b03**4*b12**4*b13**4*b23**8 - 24*b01**6*b03**6*b12**4*b13**4*b23**8 + 36*b01**4*b03**8*b12**4*b13**4*b23**8 - 24*b01**2*b03**10*b12**4*b13**4*b23**8 + 6*b03**12*b12**4*b13**4*b23**8 - 4*b01**8*b03**6*b13**6*b23**8 + 4*b01**6*b03**8*b13**6*b23**8 + 4*b01**4*b03**10*b13**6*b23**8 - 4*b01**2*b03**12*b13**6*b23**8 - 4*b01**8*b03**4*b12**2*b13**6*b23**8 + 16*b01**6*b03**6*b12**2*b13**6*b23**8 - 24*b01**4*b03**8*b12**2*b13**6*b23**8 + 16*b01**2*b03**10*b12**2*b13**6*b23**8 - 4*b03**12*b12**2*b13**6*b23**8 + b01**8*b03**4*b13**8*b23**8 - 4*b01**6*b03**6*b13**8*b23**8 + 6*b01**4*b03**8*b13**8*b23**8 - 4*b01**2*b03**10*b13**8*b23**8 + b03**12*b13**8*b23**8
+	return eliminant_coeffs(b)[0,4]
 
 def poly_coeff(b):
-	return [c8(b),0,c6(b),0,c4(b),0,c2(b),0,c0(b)]
-
-
-
-
+	return list(poly_coeff_batch(b)[0])
@@ -0,0 +1,84 @@
+#Helpers for spreading the instances of an eq_loop over a pool of worker processes.
+#
+#Bertini always writes real_finite_solutions, finite_solutions, etc. into the folder it
+#is run from, so two runs in the same folder would overwrite each other's output.
+#To avoid this, every worker process gets its own scratch directory and the solver
+#is launched from inside it. The scratch directories live in a Workspace (see workspace.py),
+#which is removed when the pool is done.
+#
+#Usage from a driver:
+#	freq_count = run_pool(partial(solve_range,graph,tol,n,seed),iters,jobs,verbose)
+#where solve_range(...,bounds,workdir) solves the instances in range(*bounds) inside
+#workdir and returns a dictionary {number of real solutions : frequency}.
+#
+
+import numpy as np
+import multiprocessing
+import sys
+import os
+
+from workspace import Workspace
+
+_scratch_base = None #Folder holding the scratch directories of the workers
+
+#Input: The number of instances iters and the maximal size of a chunk.
+#Output: A list of pairs (start,stop) covering range(iters).
+def split_range(iters,chunk_size):
+	return [(s,min(s+chunk_size,iters)) for s in range(0,iters,chunk_size)]
+
+#Adds the frequencies in the dictionary new to the dictionary total.
+def merge_counts(total,new):
+	for k in new:
+		total[k] = total.get(k,0) + new[k]
+	return total
+
+#This is run once in every worker process when the pool starts.
+#Forked workers inherit the random state of the parent, so we reseed them.
+def _init_worker(base):
+	global _scratch_base
+	_scratch_base = base
+	np.random.seed()
+
+#Returns the scratch directory of the current worker, creating it if needed.
+def worker_dir():
+	d = os.path.join(_scratch_base,'worker_'+str(os.getpid()))
+	if not os.path.isdir(d):
+		os.mkdir(d)
+	return d
+
+#This runs inside a worker and calls the driver's function on one chunk.
+def _run_chunk(job):
+	solve_fn, bounds = job
+	return solve_fn(bounds,worker_dir()), bounds[1]-bounds[0]
+
+#Solves range(iters) with jobs worker processes.
+#solve_fn(bounds,workdir) must return the frequency count of the instances in range(*bounds).
+#The frequency counts of all chunks are merged and returned.
+#scratch is the folder the workspace of the pool is created in, see workspace.default_root.
+#If telemetry is given (see telemetry.py), it is advanced whenever a chunk is done.
+#With start, the instances range(start,start+iters) are solved instead (eg. one round of adaptive.py).
+def run_pool(solve_fn,iters,jobs,verbose=False,scratch=None,telemetry=None,start=0):
+	workspace = Workspace(scratch,'pool')
+	base = workspace.path
+	chunks = [(s+start,e+start) for s, e in split_range(iters,max(1,iters//(4*jobs)))]#Several chunks per worker so that slow ones balance out
+	pool = multiprocessing.Pool(jobs,initializer=_init_worker,initargs=(base,))
+	freq_count = {}
+	done = 0
+	next_report = 0#Progress is reported every 10 percent, as in the serial loop
+	try:
+		for counts, size in pool.imap_unordered(_run_chunk,[(solve_fn,c) for c in chunks]):
+			merge_counts(freq_count,counts)
+			done += size
+			if telemetry is not None:
+				telemetry.advance(size)
+			if verbose and done >= next_report:
+				sys.stdout.write(str((float(done)/iters)*100)+' percent completed\n')
+				next_report = done + max(1,iters//10)
+		pool.close()
+	except:
+		pool.terminate()
+		raise
+	finally:
+		pool.join()
+		workspace.close()
+	return freq_count
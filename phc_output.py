@@ -0,0 +1,70 @@
+#A streaming parser for the solutions PHC writes with ./phc -b.
+#
+#phc -b appends the solutions it found to the file of the system, as a list of the form
+#	THE SOLUTIONS :
+#	4 2
+#	===========================================================
+#	solution 1 :
+#	t :  1.00000000000000E+00   0.00000000000000E+00
+#	m : 1
+#	the solution for t :
+#	 x1 :  9.99999999999999E-01  -3.25260651745651E-19
+#	 y1 : -2.05213759316412E-17   1.02932795468014E-18
+#	== err :  1.4E-16 = rco :  2.5E-01 = res :  1.1E-16 ==
+#	solution 2 :
+#	...
+#where the line after the title holds the number of solutions and their dimension.
+#Instead of converting this with ./phc -x into a Python dictionary and calling eval on it,
+#we read the coordinates line by line into a preallocated array, so memory stays proportional
+#to the solutions themselves, and decide which solutions are real in one comparison.
+#
+
+import numpy as np
+
+#Input: The file written by phc -b (the system file, to which the solutions are appended).
+#Output: An array of shape (number of solutions,dimension) with the coordinates of the solutions,
+#in the order the variables are listed by PHC. If the file holds several lists of solutions, the last one is returned.
+#If order is a list of variable names, eg. ['x1','x2','y1','y2'], the columns are put in that order instead.
+#A solution only counts once its "== err" line is read, so if the file was cut off, the solutions before the cut are returned.
+def read_solutions(filename,order=None):
+	sols = np.zeros([0,0],dtype=complex)
+	names = []
+	with open(filename,'r') as f:
+		lines = iter(f)
+		for line in lines:
+			if not line.startswith('THE SOLUTIONS'):
+				continue
+			line = next(lines,None)
+			if line is None:
+				break
+			num_sols, dim = [int(x) for x in line.split()[:2]]
+			sols = np.zeros([num_sols,dim],dtype=complex)
+			names = []
+			complete = 0#Number of solutions read completely
+			k = -1
+			for line in lines:
+				if line.startswith('solution '):
+					k += 1
+				elif line.startswith('the solution for t'):
+					for d in range(dim):
+						line = next(lines,None)
+						if line is None:
+							break
+						name, values = line.split(':',1)
+						re, im = values.split()[:2]
+						sols[k,d] = complex(float(re),float(im))
+						if k == 0:
+							names.append(name.strip())
+				elif line.startswith('==') and k == complete:
+					complete += 1
+					if complete == num_sols:
+						break
+			sols = sols[:complete]#In case the file was cut off
+	if order is not None and names and len(names) == sols.shape[1]:#All names are known unless the file was cut off in the first solution
+		sols = sols[:,[names.index(name) for name in order]]
+	return sols
+
+#Input: An array of solutions (see read_solutions) and the tolerance for certifying a number is real.
+#Output: The number of solutions all of whose coordinates have imaginary part at most tol.
+def count_real(sols,tol):
+	return int(np.sum(np.all(np.abs(sols.imag) <= tol,axis=1)))
@@ -4,6 +4,8 @@
 #To specify edges, it should be a string of the form "ab,cd,eg,...,jk" where each variable here is a number.
 #For example, the complete graph on 3 buses is "01,12,02", as we assume it's undirected.
 #If you don't use the -edges command, it will default to a complete graph.
+#Large graphs can be read from a file with one edge per line, eg. the branch list of an IEEE test case,
+#with -edgefile [FILE] (see read_edge_file in graphs.py). The number of buses is then taken from the file.
 #
 #Example 1: python random_eqs.py -n 4 -iters 1000
 #This will generate 1000 complete 4 bus graphs with normal random edge weights
@@ -12,135 +14,151 @@
 #Examples 2: python random_eqs.py -n 4 -iters 1000 -edges "01,12,23,03"
 #This generates a graph on 4 buses with edges (0,1), (1,2), (2,3), (0,3)
 #
+#The distribution is also added to the results store Data/results.db (see results_db.py),
+#under the graph-id given with -g, which defaults to the canonical id of the graph (see canonical_id in graphs.py),
+#so isomorphic graphs share their results whatever the labels of their buses.
+#
+#For small numbers of buses, -native solves the systems in-process with the NumPy homotopy
+#solver in homotopy.py, instead of writing files and calling PHC.
+#
+#-backend chooses the solver: phc (the default), bertini, phcpy (PHCpack's Python bindings, in-process and
+#without any files, if phcpy is installed) or native (see backends.py).
+#
+#PHC's files are kept in a scratch folder (by default under /dev/shm, see -scratch),
+#which is removed when the run ends.
+#
+#Instances whose number of solutions differs from the generic count of the graph (cached in the results
+#store, see bounds.py) are reported as failures and not counted in the distribution.
+#
+#-telemetry stderr reports the time spent in each stage, throughput, ETA and failures while
+#the run goes on (see telemetry.py for the other sinks).
+#
+#With -adaptive, -iters is only the maximal number of instances: the run stops as soon as every number
+#of real solutions is known to within +-precision (-precision 0.01) and/or the number of real solutions
+#-target has been seen -target_hits times. See adaptive.py and bertini_solve.py.
+#
+#The instances are drawn from random streams keyed by the seed of the run (-seed, printed at the end) and
+#the index of the instance, so any instance can be solved again on its own with replay.py.
 #
 
 import numpy as np
-import subprocess
 import sys
 import argparse
-
-#Input: Matrix A describing the adjacency of the graph.
-#Output: A string corresponding to random equations in this system.
-#The format of the string is amenable to PHC.
-def random_pq_eqs(A,mu,var):
-	n = A.shape[0]
-	x_names = ['x'+str(i) for i in range(1,n)]
-	y_names = ['y'+str(i) for i in range(1,n)]
-
-	B = np.zeros([n,n])
-	t = 0
-	for i in range(n):
-		for j in range(i,n):
-			if A[i,j] != 0:
-				### This distribution controls the susceptances ###
-				B[i,j] = B[j,i] = np.random.normal(mu,var)
-	x = [str(1)]+x_names
-	y = [str(0)]+y_names
-
-	f = []
-	h = []
-	for i in range(1,n):
-		### This distribution controls the P and Q variables ###
-		p_eq = str(0)
-		h_eq = x[i]+"^2+"+y[i]+"^2-1"
-		for j in range(n):
-			if A[i,j] != 0:
-				p_eq += "+("+str(B[i,j])+")*("+x[j]+"*"+y[i]+"-"+x[i]+"*"+y[j]+")"
-		f.append(p_eq)
-		h.append(h_eq)
-	eqs = f+h
-	return eqs
-
-
-#Writes eqs to the file specified by filename.
-def write_equations(eqs,filename):
-	disp = str(len(eqs))+'\n'
-	for coeff in eqs:
-		str_coeff = str(coeff)
-		disp = disp+str_coeff.replace(' ','') + ';\n'
-	f = open(filename+'_eqs.txt','w')
-	f.write(disp)
-	f.close()
-
-
-#This generates iters many random equations according to the n-bus system
-#with adjacency matrix A.
-#tol is the tolerance for certifying a number is real (ie. imaginary part < tol)
-#verbose indicates that it will tell you what percentage is done
-#This method prints the distribution of real solutions to the screen.
-def eq_loop(A,iters,tol,n,mu,var,verbose=False):
-	seed = np.random.randint(0,100000)#Random seed
+import time
+import os
+
+from graphs import Graph, complete_graph, parse_edge_string, read_edge_file, canonical_id
+from sampling import iter_instance_batches, iter_instances
+from homotopy import solve_batch, count_real
+from workspace import Workspace
+from backends import make_backend, record_solutions
+from results_db import add_run
+from telemetry import Telemetry, make_sinks
+from adaptive import StoppingRule, run_adaptive
+from bounds import get_bounds, record_bound, check_finite, format_bounds
+
+#Solves the instances in range(*bounds) of the run seed in-process with the homotopy solver in homotopy.py.
+#Instances whose number of finite solutions does not match root_counts (see bounds.py) are reported and not counted.
+#Output: A dictionary recording how frequently we see each number of real solutions.
+def native_loop(graph,tol,n,mu,var,seed,root_counts,bounds,verbose=False):
+	start, stop = bounds
+	iters = stop-start
 	freq_count = {}#This dictionary will record how frequently we see each number of real sol
-	prog_checker = iters/10#This will be udpated to say what percentage is completed
-	for i in range(iters):
-		eqs = random_pq_eqs(A,mu,var) #Generate random equations
-		write_equations(eqs,'temp_'+str(seed)+"_"+str(i)) #Write them to a file
-
-		#We now try to solve them using phc
-		try:
-			subprocess.call(["./phc","-b","temp_"+str(seed)+"_"+str(i)+"_eqs.txt","temp_"+str(seed)+"_"+str(i)+"_roots.txt"])
-			subprocess.call(["./phc","-x","temp_"+str(seed)+"_"+str(i)+"_eqs.txt","temp_"+str(seed)+"_"+str(i)+"_eqs.dic"])
-		except:
-			print "Solving system "+str(i)+" failed" #If something goes wrong
-
-		number_real = 0
-
-		#We now determine how many real solutions there were
-		try:
-			#This is the file from PHC recording all kinds of information about the solution set
-			f = open("temp_"+str(seed)+"_"+str(i)+"_eqs.dic","r")
-			s = f.read()
-			sols = eval(s)
-			known_keys = ['res','err','multiplicity','time','rco']#These are known pieces of data the file contains that aren't useful to us
-			
-			#We now loop through the solutions and calculate how many are real.
-			for sol in sols:
-				is_real = True
-				for k in sol.keys():
-					if k not in known_keys:
-						root = sol[k]
-						if abs(root.imag) > tol:
-							is_real = False
-				if is_real:
-					number_real += 1
-			f.close()
-
-			#We update our frequency count
-			if number_real%2 ==0:
-				if number_real in freq_count.keys():
-					freq_count[number_real] += 1
+	prog_checker = max(1,iters/10)#Instances are solved prog_checker at a time, so we can report progress
+	done = start
+	edges = graph.edges
+	for batch in iter_instance_batches(seed,start,stop,len(edges),mu,var):
+		for s in range(0,batch.shape[0],prog_checker):
+			solutions = solve_batch(n,edges,batch[s:s+prog_checker])
+			for sols, number_real in zip(solutions,count_real(solutions,tol)):
+				#We update our frequency count
+				if check_finite(root_counts,sols.shape[0],number_real) is not None:
+					print "Instance "+str(done)+" failed, "+str(sols.shape[0])+" finite solutions but the generic count is "+str(root_counts['generic'])
+				elif number_real%2 ==0:
+					freq_count[number_real] = freq_count.get(number_real,0) + 1
 				else:
-					freq_count[number_real] = 1
-			else:
-				print "File "+str(i)+" failed, odd number of solutions detected"
-		except:
-			print "Could not read file "+str(i)
-
-
-		#We now delete all the text files created
-		try:
-			subprocess.call(["rm","-f","temp_"+str(seed)+"_"+str(i)+"_eqs.txt"])
-		except:
-			print "Error removing temp_"+str(seed)+"_"+str(i)+"_eqs.txt"
-
-		try:
-			subprocess.call(["rm","-f","temp_"+str(seed)+"_"+str(i)+"_eqs.dic"])
-		except:
-			print "Error removing temp_"+str(seed)+"_"+str(i)+"_eqs.dic"
-
-		try:
-			subprocess.call(["rm","-f","temp_"+str(seed)+"_"+str(i)+"_roots.txt"])
-		except:
-			print "Error removing temp_"+str(seed)+"_"+str(i)+"_roots.txt"		
-
+					print "Instance "+str(done)+" failed, odd number of solutions detected"
+				done += 1
+
+			#If verbose, we give a progress update every so often
+			if verbose:
+				sys.stdout.write(str((float(done-start)/iters)*100)+' percent completed\n')
+	return freq_count
+
+#Solves the instances in range(*bounds) with the solver backend (see backends.py) inside the folder workdir.
+#Instances whose number of solutions does not match root_counts (see bounds.py) are reported and not counted.
+#If the mixed volume of the graph is not known yet, it is taken from PHC's report on the first instance.
+#Output: A dictionary recording how frequently we see each number of real solutions.
+def solve_range(graph,tol,n,mu,var,seed,backend,root_counts,telemetry,bounds,workdir='.',verbose=False):
+	start, stop = bounds
+	iters = stop-start
+	freq_count = {}#This dictionary will record how frequently we see each number of real sol
+	prog_checker = max(1,iters/10)#This will be udpated to say what percentage is completed
+	edges = graph.edges
+	solver = make_backend(backend,graph,workdir,"temp_"+str(seed))#The input file of this graph is compiled once, only the susceptances change between instances
+	for k, b in enumerate(telemetry.timed('sample',iter_instances(seed,start,stop,len(edges),mu,var))):
+		i = start+k
+		instance_start = time.time()
+
+		#We now try to solve them using phc (or the chosen backend), and determine how many real solutions there were
+		sols = solver.solve(b[None],telemetry)[0]
+		if k == 0 and root_counts['mixed_volume'] is None:
+			record_bound(canonical_id(graph),root_counts,'mixed_volume',getattr(solver,'mixed_volume',None))
+		record_solutions(freq_count,sols,tol,i,root_counts,telemetry,solver)
+		telemetry.instance(i,time.time()-instance_start)
 
 		#If verbose, we give a progress update every so often
 		if verbose:
-			if i%prog_checker == 0:
-				sys.stdout.write(str((float(i)/iters)*100)+' percent completed\n')
+			if k%prog_checker == 0:
+				sys.stdout.write(str((float(k)/iters)*100)+' percent completed\n')
 
+	return freq_count
 
-	#We now print the frequency count to the screen.
+#This generates iters many random equations according to the n-bus system
+#given by graph.
+#tol is the tolerance for certifying a number is real (ie. imaginary part < tol)
+#verbose indicates that it will tell you what percentage is done
+#backend is the solver (see backends.py): 'phc', 'bertini', 'phcpy', or 'native' for the in-process homotopy solver.
+#This method prints the distribution of real solutions to the screen, and adds it to the results store under graph_id.
+#The files of PHC are written to a workspace in the folder scratch (see workspace.py).
+#Stage timers, failure counters and throughput are reported to the sinks of telemetry (see telemetry.py).
+#If rule is a StoppingRule (see adaptive.py), the instances are solved in rounds until the distribution satisfies it,
+#and iters is only the maximal number of instances.
+#The root counts of the graph are cached in the results store under its canonical id (see bounds.py).
+#Instance i is drawn from the random stream of the run seed (see instance_susceptances in sampling.py), so it can be
+#solved again later with replay.py. The seed is drawn at random if not given, and printed with the distribution.
+def eq_loop(graph,iters,tol,n,mu,var,graph_id,verbose=False,backend='phc',scratch=None,telemetry=None,rule=None,seed=None):
+	if seed is None:
+		seed = np.random.randint(0,2**31-1)
+	run_start = time.time()
+	root_counts = get_bounds(graph,canonical_id(graph))
+	if verbose:
+		sys.stdout.write('Root counts: '+format_bounds(root_counts)+'\n')
+	if backend == 'native':
+		solve_round = lambda start, stop: native_loop(graph,tol,n,mu,var,seed,root_counts,(start,stop),verbose)
+	else:
+		workspace = Workspace(scratch)
+		if telemetry is None:
+			telemetry = Telemetry()
+		telemetry.begin(iters)
+		solve_round = lambda start, stop: solve_range(graph,tol,n,mu,var,seed,backend,root_counts,telemetry,(start,stop),workspace.path,verbose)
+
+	if rule is not None:
+		freq_count, iters = run_adaptive(solve_round,rule,iters,verbose=verbose)
+	else:
+		freq_count = solve_round(0,iters)
+
+	if backend != 'native':
+		workspace.close()
+		telemetry.end()
+
+	print_distribution(freq_count)
+	print "Seed: "+str(seed)
+	#The instances are solved one after the other, so the mean time per instance is the time of the run divided by iters
+	add_run('random_eqs',graph_id,freq_count,mu=mu,var=var,iters=iters,seconds=(time.time()-run_start)/max(1,iters))
+
+#We now print the frequency count to the screen.
+def print_distribution(freq_count):
 	num_roots_found = freq_count.keys()
 	num_roots_found.sort() #We sort from smallest number to largest number of real roots
 	print ""
@@ -156,8 +174,22 @@ parser.add_argument('-tol', type=float, dest="tol", default = 0.0000001) #What t
 parser.add_argument('-v',action='store_true', default=False, dest='verbose') #If verbose, it will tell you when it has done 10, 20, ... %
 parser.add_argument('-n', type=int,dest="n", default=4)#Number of buses
 parser.add_argument('-edges', dest="e", type=str, default="")#Edge structure, eg. "01,12,23" gives the complete 3-bus
+parser.add_argument('-edgefile', dest="edgefile", type=str, default="")#File with one edge per line, eg. the branch list of an IEEE test case (see graphs.py)
 parser.add_argument('-mu', dest="mu", type=int, default=0)#The mean of the random edges
 parser.add_argument('-var', dest="var", type=float, default=1)#The variance of the random edges
+parser.add_argument('-g', dest = "g", type=str, default="")#Graph id used in the results store
+parser.add_argument('-native',action='store_true', default=False, dest='native') #Solve in-process instead of calling PHC (for small n), same as -backend native
+parser.add_argument('-backend', dest="backend", choices=['phc','bertini','phcpy','native'], default='phc')#Solver, see backends.py
+parser.add_argument('-scratch', dest="scratch", type=str, default=None)#Folder for the scratch files, defaults to /dev/shm
+parser.add_argument('-telemetry', dest="telemetry", type=str, default="")#Where to report stage timings, eg. "stderr,json:Data/metrics.json"
+parser.add_argument('-telemetry_interval', type=float, dest="telemetry_interval", default=10)#Seconds between reports
+parser.add_argument('-adaptive',action='store_true', default=False, dest='adaptive') #Stop as soon as the distribution is known well enough
+parser.add_argument('-precision', type=float, dest="precision", default=None)#Largest allowed half-width of the confidence intervals
+parser.add_argument('-target', type=int, dest="target", default=None)#Number of real solutions that must be seen -target_hits times
+parser.add_argument('-target_hits', type=int, dest="target_hits", default=10)
+parser.add_argument('-confidence', type=float, dest="confidence", default=0.95)#Confidence level of the intervals
+parser.add_argument('-round', type=int, dest="round", default=100)#Smallest number of instances solved between two checks
+parser.add_argument('-seed', type=int, dest="seed", default=None)#Seed of the instances, drawn at random if not given (see replay.py)
 
 args = vars(parser.parse_args())
 iters = args["iters"]
@@ -165,24 +197,39 @@ verbose = args["verbose"]
 tol = args["tol"]
 n = args["n"]
 edge_string = args["e"]
+edge_file = args["edgefile"]
 mu = args["mu"]
 var = args["var"]
-
-#We now construct the edges corresponding to the edge string
-if len(edge_string) > 0:
-	edges = [(int(a[0]),int(a[1])) for a in edge_string.split(",")]
+backend = 'native' if args["native"] else args["backend"]
+g = args["g"]
+scratch = args["scratch"]
+telemetry = Telemetry(make_sinks(args["telemetry"]),args["telemetry_interval"])
+rule = None
+if args["adaptive"]:
+	precision = args["precision"]
+	if precision is None and args["target"] is None:
+		precision = 0.01
+	rule = StoppingRule(precision,args["target"],args["target_hits"],args["confidence"],args["round"])
+
+#We now construct the graph, from the edge file, the edge string, or the complete graph
+if len(edge_file) > 0:
+	graph = read_edge_file(edge_file)
+	n = graph.n
+	graph_id = os.path.basename(edge_file)
+elif len(edge_string) > 0:
+	graph = Graph(n,parse_edge_string(edge_string))
+	graph_id = edge_string
 else:
-	edges = [(i,j) for i in range(n) for j in range(i+1,n)]
-
-#This creates the adjacency matrix
-A = np.zeros([n,n])
-for e in edges:
-	A[e[0],e[1]] = A[e[1],e[0]] = 1
+	graph = complete_graph(n)
+	graph_id = 'K'+str(n)
+graph_id = canonical_id(graph,graph_id)
+if len(g) > 0:
+	graph_id = g
 
 #This is the main call of the algorithm
-eq_loop(A,iters,tol,n,mu,var,verbose=verbose)
+eq_loop(graph,iters,tol,n,mu,var,graph_id,verbose=verbose,backend=backend,scratch=scratch,telemetry=telemetry,rule=rule,seed=args["seed"])
 
-#To change the distribution of the variables, see the commented parts of random_pq_eqs.
+#To change the distribution of the variables, see sample_susceptances in sampling.py.
 #You can change to any of the distributions located at: https://docs.scipy.org/doc/numpy/reference/routines.random.html
 
 
@@ -0,0 +1,62 @@
+#Batched counting of the real roots of even polynomials.
+#
+#The eliminants we compare against are even polynomials in t,
+#	c8*t^8 + c6*t^6 + c4*t^4 + c2*t^2 + c0,
+#so they are quartics in s = t^2. A real root t corresponds to a positive real root s
+#(each s > 0 gives the two roots t = +sqrt(s) and t = -sqrt(s)), so instead of solving a degree 8
+#polynomial per instance we compute the eigenvalues of a stack of 4 x 4 companion matrices,
+#one per instance, in a single call.
+#
+#Eliminants of other graphs (see eliminants.py) need not be even, their real roots are counted with count_real_roots.
+#
+
+import numpy as np
+
+#Input: An array coeffs of shape (iters,d+1), row k holding the coefficients of a polynomial in s, highest degree first.
+#Output: An array of shape (iters,d) with the roots of each polynomial.
+#The leading coefficients must be nonzero.
+def stacked_roots(coeffs):
+	coeffs = np.asarray(coeffs,dtype=float)
+	iters, d = coeffs.shape[0], coeffs.shape[1]-1
+	companion = np.zeros([iters,d,d])
+	companion[:,0,:] = -coeffs[:,1:]/coeffs[:,:1]
+	companion[:,np.arange(1,d),np.arange(d-1)] = 1
+	return np.linalg.eigvals(companion)
+
+#Input: An array coeffs of shape (iters,d+1) with the columns c2d,...,c2,c0 of an even polynomial in t, eg. c8,c6,c4,c2,c0,
+#and the tolerance tol for certifying a root is real (ie. |imaginary part| <= tol, relative to the root if it is larger than 1)
+#Output: An array with the number of real roots t of each polynomial.
+def count_real_even_roots(coeffs,tol):
+	coeffs = np.atleast_2d(np.asarray(coeffs,dtype=float))
+	counts = np.zeros(coeffs.shape[0],dtype=int)
+
+	#The generic case, where the leading coefficient is nonzero
+	regular = coeffs[:,0] != 0
+	if regular.any():
+		s = stacked_roots(coeffs[regular])
+		is_real = np.abs(s.imag) <= tol*np.maximum(1,np.abs(s))
+		counts[regular] = 2*np.sum(is_real & (s.real > 0),axis=1)
+
+	#Polynomials of lower degree are rare, so we do those one at a time
+	for k in np.nonzero(~regular)[0]:
+		s = np.roots(coeffs[k])
+		is_real = np.abs(s.imag) <= tol*np.maximum(1,np.abs(s))
+		counts[k] = 2*np.sum(is_real & (s.real > 0))
+	return counts
+
+#Input: An array coeffs of shape (iters,d+1), row k holding the coefficients of a polynomial in t, highest degree first,
+#and the tolerance tol as in count_real_even_roots.
+#Output: An array with the number of real roots t of each polynomial.
+def count_real_roots(coeffs,tol):
+	coeffs = np.atleast_2d(np.asarray(coeffs,dtype=float))
+	counts = np.zeros(coeffs.shape[0],dtype=int)
+
+	regular = coeffs[:,0] != 0
+	if regular.any() and coeffs.shape[1] > 1:
+		t = stacked_roots(coeffs[regular])
+		counts[regular] = np.sum(np.abs(t.imag) <= tol*np.maximum(1,np.abs(t)),axis=1)
+
+	for k in np.nonzero(~regular)[0]:
+		t = np.roots(coeffs[k])
+		counts[k] = np.sum(np.abs(t.imag) <= tol*np.maximum(1,np.abs(t)))
+	return counts
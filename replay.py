@@ -0,0 +1,145 @@
+#Solves chosen instances of earlier runs again, without rerunning the rest of the run.
+#
+#Instance i of a run of bertini_solve, the compare scripts, random_eqs, find_eqs or shards.py is row i%BATCH_SIZE of a block
+#drawn from the random stream keyed by the seed of the run and i//BATCH_SIZE (see instance_susceptances in sampling.py).
+#The seed is recorded in the run log of bertini_solve and in the plan of a sharded run, random_eqs prints it with
+#the distribution and find_eqs with every instance it finds. Together with the number of real solutions of every instance in the
+#log (or the units of the queue), this finds eg. the rare instances of a run and solves just those again,
+#at higher precision or with another solver.
+#
+#To run this code, do one of the following:
+#python replay.py -log [LOG] -real [NUMBER OF REAL SOLUTIONS]	(a run log of bertini_solve or a compare script, see runlog.py)
+#python replay.py -queue [FOLDER] -real [NUMBER OF REAL SOLUTIONS]	(a sharded run, see shards.py)
+#python replay.py -n [NUMBER OF BUSES] -edges [EDGES] -seed [SEED] -instances [I,J,...] [-mu MU -var VAR]
+#With -log and -queue, -instances picks instances by index, -real those with that many real solutions,
+#and -failed those that failed.
+#
+#-backend chooses the solver (bertini by default, see backends.py), and -high_precision runs Bertini in
+#adaptive multiprecision with a tighter final tolerance (see HIGH_PRECISION in backends.py).
+#-eqs prints the equations of every instance, and -solutions its real solutions.
+#
+#Example : python replay.py -log Data/log_C4_886_Oct-17-2026_10:00:00 -real 12 -high_precision -solutions
+#This solves the instances of the run with 12 real solutions again and prints the 12 solutions of each.
+#
+
+import numpy as np
+import argparse
+import sys
+
+from graphs import Graph, complete_graph, parse_edge_string, read_edge_file, canonical_id
+from sampling import bus_incidence, instance_susceptances, pq_eqs
+from runlog import read_log, read_header
+from shards import read_plan, plan_graph, done_units
+from backends import BACKENDS, HIGH_PRECISION, make_backend
+from bounds import get_bounds, check_finite
+from phc_output import count_real
+from workspace import Workspace
+
+#Output: True if the instance with index i and number of real solutions real is one of those wanted.
+#indices is a set of indices (or None for all), want_real the wanted number of real solutions (or None for any),
+#and failed selects the failed instances instead.
+def _wanted(i,real,indices,want_real,failed):
+	if indices is not None and i not in indices:
+		return False
+	if failed:
+		return real is None
+	return want_real is None or real == want_real
+
+#Output: The graph of the run log at path and a list of (index, susceptances, number of real solutions) of the wanted instances.
+#The log holds the susceptances of every instance, so they are taken from there.
+def log_instances(path,indices=None,want_real=None,failed=False):
+	header = read_header(path)
+	graph = Graph(header['n'],[tuple(e) for e in header['edges']])
+	latest = {}
+	for rec in read_log(path):
+		latest[rec['i']] = rec#A resumed run logs its failed instances again
+	chosen = [(i,np.array(rec['b']),rec['real']) for i, rec in sorted(latest.items()) if _wanted(i,rec['real'],indices,want_real,failed)]
+	return graph, chosen
+
+#Output: The graph of the sharded run in the folder queue and a list of (index, susceptances, number of real solutions)
+#of the wanted instances among the units that are done.
+def queue_instances(queue,indices=None,want_real=None,failed=False):
+	plan = read_plan(queue)
+	graph = plan_graph(plan)
+	found = []
+	for result in done_units(queue):
+		found += [(result['start']+k,real) for k, real in enumerate(result['real']) if _wanted(result['start']+k,real,indices,want_real,failed)]
+	b = instance_susceptances(plan['seed'],[i for i, real in found],len(graph.edges),plan['mu'],plan['var'])
+	return graph, [(i,b[k],real) for k, (i, real) in enumerate(found)]
+
+#Solves the instances, a list of (index, susceptances, number of real solutions or None), of graph again with solver
+#and prints how many real solutions each has now.
+def replay(graph,instances,solver,tol,root_counts,seed=None,eqs=False,solutions=False):
+	incidence = bus_incidence(graph.n,graph.edges)
+	b = np.array([row for i, row, real in instances]).reshape(len(instances),len(graph.edges))
+	for (i, row, real), sols in zip(instances,solver.solve(b)):
+		line = 'Instance '+str(i)+('' if seed is None else ' (seed '+str(seed)+')')+': '
+		if sols is None:
+			print line+'could not read the solutions'
+			continue
+		number_real = count_real(sols,tol)
+		line += str(number_real)+' real solutions, '+str(sols.shape[0])+' finite'
+		if real is not None:
+			line += ' (was '+str(real)+')'
+		failure = check_finite(root_counts,sols.shape[0],number_real)
+		if failure is not None:
+			line += ', '+failure+' solutions, the generic count is '+str(root_counts['generic'])
+		print line
+		if eqs:
+			for eq in pq_eqs(incidence,row):
+				print '  '+eq
+		if solutions:
+			for sol in sols[np.all(np.abs(sols.imag) <= tol,axis=1)].real:
+				print '  '+' '.join(['%.15g' % v for v in sol])
+
+#Here we take the arguments passed via the command line.
+parser = argparse.ArgumentParser()
+parser.add_argument('-log', dest="log", type=str, default=None)#Run log of bertini_solve to take the instances from
+parser.add_argument('-queue', dest="queue", type=str, default=None)#Queue folder of a sharded run to take the instances from
+parser.add_argument('-seed', type=int, dest="seed", default=None)#Seed of the run, if neither -log nor -queue is given
+parser.add_argument('-instances', dest="instances", type=str, default="")#Comma separated indices of the instances, eg. "17,2041"
+parser.add_argument('-real', type=int, dest="real", default=None)#Only the instances with this many real solutions
+parser.add_argument('-failed',action='store_true', default=False, dest='failed')#Only the instances that failed
+parser.add_argument('-n', type=int,dest="n", default=4)#Number of buses
+parser.add_argument('-edges', dest="e", type=str, default="")#Edges structure, eg. "0,1:1,2:2,3"
+parser.add_argument('-edgefile', dest="edgefile", type=str, default="")#File with one edge per line (see graphs.py)
+parser.add_argument('-mu', dest="mu", type=int, default=0)#The mean of the random edges of the run
+parser.add_argument('-var', dest="var", type=float, default=1)#The variance of the random edges of the run
+parser.add_argument('-tol', type=float, dest="tol", default = 0.0000001) #What tolerance should we use to determine if something is a real solution
+parser.add_argument('-backend', dest="backend", choices=BACKENDS, default='bertini')#Solver, see backends.py
+parser.add_argument('-high_precision',action='store_true', default=False, dest='high_precision')#Bertini in adaptive multiprecision
+parser.add_argument('-eqs',action='store_true', default=False, dest='eqs')#Print the equations of every instance
+parser.add_argument('-solutions',action='store_true', default=False, dest='solutions')#Print the real solutions of every instance
+parser.add_argument('-scratch', dest="scratch", type=str, default=None)#Folder for the scratch files, defaults to /dev/shm
+
+args = vars(parser.parse_args())
+indices = set(int(i) for i in args["instances"].split(',')) if len(args["instances"]) > 0 else None
+if args["high_precision"] and args["backend"] != 'bertini':
+	parser.error('-high_precision needs -backend bertini')
+
+seed = None
+if args["log"] is not None:
+	graph, instances = log_instances(args["log"],indices,args["real"],args["failed"])
+	seed = read_header(args["log"]).get('seed')
+elif args["queue"] is not None:
+	graph, instances = queue_instances(args["queue"],indices,args["real"],args["failed"])
+	seed = read_plan(args["queue"])['seed']
+else:
+	if args["seed"] is None or indices is None:
+		parser.error('Give the run with -log or -queue, or its -seed and the -instances to solve')
+	if len(args["edgefile"]) > 0:
+		graph = read_edge_file(args["edgefile"])
+	elif len(args["e"]) > 0:
+		graph = Graph(args["n"],parse_edge_string(args["e"]))
+	else:
+		graph = complete_graph(args["n"])
+	seed = args["seed"]
+	b = instance_susceptances(seed,sorted(indices),len(graph.edges),args["mu"],args["var"])
+	instances = [(i,b[k],None) for k, i in enumerate(sorted(indices))]
+
+if not instances:
+	sys.exit('No instances to solve')
+print 'Solving '+str(len(instances))+' instances again'
+with Workspace(args["scratch"],'replay') as workspace:
+	solver = make_backend(args["backend"],graph,workspace.path,'replay',HIGH_PRECISION if args["high_precision"] else None)
+	replay(graph,instances,solver,args["tol"],get_bounds(graph,canonical_id(graph)),seed,args["eqs"],args["solutions"])
@@ -0,0 +1,181 @@
+#A local SQLite store of the distributions computed by the drivers.
+#
+#Every run adds its distribution to Data/results.db, indexed by graph-id, (mu, var) and the script
+#that produced it, so merging all results with the same graph-id is a single query instead of
+#globbing and parsing the Data/dist_* and Data/compare_* files.
+#
+#To see the merged distribution of a graph, do the following:
+#python results_db.py query -g [GRAPH-ID] [-script SCRIPT] [-mu MU -var VAR]
+#
+#To list the graphs in the store with their number of runs and instances:
+#python results_db.py list
+#
+#To add the text files written before the store existed (each file is only imported once):
+#python results_db.py import Data/dist_* Data/compare_*
+#
+
+import sqlite3
+import argparse
+import time
+import os
+import re
+
+DB_PATH = 'Data/results.db'
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+	run_id INTEGER PRIMARY KEY,
+	graph_id TEXT NOT NULL,
+	script TEXT NOT NULL,
+	mu REAL NOT NULL,
+	var REAL NOT NULL,
+	iters INTEGER,
+	timestamp TEXT,
+	source TEXT UNIQUE,
+	seconds REAL
+);
+CREATE INDEX IF NOT EXISTS runs_key ON runs (graph_id, mu, var, script);
+CREATE TABLE IF NOT EXISTS counts (
+	run_id INTEGER NOT NULL REFERENCES runs(run_id),
+	num_real INTEGER NOT NULL,
+	num_elim INTEGER,
+	freq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS counts_run ON counts (run_id);
+'''
+
+#Opens (and if needed creates) the store at path.
+#Stores made before runs had a seconds column get it, empty for their runs.
+def connect(path=DB_PATH):
+	conn = sqlite3.connect(path,timeout=60)
+	conn.executescript(_SCHEMA)
+	if 'seconds' not in [row[1] for row in conn.execute('PRAGMA table_info(runs)')]:
+		try:
+			conn.execute('ALTER TABLE runs ADD COLUMN seconds REAL')
+		except sqlite3.OperationalError:
+			pass#Another process added it meanwhile
+	return conn
+
+#Adds one run to the store.
+#freq_count maps a number of real solutions, or a pair (real solutions, real eliminant roots), to its frequency.
+#source identifies where the run came from (eg. the file it was imported from), a source is only added once.
+#seconds is the mean time in seconds the run took per instance, if it was measured.
+#Output: The id of the new run, or None if source was already in the store.
+def add_run(script,graph_id,freq_count,mu=0,var=1,iters=None,timestamp=None,source=None,seconds=None,path=DB_PATH):
+	if timestamp is None:
+		timestamp = time.strftime('%b-%d-%Y_%H:%M:%S',time.localtime())
+	conn = connect(path)
+	try:
+		with conn:
+			try:
+				cur = conn.execute('INSERT INTO runs (graph_id,script,mu,var,iters,timestamp,source,seconds) VALUES (?,?,?,?,?,?,?,?)',
+					(graph_id,script,float(mu),float(var),iters,timestamp,source,seconds))
+			except sqlite3.IntegrityError:
+				return None
+			run_id = cur.lastrowid
+			rows = []
+			for k, freq in freq_count.items():
+				real, elim = k if isinstance(k,tuple) else (k,None)
+				rows.append((run_id,int(real),None if elim is None else int(elim),int(freq)))
+			conn.executemany('INSERT INTO counts (run_id,num_real,num_elim,freq) VALUES (?,?,?,?)',rows)
+		return run_id
+	finally:
+		conn.close()
+
+#Output: The distribution of all runs of graph_id merged together, as a dictionary {number of real solutions : frequency}.
+#If elim is True the keys are pairs (real solutions, real eliminant roots) instead, from the compare scripts.
+#script, mu and var restrict the runs that are merged.
+def distribution(graph_id,script=None,mu=None,var=None,elim=False,path=DB_PATH):
+	query = 'SELECT c.num_real, %s, SUM(c.freq) FROM runs r JOIN counts c ON c.run_id = r.run_id WHERE r.graph_id = ?' % ('c.num_elim' if elim else 'NULL')
+	params = [graph_id]
+	for column, value in [('script',script),('mu',mu),('var',var)]:
+		if value is not None:
+			query += ' AND r.'+column+' = ?'
+			params.append(value)
+	query += ' GROUP BY c.num_real'+(', c.num_elim' if elim else '')
+	conn = connect(path)
+	try:
+		rows = conn.execute(query,params).fetchall()
+	finally:
+		conn.close()
+	return dict(((real,num_elim) if elim else real,freq) for real, num_elim, freq in rows)
+
+#Output: The number of instances of graph_id in the store, over the runs selected by script, mu and var.
+def num_instances(graph_id,script=None,mu=None,var=None,path=DB_PATH):
+	return sum(distribution(graph_id,script,mu,var,path=path).values())
+
+#Output: The mean time in seconds per instance of the timed runs of graph_id selected by script, mu and var
+#(weighted by their number of instances), or None if none of them was timed.
+def instance_seconds(graph_id,script=None,mu=None,var=None,path=DB_PATH):
+	query = 'SELECT SUM(seconds*iters), SUM(iters) FROM runs WHERE graph_id = ? AND seconds IS NOT NULL AND iters > 0'
+	params = [graph_id]
+	for column, value in [('script',script),('mu',mu),('var',var)]:
+		if value is not None:
+			query += ' AND '+column+' = ?'
+			params.append(value)
+	conn = connect(path)
+	try:
+		total, iters = conn.execute(query,params).fetchone()
+	finally:
+		conn.close()
+	return float(total)/iters if iters else None
+
+#Output: A list of (graph_id, script, mu, var, number of runs, number of instances) for everything in the store.
+def summary(path=DB_PATH):
+	conn = connect(path)
+	try:
+		return conn.execute('''SELECT r.graph_id, r.script, r.mu, r.var, COUNT(DISTINCT r.run_id), SUM(c.freq)
+			FROM runs r JOIN counts c ON c.run_id = r.run_id
+			GROUP BY r.graph_id, r.script, r.mu, r.var ORDER BY r.graph_id''').fetchall()
+	finally:
+		conn.close()
+
+#The names of the files the drivers write into Data, the timestamp is formatted as '%b-%d-%Y_%H:%M:%S'
+_DATA_FILE = re.compile(r'^(dist|compare_elim|compare)_(.*)_([A-Za-z]{3}-\d{2}-\d{4}_\d{2}:\d{2}:\d{2})$')
+
+#Adds a Data/dist_(graph-id)_(timestamp) or Data/compare_(graph-id)_(timestamp) file to the store.
+#compare_poly_full.py writes Data/compare_k4minus1_(timestamp) for K4 minus an edge and
+#Data/compare_elim_(graph-id)_(timestamp) for other graphs, compare_poly_full_all.py the other compare files.
+#Runs added by the drivers record their file as source, so those are not imported a second time.
+#Output: The id of the new run, or None if the file was imported before.
+def import_file(filename,path=DB_PATH):
+	kind, graph_id, timestamp = _DATA_FILE.match(os.path.basename(filename)).groups()
+	if kind == 'dist':
+		script = 'bertini_solve'
+	elif kind == 'compare_elim':
+		script = 'compare_poly_full'
+	else:
+		script = 'compare_poly_full' if graph_id == 'k4minus1' else 'compare_poly_full_all'
+	freq_count = {}
+	with open(filename,'r') as f:
+		for line in f:
+			if ':' not in line:
+				continue
+			k, freq = line.rsplit(':',1)
+			numbers = [int(x) for x in re.findall(r'-?\d+',k)]
+			freq_count[numbers[0] if len(numbers) == 1 else tuple(numbers)] = int(freq)
+	return add_run(script,graph_id,freq_count,timestamp=timestamp,source=os.path.abspath(filename),path=path)
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser()
+	parser.add_argument('command', choices=['query','list','import'])
+	parser.add_argument('files', nargs='*')#Files to import
+	parser.add_argument('-db', dest="db", type=str, default=DB_PATH)
+	parser.add_argument('-g', dest="g", type=str, default="")#Graph id to query
+	parser.add_argument('-script', dest="script", type=str, default=None)
+	parser.add_argument('-mu', dest="mu", type=float, default=None)
+	parser.add_argument('-var', dest="var", type=float, default=None)
+	parser.add_argument('-elim', action='store_true', default=False, dest='elim')#Query the (real, eliminant) pairs of the compare scripts
+	args = parser.parse_args()
+
+	if args.command == 'query':
+		dist = distribution(args.g,args.script,args.mu,args.var,args.elim,path=args.db)
+		for k in sorted(dist.keys()):
+			print(str(k) + ' : ' + str(dist[k]))
+	elif args.command == 'list':
+		for row in summary(args.db):
+			print(' '.join([str(x) for x in row]))
+	else:
+		for filename in args.files:
+			if import_file(filename,path=args.db) is None:
+				print('Already imported '+filename)
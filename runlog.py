@@ -0,0 +1,99 @@
+#A line-oriented log of every solved instance, so that long runs survive crashes.
+#
+#Every instance is appended to the log as soon as it is solved, as one JSON object per line:
+#	{"seed": run seed, "i": index, "b": susceptances, "real": number of real solutions,
+#	 "elim": real eliminant roots (compare scripts only), "time": seconds spent on the instance}
+#The first line is a header recording the graph the run belongs to.
+#
+#Each line is written with a single os.write on a file opened with O_APPEND, so several worker
+#processes can share one log. If a run is killed, at worst the last line is cut off, and
+#read_log skips it. Passing the log to -resume skips the instances it already contains and
+#rebuilds the distribution from it. The first record of the resumed run starts on a new line, so it is not
+#glued onto the cut off line.
+#
+
+import json
+import os
+
+#Output: True if the file at path is empty or its last line is complete.
+def _ends_in_newline(path):
+	with open(path,'rb') as f:
+		f.seek(0,os.SEEK_END)
+		if f.tell() == 0:
+			return True
+		f.seek(-1,os.SEEK_END)
+		return f.read(1) == b'\n'
+
+class RunLog(object):
+	#path is the file to append to. done is a dictionary {index : record} of instances already in the log.
+	def __init__(self,path,seed,done=None):
+		self.path = path
+		self.seed = seed
+		self.done = done if done is not None else {}
+		self._fd = None
+		self._pid = None
+
+	#Forked workers must not share the parent's descriptor, so the file is (re)opened in every process.
+	#If the log of a killed run ends in a cut off line, a newline is written first.
+	def _write(self,obj):
+		if self._pid != os.getpid():
+			self._fd = os.open(self.path,os.O_WRONLY|os.O_APPEND|os.O_CREAT,0o644)
+			self._pid = os.getpid()
+			if not _ends_in_newline(self.path):
+				os.write(self._fd,b'\n')
+		os.write(self._fd,(json.dumps(obj)+'\n').encode('ascii'))
+
+	#Writes the header of a new log.
+	def header(self,**info):
+		info['header'] = True
+		self._write(info)
+
+	#Returns True if instance i was already solved in an earlier run.
+	def is_done(self,i):
+		return i in self.done
+
+	#Appends the result of instance i with susceptances b to the log.
+	#real is None if the instance failed, so that a resumed run tries it again.
+	def record(self,i,b,real,elim=None,elapsed=None):
+		rec = {'seed':self.seed,'i':int(i),'b':[float(v) for v in b],'real':real}
+		if elim is not None:
+			rec['elim'] = int(elim)
+		if elapsed is not None:
+			rec['time'] = round(elapsed,6)
+		self._write(rec)
+
+	def __getstate__(self):
+		state = self.__dict__.copy()
+		state['_fd'] = None
+		state['_pid'] = None
+		return state
+
+#Yields the records of the log at path, skipping the header and a possibly truncated last line.
+def read_log(path):
+	with open(path,'r') as f:
+		for line in f:
+			try:
+				rec = json.loads(line)
+			except ValueError:
+				continue
+			if not rec.get('header',False):
+				yield rec
+
+#Output: The header of the log at path.
+def read_header(path):
+	with open(path,'r') as f:
+		return json.loads(f.readline())
+
+#Output: A dictionary {index : record} of the instances of the log at path that were solved successfully.
+def completed(path):
+	return dict((rec['i'],rec) for rec in read_log(path) if rec['real'] is not None)
+
+#Rebuilds the distribution of real solutions from records (eg. completed(path).values()).
+#key maps a record to the entry of the frequency count it belongs to, records for which it returns None are skipped.
+def rebuild_counts(records,key):
+	freq_count = {}
+	for rec in records:
+		k = key(rec)
+		if k is not None:
+			freq_count[k] = freq_count.get(k,0) + 1
+	return freq_count
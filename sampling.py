@@ -0,0 +1,97 @@
+#Vectorized sampling of the random susceptances.
+#
+#Instead of filling a dense n x n matrix B edge by edge for every instance, we draw the
+#susceptances of all instances at once as an array b of shape (iters,|E|), where
+#b[k,e] is the susceptance of edge e in instance k. The edges are ordered as in
+#adjacency_edges, which is the order the old loops over A visited them in, so for the
+#same random state we generate exactly the same instances as before.
+#
+
+import numpy as np
+
+BATCH_SIZE = 10000 #Number of instances drawn per call to np.random.normal
+
+#Input: Matrix A describing the adjacency of the graph.
+#Output: The list of edges (i,j) with i < j, in row-major order.
+def adjacency_edges(A):
+	rows, cols = np.nonzero(np.triu(A,1))
+	return list(zip(rows.tolist(),cols.tolist()))
+
+#Input: The number of buses n and the list of edges.
+#Output: For each bus i, the list of pairs (j,e) where j is a neighbour of i and e is the index of the edge {i,j}.
+#The neighbours are sorted, so the equations come out in the same order as before.
+def bus_incidence(n,edges):
+	incidence = [[] for i in range(n)]
+	for e, (i,j) in enumerate(edges):
+		incidence[i].append((j,e))
+		incidence[j].append((i,e))
+	for inc in incidence:
+		inc.sort()
+	return incidence
+
+#Input: The list of edges and a list of edges we want to look up.
+#Output: The columns of the susceptance array corresponding to wanted.
+#For example the k4minus1 eliminant wants b = [B[0,1],B[0,3],B[1,2],B[1,3],B[2,3]].
+def edge_columns(edges,wanted):
+	index = dict(((min(e),max(e)),k) for k, e in enumerate(edges))
+	return [index[(min(e),max(e))] for e in wanted]
+
+#Output: An array of shape (iters,num_edges) of susceptances drawn in one vectorized call.
+def sample_susceptances(num_edges,iters,mu=0,var=1):
+	### This distribution controls the susceptances ###
+	return np.random.normal(mu,var,size=(iters,num_edges))
+
+#Output: An array of shape (iters,num_edges) of susceptances drawn from the random stream with the given key.
+#The same key always gives the same instances, whatever machine or process draws them, and different keys give independent streams.
+def seeded_susceptances(key,num_edges,iters,mu=0,var=1):
+	return np.random.RandomState(key).normal(mu,var,size=(iters,num_edges))
+
+#Output: An array of shape (BATCH_SIZE,num_edges) with the susceptances of the instances of block j of the run seed,
+#ie. the instances j*BATCH_SIZE,...,(j+1)*BATCH_SIZE-1, drawn in one call from the stream with key [seed, j].
+def instance_block(seed,j,num_edges,mu=0,var=1):
+	return seeded_susceptances([seed,int(j)],num_edges,BATCH_SIZE,mu,var)
+
+#Output: An array of shape (len(indices),num_edges) with the susceptances of the instances indices of the run seed.
+#Instance i is row i%BATCH_SIZE of block i//BATCH_SIZE (see instance_block), so any instance can be regenerated on its own
+#(see replay.py), and the instances do not depend on how a run is split over workers, rounds or nodes.
+#Changing BATCH_SIZE changes the instances of every seed.
+def instance_susceptances(seed,indices,num_edges,mu=0,var=1):
+	indices = np.asarray(indices,dtype=np.int64)
+	b = np.empty((len(indices),num_edges))
+	blocks = indices//BATCH_SIZE
+	for j in np.unique(blocks):
+		rows = np.nonzero(blocks == j)[0]
+		b[rows] = instance_block(seed,j,num_edges,mu,var)[indices[rows]%BATCH_SIZE]
+	return b
+
+#Yields the susceptances of the instances range(start,stop) of the run seed as arrays of at most BATCH_SIZE rows,
+#with one draw per block (see instance_block).
+def iter_instance_batches(seed,start,stop,num_edges,mu=0,var=1):
+	s = start
+	while s < stop:
+		j = s//BATCH_SIZE
+		e = min(stop,(j+1)*BATCH_SIZE)
+		yield instance_block(seed,j,num_edges,mu,var)[s-j*BATCH_SIZE:e-j*BATCH_SIZE]
+		s = e
+
+#Yields the susceptances of the instances range(start,stop) of the run seed one row at a time.
+def iter_instances(seed,start,stop,num_edges,mu=0,var=1):
+	for batch in iter_instance_batches(seed,start,stop,num_edges,mu,var):
+		for b in batch:
+			yield b
+
+#Input: The bus incidence (see bus_incidence) and one row b of susceptances.
+#Output: A list of strings corresponding to the equations of this instance.
+#The format of the strings is amenable to Bertini and PHC.
+def pq_eqs(incidence,b):
+	n = len(incidence)
+	x = ['1']+['x'+str(i) for i in range(1,n)]
+	y = ['0']+['y'+str(i) for i in range(1,n)]
+
+	f = []
+	h = []
+	for i in range(1,n):
+		p_eq = '0'+''.join(["+("+str(b[e])+")*("+x[j]+"*"+y[i]+"-"+x[i]+"*"+y[j]+")" for j, e in incidence[i]])
+		f.append(p_eq)
+		h.append(x[i]+"^2+"+y[i]+"^2-1")
+	return f+h
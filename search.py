@@ -0,0 +1,92 @@
+#Guided search for instances with a target number of real solutions.
+#
+#Plain rejection sampling draws every instance from N(mu,var) and hopes to hit the target, which
+#is hopeless when the target (eg. the maximal number of real solutions) is rare. Instead, we use the
+#cross-entropy method: the susceptances of a generation are drawn from N(mean,std^2), with a separate
+#mean and standard deviation for every edge. After every generation the fraction elite of the
+#instances that came closest to the target are kept, and mean and std are moved towards their
+#mean and standard deviation (by the factor smoothing), so the sampling distribution drifts
+#towards the region of susceptances where the target is common.
+#
+#The first generation is drawn from N(mu,var), ie. it is plain sampling, and its hit rate is
+#reported next to the hit rate of the later generations, so the gain over plain sampling can be read off.
+#std is kept above min_std times the mean absolute susceptance, so the search does not collapse onto a single point.
+#
+
+import numpy as np
+import sys
+
+#Output: For every number of real solutions in counts, how close it is to target (higher is better).
+#Failed instances (None) get the lowest score.
+def score(counts,target):
+	return np.array([-abs(c-target) if c is not None else -np.inf for c in counts],dtype=float)
+
+class CrossEntropySearch(object):
+	def __init__(self,num_edges,target,population=50,elite=0.2,smoothing=0.7,min_std=0.05,mu=0,var=1):
+		self.target = target
+		self.population = population
+		self.num_elite = max(2,int(round(elite*population)))
+		self.smoothing = smoothing
+		self.min_std = min_std
+		self.mean = np.zeros(num_edges)+mu
+		self.std = np.zeros(num_edges)+var
+		self.generation = 0
+
+	#Output: An array of shape (population,num_edges) with the susceptances of the next generation.
+	def ask(self):
+		return np.random.normal(self.mean,self.std,size=(self.population,len(self.mean)))
+
+	#Updates the sampling distribution from the susceptances b of a generation and their numbers of real solutions.
+	def tell(self,b,counts):
+		s = score(counts,self.target)
+		order = np.lexsort((np.random.random(len(s)),-s))#Ties are broken at random
+		elite = b[order[:self.num_elite]]
+		a = self.smoothing
+		self.mean = (1-a)*self.mean + a*elite.mean(axis=0)
+		self.std = (1-a)*self.std + a*elite.std(axis=0)
+		self.std = np.maximum(self.std,self.min_std*max(np.abs(self.mean).mean(),1e-3))
+		self.generation += 1
+
+#Searches for instances with target real solutions, solving at most iters instances.
+#count_fn(b) must return the numbers of real solutions (None for failures) of the rows of the array b.
+#on_hit(b) is called with the susceptances of every instance that hits the target.
+#If stop_after > 0, the search stops once that many hits were found.
+#Output: A dictionary with the number of solves and hits of plain sampling (the first generation) and of the guided generations.
+def search(count_fn,num_edges,target,iters,population=50,elite=0.2,smoothing=0.7,min_std=0.05,mu=0,var=1,on_hit=None,stop_after=0,verbose=False):
+	ce = CrossEntropySearch(num_edges,target,population,elite,smoothing,min_std,mu,var)
+	stats = {'plain_solves':0,'plain_hits':0,'guided_solves':0,'guided_hits':0,'best':None}
+	solves = 0
+	while solves < iters:
+		b = ce.ask()[:iters-solves]
+		counts = list(count_fn(b))
+		kind = 'plain' if ce.generation == 0 else 'guided'
+		for row, c in zip(b,counts):
+			if c is not None and (stats['best'] is None or abs(c-target) < abs(stats['best']-target)):
+				stats['best'] = c
+			if c == target:
+				stats[kind+'_hits'] += 1
+				if on_hit is not None:
+					on_hit(row)
+		stats[kind+'_solves'] += len(counts)
+		solves += len(counts)
+		if verbose:
+			sys.stdout.write('Generation '+str(ce.generation)+': '+str(counts.count(target))+'/'+str(len(counts))+' hits, closest so far '+str(stats['best'])+'\n')
+		if stop_after > 0 and stats['plain_hits']+stats['guided_hits'] >= stop_after:
+			break
+		ce.tell(b,counts)
+	return stats
+
+#Output: The statistics of search as lines of text, including the gain in hit rate over plain sampling.
+def format_stats(stats):
+	lines = []
+	rates = {}
+	for kind in ['plain','guided']:
+		if stats[kind+'_solves'] > 0:
+			rates[kind] = float(stats[kind+'_hits'])/stats[kind+'_solves']
+			lines.append('Hit rate, %s sampling: %d/%d = %.4f' % (kind,stats[kind+'_hits'],stats[kind+'_solves'],rates[kind]))
+	if 'guided' in rates:
+		if rates['plain'] > 0:
+			lines.append('Gain over plain sampling: x%.1f' % (rates['guided']/rates['plain']))
+		elif rates['guided'] > 0:
+			lines.append('Gain over plain sampling: plain sampling found no hits in its generation')
+	return lines
@@ -0,0 +1,306 @@
+#Sharded runs: one large run spread over many machines through a work queue in a shared folder.
+#
+#The coordinator splits the instances of a run into units of -unit instances and writes them to a queue folder
+#on a filesystem all nodes can see (any local folder works just as well, eg. to test on one machine):
+#	(queue)/plan.json		the graph, the solver backend, the root counts (see bounds.py) and the run seed,
+#	(queue)/todo/unit_(k).json	the units not claimed yet,
+#	(queue)/claimed/unit_(k).json	the units a worker is solving,
+#	(queue)/done/unit_(k).json	the results of the units that are done.
+#A worker claims a unit by renaming it from todo to claimed, which is atomic, so every unit is solved exactly once
+#however many workers on however many nodes take from the queue. The result is written next to its final name and
+#renamed into done, so a unit is never seen half written.
+#
+#Instance i is drawn from the random stream of the plan's seed (see instance_susceptances in sampling.py),
+#so the whole run is determined by the seed in plan.json: the units do not overlap, and any unit can be solved
+#again on any node with the same result. The number of real solutions of every instance is kept in its unit,
+#so eg. python replay.py -queue [FOLDER] -real 14 solves the rare instances again (see replay.py).
+#The merge step adds up the units and adds the distribution to the results store Data/results.db
+#(see results_db.py), like a run of the drivers.
+#
+#With plan -archive, the workers also store the susceptances and all finite solutions of every instance in the
+#archive (queue)/archive (see archive.py), every worker in its own chunks.
+#
+#To run this code, do the following:
+#python shards.py plan -queue [FOLDER] -n [NUMBER OF BUSES] -iters [NUMBER OF ITERATIONS] -unit [INSTANCES PER UNIT]
+#	[-edges EDGES | -edgefile FILE] [-backend bertini] [-mu 0 -var 1] [-seed SEED] [-archive]
+#python shards.py work -queue [FOLDER] [-jobs 8]	(on every node, from the folder holding bertini and phc)
+#python shards.py status -queue [FOLDER]
+#python shards.py requeue -queue [FOLDER] -older_than [SECONDS]	(puts back units whose worker died)
+#python shards.py merge -queue [FOLDER]
+#
+#Example : python shards.py plan -queue /shared/k6 -n 6 -iters 1000000 -unit 5000 -backend bertini
+#This writes 200 units of 5000 instances of K6. Then python shards.py work -queue /shared/k6 -jobs 16 on
+#each node solves units until the queue is empty, and python shards.py merge -queue /shared/k6 stores the result.
+#The distribution is stored under -script (bertini_solve by default, random_eqs for other -mu and -var),
+#so it merges with the runs of that driver. The parameter homotopy of bertini_solve is not used here.
+#
+
+import numpy as np
+import multiprocessing
+import argparse
+import socket
+import errno
+import json
+import time
+import sys
+import os
+
+from graphs import Graph, complete_graph, parse_edge_string, read_edge_file, canonical_id
+from sampling import instance_susceptances
+from backends import BACKENDS, make_backend, record_solutions
+from bounds import get_bounds
+from parallel import merge_counts
+from telemetry import Telemetry
+from workspace import Workspace
+from results_db import add_run
+from archive import ArchiveWriter, create_archive
+
+TODO = 'todo'
+CLAIMED = 'claimed'
+DONE = 'done'
+ARCHIVE = 'archive'
+
+#Writes obj as JSON to path, through a temporary file in the same folder, so readers never see it half written.
+def _write_json(path,obj):
+	folder, name = os.path.split(path)
+	tmp = os.path.join(folder,'.'+name+'.'+socket.gethostname()+'_'+str(os.getpid()))
+	with open(tmp,'w') as f:
+		json.dump(obj,f)
+	os.rename(tmp,path)
+
+def _read_json(path):
+	with open(path,'r') as f:
+		return json.load(f)
+
+#Output: The names of the units in the folder (todo, claimed or done) of the queue.
+def _units(queue,folder):
+	return sorted(name for name in os.listdir(os.path.join(queue,folder)) if name.startswith('unit_'))
+
+#Output: The plan of the queue.
+def read_plan(queue):
+	return _read_json(os.path.join(queue,'plan.json'))
+
+#Output: The graph of the plan.
+def plan_graph(plan):
+	return Graph(plan['n'],[tuple(e) for e in plan['edges']])
+
+#Writes the plan and the units of a run of iters instances of graph to the folder queue, which must not exist yet.
+#seed determines all instances of the run, and is drawn at random (and recorded in the plan) if it is None.
+#If archive is True, the solutions of every instance are stored in the archive (queue)/archive (see archive.py).
+#Output: The plan.
+def make_queue(queue,graph,graph_id,iters,unit,backend='bertini',mu=0,var=1,tol=1e-7,seed=None,script='bertini_solve',archive=False):
+	if seed is None:
+		seed = np.random.randint(0,2**31-1)
+	os.makedirs(queue)
+	for folder in [TODO,CLAIMED,DONE]:
+		os.mkdir(os.path.join(queue,folder))
+	plan = {
+		'graph_id' : graph_id,
+		'n' : graph.n,
+		'edges' : graph.edges,
+		'iters' : iters,
+		'unit' : unit,
+		'num_units' : (iters+unit-1)//unit,
+		'seed' : int(seed),
+		'backend' : backend,
+		'mu' : mu,
+		'var' : var,
+		'tol' : tol,
+		'script' : script,
+		'archive' : archive,
+		'root_counts' : get_bounds(graph,canonical_id(graph)),#Workers on other nodes may not have the results store
+		'created' : time.strftime('%b-%d-%Y_%H:%M:%S',time.localtime()),
+	}
+	if archive:
+		create_archive(os.path.join(queue,ARCHIVE),graph,graph_id=graph_id,seed=plan['seed'],mu=mu,var=var)
+	_write_json(os.path.join(queue,'plan.json'),plan)
+	for k in range(plan['num_units']):
+		start = k*unit
+		_write_json(os.path.join(queue,TODO,'unit_%06d.json' % k),{'unit':k,'start':start,'stop':min(start+unit,iters)})
+	return plan
+
+#Claims the next unit of the queue.
+#Output: The path of the claimed unit, or None if there are no units left.
+def claim(queue):
+	for name in _units(queue,TODO):
+		path = os.path.join(queue,CLAIMED,name)
+		try:
+			os.rename(os.path.join(queue,TODO,name),path)
+		except OSError as e:
+			if e.errno == errno.ENOENT:#Another worker claimed it first
+				continue
+			raise
+		os.utime(path,None)#The claim time, which requeue goes by
+		return path
+	return None
+
+#Solves the instances of the unit inside workdir with solver, the backend made for the graph of plan.
+#The solutions of every instance are added to writer, if given (see archive.py).
+#Output: The result of the unit: its frequency count, the number of real solutions of every instance (None if it failed),
+#the failures by kind, and where and how long it was solved.
+def solve_unit(plan,unit,solver,workdir='.',writer=None):
+	telemetry = Telemetry()
+	telemetry.begin(unit['stop']-unit['start'])
+	b = instance_susceptances(plan['seed'],range(unit['start'],unit['stop']),len(plan['edges']),plan['mu'],plan['var'])
+	if plan['backend'] == 'native':
+		solutions = solver.solve(b,telemetry)
+	else:
+		solutions = (solver.solve(row[None],telemetry)[0] for row in b)
+	freq_count = {}
+	real = []
+	for k, sols in enumerate(solutions):
+		real.append(record_solutions(freq_count,sols,plan['tol'],unit['start']+k,plan['root_counts'],telemetry,solver))
+		if writer is not None:
+			writer.add(unit['start']+k,b[k],sols)
+	if writer is not None:
+		writer.flush()#The solutions are archived before the unit is done
+	snapshot = telemetry.end()
+	result = dict(unit)
+	result.update({
+		'counts' : dict((str(k),v) for k, v in freq_count.items()),
+		'real' : real,
+		'failures' : snapshot['failures'],
+		'elapsed' : snapshot['elapsed'],
+		'host' : socket.gethostname(),
+		'pid' : os.getpid(),
+	})
+	return result
+
+#Claims and solves units of the queue until it is empty.
+#The files of the solver are written to a workspace in the folder scratch (see workspace.py).
+#Output: The number of units solved.
+def work(queue,scratch=None,verbose=False):
+	plan = read_plan(queue)
+	graph = plan_graph(plan)
+	solved = 0
+	with Workspace(scratch,'shard') as workspace:
+		solver = make_backend(plan['backend'],graph,workspace.path,'temp_'+str(os.getpid()))
+		writer = ArchiveWriter(os.path.join(queue,ARCHIVE)) if plan.get('archive') else None
+		while True:
+			path = claim(queue)
+			if path is None:
+				break
+			unit = _read_json(path)
+			result = solve_unit(plan,unit,solver,workspace.path,writer)
+			_write_json(os.path.join(queue,DONE,os.path.basename(path)),result)
+			try:
+				os.unlink(path)
+			except OSError:
+				pass#The unit was requeued meanwhile, its second result overwrites the first
+			solved += 1
+			if verbose:
+				sys.stdout.write('[%s %d] unit %d done in %.1f s\n' % (result['host'],result['pid'],unit['unit'],result['elapsed']))
+	return solved
+
+def _work_process(queue,scratch,verbose):
+	np.random.seed()
+	work(queue,scratch,verbose)
+
+#Puts the claimed units older than older_than seconds back into todo, eg. after the node solving them died.
+#Claimed units that are already done are removed instead.
+#Output: The number of units requeued.
+def requeue(queue,older_than):
+	now = time.time()
+	count = 0
+	for name in _units(queue,CLAIMED):
+		path = os.path.join(queue,CLAIMED,name)
+		try:
+			if os.path.exists(os.path.join(queue,DONE,name)):
+				os.unlink(path)
+			elif now-os.path.getmtime(path) > older_than:
+				os.rename(path,os.path.join(queue,TODO,name))
+				count += 1
+		except OSError as e:
+			if e.errno != errno.ENOENT:
+				raise
+	return count
+
+#Output: The numbers of units to do, claimed and done.
+def status(queue):
+	return len(_units(queue,TODO)), len(_units(queue,CLAIMED)), len(_units(queue,DONE))
+
+#Yields the results of the units of the queue that are done (see solve_unit).
+def done_units(queue):
+	for name in _units(queue,DONE):
+		yield _read_json(os.path.join(queue,DONE,name))
+
+#Adds up the results of the units that are done.
+#Output: The frequency count, the number of instances counted, and the failures by kind.
+def merge_units(queue):
+	freq_count = {}
+	failures = {}
+	instances = 0
+	for result in done_units(queue):
+		merge_counts(freq_count,dict((int(k),v) for k, v in result['counts'].items()))
+		merge_counts(failures,result['failures'])
+		instances += result['stop']-result['start']
+	return freq_count, instances, failures
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser()
+	parser.add_argument('command', choices=['plan','work','status','requeue','merge'])
+	parser.add_argument('-queue', dest="queue", type=str, required=True)#The queue folder, on a filesystem shared by all nodes
+	parser.add_argument('-iters', type=int, dest="iters", default=1000)#How many graphs to check
+	parser.add_argument('-unit', type=int, dest="unit", default=1000)#Instances per unit of work
+	parser.add_argument('-tol', type=float, dest="tol", default=0.0000001)#What tolerance should we use to determine if something is a real solution
+	parser.add_argument('-n', type=int, dest="n", default=4)#Number of buses
+	parser.add_argument('-edges', dest="e", type=str, default="")#Edges structure, eg. "0,1:1,2:2,3"
+	parser.add_argument('-edgefile', dest="edgefile", type=str, default="")#File with one edge per line (see graphs.py)
+	parser.add_argument('-g', dest="g", type=str, default="")#Graph id used in the results store
+	parser.add_argument('-backend', dest="backend", choices=BACKENDS, default='bertini')#Solver, see backends.py
+	parser.add_argument('-mu', dest="mu", type=int, default=0)#The mean of the random edges
+	parser.add_argument('-var', dest="var", type=float, default=1)#The variance of the random edges
+	parser.add_argument('-seed', type=int, dest="seed", default=None)#Seed of the run, drawn at random if not given
+	parser.add_argument('-script', dest="script", choices=['bertini_solve','random_eqs'], default=None)#Runs the result merges with in the store
+	parser.add_argument('-jobs', type=int, dest="jobs", default=1)#Worker processes on this node
+	parser.add_argument('-scratch', dest="scratch", type=str, default=None)#Folder for the scratch files, defaults to /dev/shm
+	parser.add_argument('-archive',action='store_true', default=False, dest='archive')#Store the solutions of every instance (see archive.py)
+	parser.add_argument('-older_than', type=float, dest="older_than", default=3600)#Age in seconds of the claims requeue puts back
+	parser.add_argument('-v',action='store_true', default=False, dest='verbose')#Report every unit that is done
+	args = parser.parse_args()
+	queue = args.queue
+
+	if args.command == 'plan':
+		if len(args.edgefile) > 0:
+			graph = read_edge_file(args.edgefile)
+			graph_id = os.path.basename(args.edgefile)
+		elif len(args.e) > 0:
+			graph = Graph(args.n,parse_edge_string(args.e))
+			graph_id = args.e
+		else:
+			graph = complete_graph(args.n)
+			graph_id = 'K'+str(args.n)
+		graph_id = args.g if len(args.g) > 0 else canonical_id(graph,graph_id)
+		script = args.script
+		if script is None:
+			script = 'bertini_solve' if args.mu == 0 and args.var == 1 else 'random_eqs'
+		plan = make_queue(queue,graph,graph_id,args.iters,args.unit,args.backend,args.mu,args.var,args.tol,args.seed,script,args.archive)
+		print('%s: %d units of %d instances of %s, seed %d' % (queue,plan['num_units'],plan['unit'],graph_id,plan['seed']))
+	elif args.command == 'work':
+		if args.jobs > 1:
+			workers = [multiprocessing.Process(target=_work_process,args=(queue,args.scratch,args.verbose)) for k in range(args.jobs)]
+			for p in workers:
+				p.start()
+			for p in workers:
+				p.join()
+		else:
+			work(queue,args.scratch,args.verbose)
+	elif args.command == 'status':
+		todo, claimed, done = status(queue)
+		print('%d units to do, %d claimed, %d done' % (todo,claimed,done))
+	elif args.command == 'requeue':
+		print('Requeued %d units' % requeue(queue,args.older_than))
+	else:
+		plan = read_plan(queue)
+		todo, claimed, done = status(queue)
+		if done < plan['num_units']:
+			sys.exit('Only %d of %d units are done (%d to do, %d claimed)' % (done,plan['num_units'],todo,claimed))
+		freq_count, instances, failures = merge_units(queue)
+		print('Roots found:')
+		for k in sorted(freq_count.keys()):
+			print(str(k) + ' : ' + str(freq_count[k]))
+		if failures:
+			print('Failures: '+', '.join([kind+' '+str(failures[kind]) for kind in sorted(failures.keys())]))
+		#The queue is the source of the run, so merging it twice does not count it twice
+		if add_run(plan['script'],plan['graph_id'],freq_count,mu=plan['mu'],var=plan['var'],iters=instances,source=os.path.abspath(os.path.join(queue,'plan.json'))) is None:
+			print('This queue was already added to the results store')
@@ -0,0 +1,168 @@
+#Sweeps over many graphs and (mu, var) parameters on a shared pool of worker processes.
+#
+#The graphs are all connected graphs on n buses, one per isomorphism class (see connected_graphs in graphs.py),
+#and/or the list given with -graphs. For random_eqs, every graph is run at every (mu, var) of the grid -mu x -var.
+#Each (graph, mu, var) is a cell. For every cell we look up how many instances the results store Data/results.db
+#already holds under its canonical graph-id, and only the missing instances (up to -min_samples) are scheduled.
+#A sweep that is interrupted, or repeated with a larger -min_samples, therefore only does the work still missing.
+#
+#The cells are run as separate driver processes, at most -jobs at a time. To keep all workers busy until the end,
+#	the cost of a cell is estimated as (missing instances) x (seconds per instance), where the seconds per instance are
+#	the mean time per instance of the runs of the same script, graph and (mu, var) in the results store (see
+#	instance_seconds in results_db.py) if any were timed, and otherwise the number of paths tracked per instance
+#	(the generic count or mixed volume of the graph in the root counts of bounds.py, or else the Bezout bound)
+#	times the seconds per path measured on the other cells (or SECONDS_PER_PATH if nothing was measured yet),
+#	cells costing more than a 1/(2*jobs) share of the sweep are split into pieces (their results merge in the store),
+#	and the pieces are started longest first, so the few expensive graphs (eg. K6) do not run alone at the end.
+#
+#To run this code, do the following:
+#python sweep.py -n [NUMBER OF BUSES] -min_samples [INSTANCES PER GRAPH] [-graphs "K5;0,1:1,2:2,3"] [-jobs 8]
+#	[-script bertini_solve] [-mu 0,1 -var 0.5,1,2] [-args="-paramhom"] [-dry_run]
+#
+#Example : python sweep.py -n 6 -min_samples 1000 -jobs 8
+#This solves 1000 instances of each of the 112 connected graphs on 6 buses with bertini_solve.py, 8 at a time.
+#Example : python sweep.py -n 0 -graphs "K4;K5;K6" -script random_eqs -mu 0,1 -var 0.5,1,2 -min_samples 500 -jobs 16
+#This runs random_eqs.py on K4, K5 and K6 at all six (mu, var) pairs.
+#-dry_run only prints the planned pieces and their estimated cost. Extra driver arguments go in -args="...".
+#
+
+import numpy as np
+import multiprocessing
+import subprocess
+import argparse
+import shlex
+import time
+import sys
+
+from graphs import Graph, complete_graph, parse_edge_string, connected_graphs, canonical_id, edge_string
+from bounds import get_bounds
+from results_db import num_instances, instance_seconds
+
+MIN_PIECE = 50 #Cells are not split into pieces of fewer instances
+SECONDS_PER_PATH = 0.001 #Nominal time to track one path, used until some instances have been timed
+
+#Input: A list of graphs separated by ';', each "K(n)" or an edge string (see parse_edge_string).
+#Output: The list of graphs.
+def parse_graph_list(spec):
+	graphs = []
+	for item in spec.split(';'):
+		item = item.strip()
+		if not item:
+			continue
+		if item[0] == 'K':
+			graphs.append(complete_graph(int(item[1:])))
+		else:
+			edges = parse_edge_string(item)
+			graphs.append(Graph(max(max(e) for e in edges)+1,edges))
+	return graphs
+
+#Output: The number of paths tracked per instance of the graph, ie. its generic count or mixed volume if known
+#(see bounds.py), and otherwise the Bezout bound.
+def path_count(graph,graph_id=None):
+	bounds = get_bounds(graph,graph_id)
+	for name in ['generic','mixed_volume','bezout']:
+		if bounds.get(name) is not None:
+			return bounds[name]
+
+#Output: The mean time in seconds per instance of the runs of script on graph_id at (mu, var), or None if none was timed.
+def measured_time(graph_id,script,mu,var):
+	return instance_seconds(graph_id,script,mu,var)
+
+#Input: A dictionary {graph-id : graph}, the script and the grid of (mu, var) pairs.
+#Output: A dictionary {(graph-id, mu, var) : estimated seconds per instance}.
+#Cells without timed runs are estimated from their number of paths, using the median seconds per path of the others.
+def instance_costs(graphs,script,grid):
+	paths = dict((g_id,path_count(graph,g_id)) for g_id, graph in graphs.items())
+	measured = dict(((g_id,mu,var),measured_time(g_id,script,mu,var)) for g_id in graphs for mu, var in grid)
+	per_path = [t/paths[cell[0]] for cell, t in measured.items() if t is not None]
+	seconds_per_path = float(np.median(per_path)) if per_path else SECONDS_PER_PATH
+	return dict((cell,t if t is not None else seconds_per_path*paths[cell[0]]) for cell, t in measured.items())
+
+#Input: A list of cells (graph-id, mu, var, missing instances), the seconds per instance of every cell and the number of workers.
+#Output: A list of pieces (estimated cost, graph-id, mu, var, instances), longest first.
+#Cells costing more than a 1/(2*jobs) share of the total are split into pieces of at least MIN_PIECE instances.
+def plan(cells,costs,jobs):
+	total = sum(costs[g_id,mu,var]*iters for g_id, mu, var, iters in cells)
+	share = total/(2*jobs)
+	pieces = []
+	for g_id, mu, var, iters in cells:
+		num_pieces = 1
+		if jobs > 1 and share > 0:
+			num_pieces = max(1,min(int(np.ceil(costs[g_id,mu,var]*iters/share)),iters//MIN_PIECE))
+		for k in range(num_pieces):
+			size = iters//num_pieces + (1 if k < iters%num_pieces else 0)
+			pieces.append((costs[g_id,mu,var]*size,g_id,mu,var,size))
+	pieces.sort(key=lambda p: -p[0])
+	return pieces
+
+#Output: The command line that runs script on the graph for iters instances, followed by the extra arguments.
+#part numbers the pieces of a cell, so that each piece of bertini_solve gets its own run log.
+def driver_command(script,graph,iters,mu,var,extra,part=None):
+	command = [sys.executable,script+'.py','-n',str(graph.n),'-edges',edge_string(graph),'-iters',str(iters)]
+	if script == 'random_eqs':
+		command += ['-mu',str(mu),'-var',str(var)]
+	elif part is not None:
+		command += ['-log','Data/log_'+canonical_id(graph)+'_'+time.strftime('%b-%d-%Y_%H:%M:%S',time.localtime())+'_part'+str(part)]
+	return command+extra
+
+#This runs inside a worker of the sweep pool and runs one piece.
+def _run_piece(job):
+	command_args, cost = job
+	start = time.time()
+	code = subprocess.call(driver_command(*command_args))
+	return command_args, cost, time.time()-start, code
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser()
+	parser.add_argument('-n', type=int, dest="n", default=5)#All connected graphs on n buses (0 for none)
+	parser.add_argument('-graphs', dest="graphs", type=str, default="")#Further graphs, eg. "K5;0,1:1,2:2,3"
+	parser.add_argument('-min_samples', type=int, dest="min_samples", default=1000)#Instances wanted per cell
+	parser.add_argument('-script', dest="script", choices=['bertini_solve','random_eqs'], default='bertini_solve')
+	parser.add_argument('-mu', dest="mu", type=str, default="0")#Comma separated means, passed on to random_eqs
+	parser.add_argument('-var', dest="var", type=str, default="1")#Comma separated variances, passed on to random_eqs
+	parser.add_argument('-jobs', type=int, dest="jobs", default=1)#Number of pieces run at the same time
+	parser.add_argument('-args', dest="args", type=str, default="")#Extra arguments for the driver, eg. -args="-paramhom" (with =, since they start with -)
+	parser.add_argument('-dry_run', action='store_true', default=False, dest='dry_run')#Only print the planned pieces
+	args = parser.parse_args()
+
+	graphs = {}
+	for graph in (connected_graphs(args.n) if args.n > 0 else [])+parse_graph_list(args.graphs):
+		graphs[canonical_id(graph)] = graph
+
+	#bertini_solve always samples N(0,1)
+	if args.script == 'random_eqs':
+		grid = [(int(mu),float(var)) for mu in args.mu.split(',') for var in args.var.split(',')]
+	else:
+		grid = [(0,1.0)]
+
+	cells = []
+	for g_id in sorted(graphs.keys()):
+		for mu, var in grid:
+			have = num_instances(g_id,args.script,mu,var)
+			if have < args.min_samples:
+				cells.append((g_id,mu,var,args.min_samples-have))
+	pieces = plan(cells,instance_costs(graphs,args.script,grid),args.jobs)
+	total = sum(p[0] for p in pieces)
+	print('%d cells need more instances, run as %d pieces, estimated %.0f s in total, %.0f s per worker' % (len(cells),len(pieces),total,total/args.jobs))
+
+	extra = shlex.split(args.args)
+	split = set(g_id for g_id, mu, var, iters in cells if len([p for p in pieces if p[1] == g_id]) > 1)
+	jobs = []
+	for k, (cost, g_id, mu, var, iters) in enumerate(pieces):
+		part = k if args.script == 'bertini_solve' and g_id in split else None
+		jobs.append(((args.script,graphs[g_id],iters,mu,var,extra,part),cost))
+		if args.dry_run:
+			print('%s (%s) mu=%d var=%g: %d instances, estimated %.1f s' % (g_id,edge_string(graphs[g_id]),mu,var,iters,cost))
+	if not args.dry_run and jobs:
+		pool = multiprocessing.Pool(args.jobs)
+		try:
+			for k, (command_args, cost, elapsed, code) in enumerate(pool.imap_unordered(_run_piece,jobs,chunksize=1)):
+				script, graph, iters, mu, var = command_args[:5]
+				status = 'done' if code == 0 else 'failed with exit code '+str(code)
+				print('[%d/%d] %s mu=%d var=%g: %d instances %s in %.1f s (estimated %.1f s)' % (k+1,len(jobs),canonical_id(graph),mu,var,iters,status,elapsed,cost))
+			pool.close()
+		except:
+			pool.terminate()
+			raise
+		finally:
+			pool.join()
@@ -0,0 +1,243 @@
+#Timers and counters for the instances of an eq_loop.
+#
+#A Telemetry object records, for the instances a process solves,
+#	the total time spent in each stage (sample, write, solve, parse, cleanup, ...),
+#	the wall time of every instance (mean, maximum and the slowest few, to spot stragglers),
+#	how often the solver failed, by kind (solver_error, unreadable, odd, ...),
+#	the throughput in instances per second and the estimated time to finish.
+#Every interval seconds (and at the end) this is handed to the sinks:
+#	StderrSink	prints one line to stderr
+#	JsonSink	appends the snapshot as one JSON line to a file
+#	ProfileSink	runs cProfile while the instances are solved and dumps the statistics to a file
+#
+#In the drivers, the sinks are chosen with -telemetry, eg.
+#	-telemetry stderr
+#	-telemetry stderr,json:Data/metrics.json,profile:Data/run.prof
+#With -jobs, every worker process reports on its own chunks (tagged with its process id), and
+#the parent process reports the progress of the whole run.
+#
+
+import cProfile
+import heapq
+import json
+import time
+import sys
+import os
+
+NUM_SLOWEST = 5 #Number of slowest instances reported
+
+class _Stage(object):
+	#Times the block of a with statement and adds it to the stage name.
+	def __init__(self,telemetry,name):
+		self.telemetry = telemetry
+		self.name = name
+
+	def __enter__(self):
+		self.start = time.time()
+
+	def __exit__(self,exc_type,exc_value,traceback):
+		self.telemetry.add_time(self.name,time.time()-self.start)
+		return False
+
+class Telemetry(object):
+	#sinks is a list of sinks (see make_sinks), which get a snapshot every interval seconds.
+	def __init__(self,sinks=None,interval=10.0):
+		self.sinks = sinks if sinks is not None else []
+		self.interval = interval
+		self._reset(0)
+
+	#Starts recording a range of total instances in this process.
+	def begin(self,total):
+		self._reset(total)
+		for sink in self.sinks:
+			sink.start()
+
+	def _reset(self,total):
+		self.total = total
+		self.done = 0
+		self.start = time.time()
+		self.last_report = self.start
+		self.stages = {}
+		self.failures = {}
+		self.instance_total = 0.0
+		self.instance_max = 0.0
+		self.slowest = []#Heap of (time, index) of the slowest instances
+
+	#Output: A context manager timing the stage name, eg.
+	#	with telemetry.stage('solve'):
+	#		subprocess.call(...)
+	def stage(self,name):
+		return _Stage(self,name)
+
+	#Adds seconds to the total time of the stage name.
+	def add_time(self,name,seconds):
+		self.stages[name] = self.stages.get(name,0.0) + seconds
+
+	#Yields the items of iterable, adding the time spent producing them to the stage name.
+	def timed(self,name,iterable):
+		it = iter(iterable)
+		while True:
+			start = time.time()
+			try:
+				item = next(it)
+			except StopIteration:
+				return
+			self.add_time(name,time.time()-start)
+			yield item
+
+	#Counts a failure of the given kind.
+	def fail(self,kind):
+		self.failures[kind] = self.failures.get(kind,0) + 1
+
+	#Counts the number of real solutions number_real of an instance as a failure if the output
+	#could not be read (number_real is None) or if it is odd.
+	def check_count(self,number_real):
+		if number_real is None:
+			self.fail('unreadable')
+		elif number_real%2 != 0:
+			self.fail('odd')
+
+	#Records that instance i was solved in elapsed seconds.
+	def instance(self,i,elapsed):
+		self.instance_total += elapsed
+		self.instance_max = max(self.instance_max,elapsed)
+		if len(self.slowest) < NUM_SLOWEST:
+			heapq.heappush(self.slowest,(elapsed,i))
+		elif elapsed > self.slowest[0][0]:
+			heapq.heapreplace(self.slowest,(elapsed,i))
+		self.advance(1)
+
+	#Records that count more instances are done, and reports if the interval has passed.
+	def advance(self,count):
+		self.done += count
+		now = time.time()
+		if self.sinks and now-self.last_report >= self.interval:
+			self.last_report = now
+			snapshot = self.snapshot()
+			for sink in self.sinks:
+				sink.update(snapshot)
+
+	#Output: A dictionary with the current state of the counters.
+	def snapshot(self):
+		elapsed = time.time()-self.start
+		rate = self.done/elapsed if elapsed > 0 else 0.0
+		timed = len(self.slowest) > 0
+		return {
+			'pid' : os.getpid(),
+			'time' : time.time(),
+			'done' : self.done,
+			'total' : self.total,
+			'elapsed' : elapsed,
+			'rate' : rate,
+			'eta' : (self.total-self.done)/rate if rate > 0 else None,
+			'stages' : dict(self.stages),
+			'instance_mean' : self.instance_total/self.done if timed and self.done > 0 else None,
+			'instance_max' : self.instance_max if timed else None,
+			'slowest' : [[i,t] for t, i in sorted(self.slowest,reverse=True)],
+			'failures' : dict(self.failures),
+		}
+
+	#Ends the range started by begin, giving the final snapshot to the sinks.
+	def end(self):
+		snapshot = self.snapshot()
+		for sink in self.sinks:
+			sink.close(snapshot)
+		return snapshot
+
+#Output: The snapshot as one line of text.
+def format_snapshot(snapshot):
+	line = '[%d] %d/%d instances, %.2f/s' % (snapshot['pid'],snapshot['done'],snapshot['total'],snapshot['rate'])
+	if snapshot['eta'] is not None:
+		line += ', ETA %.0fs' % snapshot['eta']
+	stage_total = sum(snapshot['stages'].values())
+	if stage_total > 0:
+		line += ' | '+' '.join(['%s %.0f%%' % (name,100*t/stage_total) for name, t in sorted(snapshot['stages'].items(),key=lambda x: -x[1])])
+	if snapshot['instance_max'] is not None:
+		line += ' | instance mean %.3fs max %.3fs' % (snapshot['instance_mean'],snapshot['instance_max'])
+		line += ', slowest '+', '.join(['%d (%.3fs)' % (i,t) for i, t in snapshot['slowest']])
+	if snapshot['failures']:
+		line += ' | failures: '+', '.join(['%s %d' % (kind,count) for kind, count in sorted(snapshot['failures'].items())])
+	return line
+
+#Prints a line to stderr every interval and at the end.
+class StderrSink(object):
+	def start(self):
+		pass
+
+	def update(self,snapshot):
+		sys.stderr.write(format_snapshot(snapshot)+'\n')
+
+	def close(self,snapshot):
+		sys.stderr.write(format_snapshot(snapshot)+' (done)\n')
+
+#Appends every snapshot to the file path as one JSON line; the last snapshot of a range has "final": true.
+#Lines are written with a single os.write on a file opened with O_APPEND, so worker processes can share the file.
+class JsonSink(object):
+	def __init__(self,path):
+		self.path = path
+
+	def start(self):
+		pass
+
+	def _write(self,snapshot):
+		fd = os.open(self.path,os.O_WRONLY|os.O_APPEND|os.O_CREAT,0o644)
+		try:
+			os.write(fd,(json.dumps(snapshot)+'\n').encode('ascii'))
+		finally:
+			os.close(fd)
+
+	def update(self,snapshot):
+		self._write(snapshot)
+
+	def close(self,snapshot):
+		snapshot = dict(snapshot)
+		snapshot['final'] = True
+		self._write(snapshot)
+
+_profilers = {} #The profiler of every (path, process id), so that the chunks of a worker add up in one profile
+
+#Profiles the process with cProfile between begin and end, and dumps the statistics to path
+#(path.(pid) in worker processes). Read them with python -m pstats [FILE].
+class ProfileSink(object):
+	def __init__(self,path):
+		self.path = path
+		self.profiler = None
+		self._pid = os.getpid()
+
+	def start(self):
+		key = (self.path,os.getpid())
+		if key not in _profilers:
+			_profilers[key] = cProfile.Profile()
+		self.profiler = _profilers[key]
+		self.profiler.enable()
+
+	def update(self,snapshot):
+		pass
+
+	def close(self,snapshot):
+		if self.profiler is None:
+			return
+		self.profiler.disable()
+		self.profiler.dump_stats(self.path if os.getpid() == self._pid else self.path+'.'+str(os.getpid()))
+
+	#Profilers cannot be sent to worker processes, every worker starts its own.
+	def __getstate__(self):
+		state = self.__dict__.copy()
+		state['profiler'] = None
+		return state
+
+#Input: A comma separated list of sinks, each 'stderr', 'json:PATH' or 'profile:PATH'.
+#Output: The list of sinks.
+def make_sinks(spec):
+	sinks = []
+	for item in spec.split(','):
+		kind, _, path = item.strip().partition(':')
+		if kind == 'stderr':
+			sinks.append(StderrSink())
+		elif kind == 'json':
+			sinks.append(JsonSink(path))
+		elif kind == 'profile':
+			sinks.append(ProfileSink(path))
+		elif kind:
+			raise ValueError('Unknown telemetry sink '+item)
+	return sinks
@@ -0,0 +1,73 @@
+#Input files for Bertini and PHC, compiled once per graph.
+#
+#For a fixed graph, the input files of all instances are the same text except for the
+#susceptances. An InputTemplate builds that text once, with a slot {e} wherever the
+#susceptance of edge e goes, so writing an instance is a single str.format call instead of
+#rebuilding the equations and the function/variable_group header every time.
+#
+#Usage:
+#	template = InputTemplate(n,edges,'bertini')
+#	template.write(b,'temp_1')	#writes temp_1.input for the susceptances b
+#	template.write_batch(batch,names)	#writes one file per row of batch
+#
+
+from sampling import bus_incidence, pq_eqs
+
+#Input: A list of strings corresponding to the equations f_1,...,f_m,g_1,...,g_m (see pq_eqs).
+#params is an optional list of parameter names used in eqs (for parameter homotopies),
+#and config an optional list of Bertini settings, eg. ['ParameterHomotopy:1'].
+#Output: The text of a Bertini input file for these equations.
+def bertini_input(eqs,params=None,config=None):
+	n = len(eqs)//2
+	f_names = ['f'+str(i+1) for i in range(n)]
+	g_names = ['g'+str(i+1) for i in range(n)]
+	lines = ['function '+','.join(f_names+g_names)+';',
+		'variable_group '+','.join(['x'+str(i+1) for i in range(n)]+['y'+str(i+1) for i in range(n)])+';']
+	if params:
+		lines.append('parameter '+','.join(params)+';')
+	lines.append('')
+	lines += [name+' = '+eq+';' for name, eq in zip(f_names+g_names,eqs)]
+	text = '\n'.join(lines)+'\n'+'END;'
+	if config is not None:
+		text = 'CONFIG\n'+''.join([c+';\n' for c in config])+'END;\n\nINPUT\n'+text
+	return text
+
+#Input: A list of strings corresponding to the equations.
+#Output: The text of a PHC input file for these equations.
+def phc_input(eqs):
+	return str(len(eqs))+'\n'+''.join([str(eq).replace(' ','')+';\n' for eq in eqs])
+
+#The text builder and the file name suffix of each solver.
+_FORMATS = {
+	'bertini' : (bertini_input,'.input'),
+	'phc' : (phc_input,'_eqs.txt'),
+}
+
+class InputTemplate(object):
+	#Compiles the input file of the graph with n buses and the given edges for solver ('bertini' or 'phc').
+	#config is an optional list of Bertini settings, eg. ['MPTYPE:2'].
+	def __init__(self,n,edges,solver='bertini',config=None):
+		build, self.suffix = _FORMATS[solver]
+		slots = ['{'+str(e)+'}' for e in range(len(edges))]
+		eqs = pq_eqs(bus_incidence(n,edges),slots)
+		self.text = build(eqs,config=config) if config is not None else build(eqs)
+		self.num_edges = len(edges)
+
+	#Input: One row b of susceptances.
+	#Output: The input file of this instance.
+	#repr keeps all digits of the susceptances, like str on the numpy floats did before.
+	def render(self,b):
+		return self.text.format(*[repr(float(v)) for v in b])
+
+	#Writes the input file of the susceptances b to filename (plus the suffix of the solver).
+	def write(self,b,filename):
+		with open(filename+self.suffix,'w') as f:
+			f.write(self.render(b))
+
+	#Writes the input files of all rows of batch, row k to names[k] (plus the suffix of the solver).
+	#The texts are rendered in one pass first, so the files are written back to back.
+	def write_batch(self,batch,names):
+		texts = [self.render(b) for b in batch]
+		for name, text in zip(names,texts):
+			with open(name+self.suffix,'w') as f:
+				f.write(text)
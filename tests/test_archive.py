@@ -0,0 +1,53 @@
+#Tests of the solution archive in archive.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import tempfile
+import shutil
+import os
+import numpy as np
+
+from graphs import complete_graph
+from archive import ArchiveWriter, Archive, create_archive
+
+class ArchiveTest(unittest.TestCase):
+	def setUp(self):
+		self.folder = tempfile.mkdtemp()
+		self.path = os.path.join(self.folder,'archive')
+		create_archive(self.path,complete_graph(3),graph_id='K3',seed=7)
+
+	def tearDown(self):
+		shutil.rmtree(self.folder)
+
+	def instance(self,i):
+		rs = np.random.RandomState(i)
+		return rs.randn(3), rs.randn(i%5,4)+1j*rs.randn(i%5,4)
+
+	def test_blocks_are_appended_to_few_chunks(self):
+		writer = ArchiveWriter(self.path,chunk_size=10,block_size=4)
+		for i in range(25):
+			writer.add(i,*self.instance(i))
+			if i%3 == 2:
+				writer.flush()#As at the end of every pool chunk
+		writer.close()
+		archive = Archive(self.path)
+		self.assertEqual(len(archive.chunk_names()),3)
+		self.assertEqual(len(archive),25)
+		for i, b, sols in archive.instances():
+			self.assertTrue(np.array_equal(b,self.instance(i)[0]))
+			self.assertTrue(np.array_equal(sols,self.instance(i)[1]))
+		self.assertTrue(np.array_equal(archive.get(17)[1],self.instance(17)[1]))
+
+	def test_latest_block_is_used(self):
+		with ArchiveWriter(self.path) as writer:
+			writer.add(3,*self.instance(3))
+			writer.flush()
+			writer.add(3,np.zeros(3),np.ones([1,4],dtype=complex))
+		archive = Archive(self.path)
+		self.assertEqual(len(archive),1)
+		self.assertTrue(np.array_equal(archive.get(3)[0],np.zeros(3)))
+		self.assertEqual([i for i, b, sols in archive.instances()],[3])
+
+if __name__ == '__main__':
+	unittest.main()
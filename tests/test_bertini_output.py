@@ -0,0 +1,76 @@
+#Tests of the parser of Bertini's solution files in bertini_output.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import tempfile
+import shutil
+import os
+import numpy as np
+
+from bertini_output import read_solutions, real_coordinates
+
+SOLUTIONS = '''3
+
+9.999999999999999e-01 -3.252606517456513e-19
+-2.052137593164120e-17 1.029327954680140e-18
+
+-5.000000000000000e-01 8.660254037844386e-01
+1.250000000000000e+00 -2.500000000000000e-01
+
+3.000000000000000e+00 0.000000000000000e+00
+-4.000000000000000e+00 1.000000000000000e-09
+
+'''
+
+EXPECTED = np.array([
+	[9.999999999999999e-01-3.252606517456513e-19j,-2.052137593164120e-17+1.029327954680140e-18j],
+	[-5.000000000000000e-01+8.660254037844386e-01j,1.250000000000000e+00-2.500000000000000e-01j],
+	[3.000000000000000e+00+0.000000000000000e+00j,-4.000000000000000e+00+1.000000000000000e-09j],
+])
+
+class ReadSolutionsTest(unittest.TestCase):
+	def setUp(self):
+		self.folder = tempfile.mkdtemp()
+		self.path = os.path.join(self.folder,'finite_solutions')
+
+	def tearDown(self):
+		shutil.rmtree(self.folder)
+
+	def read(self,text):
+		with open(self.path,'w') as f:
+			f.write(text)
+		return read_solutions(self.path,2)
+
+	def test_complete(self):
+		sols = self.read(SOLUTIONS)
+		self.assertEqual(sols.shape,(3,2))
+		self.assertTrue(np.array_equal(sols,EXPECTED))
+		self.assertEqual(list(real_coordinates(sols,1e-7).all(axis=1)),[True,False,True])
+
+	def test_cut_mid_block(self):
+		cut = SOLUTIONS.index('1.250000000000000e+00')#After the first variable of the second solution
+		sols = self.read(SOLUTIONS[:cut])
+		self.assertEqual(sols.shape,(1,2))
+		self.assertTrue(np.array_equal(sols,EXPECTED[:1]))
+
+	def test_cut_mid_number(self):
+		cut = SOLUTIONS.index('1.000000000000000e-09')+6#The last number reads as 1.0000
+		sols = self.read(SOLUTIONS[:cut])
+		self.assertEqual(sols.shape,(2,2))
+		self.assertTrue(np.array_equal(sols,EXPECTED[:2]))
+
+	def test_zero_solutions(self):
+		sols = self.read('0\n\n')
+		self.assertEqual(sols.shape,(0,2))
+
+	#Wherever the file is cut, the solutions read are those whose last number is followed by its line break
+	def test_every_cut(self):
+		ends = [SOLUTIONS.index('\n\n',SOLUTIONS.index(line)) for line in ['-2.05','1.25','-4.00']]
+		for cut in range(SOLUTIONS.index('\n')+1,len(SOLUTIONS)+1):
+			sols = self.read(SOLUTIONS[:cut])
+			self.assertEqual(sols.shape,(len([end for end in ends if end < cut]),2),cut)
+			self.assertTrue(np.array_equal(sols,EXPECTED[:sols.shape[0]]),cut)
+
+if __name__ == '__main__':
+	unittest.main()
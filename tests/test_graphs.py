@@ -0,0 +1,45 @@
+#Tests of the canonical graph-ids in graphs.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import random
+import time
+
+from graphs import Graph, complete_graph, canonical_id, connected_graphs, MAX_CANONICAL
+
+#Output: The graph with its buses relabelled by a random permutation.
+def shuffled(graph):
+	perm = range(graph.n)
+	random.shuffle(perm)
+	return Graph(graph.n,[(perm[i],perm[j]) for i, j in graph.edges])
+
+class CanonicalIdTest(unittest.TestCase):
+	def test_relabelled_graphs_have_the_same_id(self):
+		for n in range(2,6):
+			for graph in connected_graphs(n):
+				self.assertEqual(canonical_id(graph),canonical_id(shuffled(graph)))
+
+	def test_connected_graphs_have_different_ids(self):
+		ids = [canonical_id(graph) for graph in connected_graphs(5)]
+		self.assertEqual(len(ids),21)
+		self.assertEqual(len(set(ids)),len(ids))
+
+	#Complete graphs have n! leaves without pruning by automorphisms, K10 took minutes
+	def test_complete_graphs_are_fast(self):
+		for n in range(3,MAX_CANONICAL+1):
+			start = time.time()
+			canonical_id(complete_graph(n))
+			self.assertLess(time.time()-start,1.0,'K'+str(n))
+
+	def test_symmetric_graphs_are_fast(self):
+		n = MAX_CANONICAL
+		bipartite = Graph(n,[(i,j) for i in range(n//2) for j in range(n//2,n)])
+		matching = Graph(n,[(2*i,2*i+1) for i in range(n//2)])
+		for graph in [bipartite,matching,Graph(n,[])]:
+			start = time.time()
+			self.assertEqual(canonical_id(graph),canonical_id(shuffled(graph)))
+			self.assertLess(time.time()-start,2.0)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,35 @@
+#Tests of the homotopy solver in homotopy.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import itertools
+import numpy as np
+
+from homotopy import solve_batch, refine, susceptance_matrices
+
+class SolveTest(unittest.TestCase):
+	#For generic susceptances the complete graph on n buses has binomial(2n-2,n-1) finite solutions
+	def test_generic_counts(self):
+		rs = np.random.RandomState(0)
+		for n, generic in [(3,6),(4,20)]:
+			edges = list(itertools.combinations(range(n),2))
+			b = rs.randn(3,len(edges))+1j*rs.randn(3,len(edges))
+			self.assertEqual([sols.shape[0] for sols in solve_batch(n,edges,b)],[generic]*3)
+
+	#A tiny susceptance gives two large complex solutions, which are ill-conditioned but not singular.
+	#gamma is fixed, since for some gammas a path to them is lost (reported as a failure, see homotopy.py).
+	def test_keeps_large_solutions(self):
+		b = np.array([[-0.583315018,0.000754750995,1.95986031]])
+		sols = solve_batch(3,[(0,1),(0,2),(1,2)],b,gamma=np.exp(0.5j))[0]
+		self.assertEqual(sols.shape[0],6)
+		self.assertTrue(np.abs(sols).max() > 1e3)
+
+	#With b = 0, the solution (1,0) of f_1 = b*y_1, g_1 = x_1^2+y_1^2-1 is singular
+	def test_rejects_singular_endpoints(self):
+		z = np.array([[1,0]],dtype=complex)
+		self.assertTrue(refine(z,susceptance_matrices(2,[(0,1)],[[1.0]]))[1][0])
+		self.assertFalse(refine(z,susceptance_matrices(2,[(0,1)],[[0.0]]))[1][0])
+
+if __name__ == '__main__':
+	unittest.main()
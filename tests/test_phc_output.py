@@ -0,0 +1,64 @@
+#Tests of the parser of PHC's solutions in phc_output.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import tempfile
+import shutil
+import os
+import numpy as np
+
+from phc_output import read_solutions
+
+SOLUTIONS = '''4
+x1^2+y1^2-1;
+THE SOLUTIONS :
+2 2
+===========================================================
+solution 1 :
+t :  1.00000000000000E+00   0.00000000000000E+00
+m : 1
+the solution for t :
+ x1 :  1.00000000000000E+00   0.00000000000000E+00
+ y1 :  2.00000000000000E+00   5.00000000000000E-01
+== err :  1.4E-16 = rco :  2.5E-01 = res :  1.1E-16 ==
+solution 2 :
+t :  1.00000000000000E+00   0.00000000000000E+00
+m : 1
+the solution for t :
+ x1 : -1.00000000000000E+00   0.00000000000000E+00
+ y1 :  3.00000000000000E+00  -2.50000000000000E-01
+== err :  1.4E-16 = rco :  2.5E-01 = res :  1.1E-16 ==
+'''
+
+class ReadSolutionsTest(unittest.TestCase):
+	def setUp(self):
+		self.folder = tempfile.mkdtemp()
+		self.path = os.path.join(self.folder,'eqs.txt')
+
+	def tearDown(self):
+		shutil.rmtree(self.folder)
+
+	def read(self,text,order=None):
+		with open(self.path,'w') as f:
+			f.write(text)
+		return read_solutions(self.path,order)
+
+	def test_complete(self):
+		sols = self.read(SOLUTIONS)
+		self.assertTrue(np.array_equal(sols,[[1,2+0.5j],[-1,3-0.25j]]))
+		self.assertTrue(np.array_equal(self.read(SOLUTIONS,['y1','x1']),[[2+0.5j,1],[3-0.25j,-1]]))
+
+	#A file cut off in a solution block, at any line, keeps the solutions before the cut
+	def test_cut_off(self):
+		lines = SOLUTIONS.splitlines(True)
+		start = lines.index('THE SOLUTIONS :\n')
+		for cut in range(start,len(lines)):
+			sols = self.read(''.join(lines[:cut]),['x1','y1'])
+			expected = 2 if cut == len(lines) else (1 if cut >= lines.index('solution 2 :\n') else 0)
+			self.assertEqual(sols.shape[0],expected)
+			if expected > 0:
+				self.assertTrue(np.array_equal(sols[0],[1,2+0.5j]))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,67 @@
+#Tests of the counts of real roots in real_roots.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import numpy as np
+
+from real_roots import count_real_even_roots, count_real_roots
+
+TOL = 1e-6
+
+#Output: The number of real roots of the polynomial with coefficients coeffs (highest degree first), one at a time.
+def reference_count(coeffs):
+	roots = np.roots(coeffs)
+	return int(np.sum(np.abs(roots.imag) <= TOL*np.maximum(1,np.abs(roots))))
+
+#Input: A random state rs and the degree d.
+#Output: The roots of a random real polynomial of degree d: some positive and negative reals and conjugate pairs,
+#away from 0 and from the real axis, so that the reference count is not sensitive to rounding.
+def random_roots(rs,d):
+	roots = []
+	while len(roots) < d:
+		kind = rs.randint(3) if d-len(roots) > 1 else rs.randint(2)
+		size = rs.uniform(0.5,3)
+		if kind == 0:
+			roots.append(size)
+		elif kind == 1:
+			roots.append(-size)
+		else:
+			z = size*np.exp(1j*rs.uniform(0.3,np.pi-0.3))
+			roots += [z,np.conj(z)]#The pair holds a root with a negative imaginary part
+	return np.array(roots,dtype=complex)
+
+class EvenRootsTest(unittest.TestCase):
+	#The quartics in s = t^2 against np.roots of the even polynomials in t
+	def test_against_np_roots(self):
+		rs = np.random.RandomState(3)
+		coeffs = np.array([rs.uniform(0.5,2)*np.poly(random_roots(rs,4)).real for k in range(200)])
+		coeffs[::7,0] = 0#The ~regular path, cubics in s
+		t_coeffs = np.zeros([coeffs.shape[0],9])
+		t_coeffs[:,::2] = coeffs
+		expected = [reference_count(np.trim_zeros(row,'f')) for row in t_coeffs]
+		self.assertEqual(list(count_real_even_roots(coeffs,TOL)),expected)
+		self.assertTrue(0 in expected and 8 in expected)
+
+	#Only a positive s gives real roots t, a negative s gives the imaginary roots +-i*sqrt(-s)
+	def test_negative_s(self):
+		coeffs = [np.poly([-1,-2,-3,-4]),np.poly([1,-2,-3,-4]),np.poly([1,2,-3,4])]
+		self.assertEqual(list(count_real_even_roots(coeffs,TOL)),[0,2,6])
+		self.assertEqual(list(count_real_even_roots([[0,1,-1,2,-2]],TOL)),[2])#(s-1)(s^2+2), the ~regular path
+
+	def test_conjugate_pairs(self):
+		pair = np.poly([1+2j,1-2j]).real
+		coeffs = [np.polymul(pair,np.poly([2,3])),np.polymul(pair,np.poly([-1+1j,-1-1j]).real)]
+		self.assertEqual(list(count_real_even_roots(coeffs,TOL)),[4,0])
+
+class RealRootsTest(unittest.TestCase):
+	def test_against_np_roots(self):
+		rs = np.random.RandomState(5)
+		for d in [1,2,5,8]:
+			coeffs = np.array([rs.uniform(0.5,2)*np.poly(random_roots(rs,d)).real for k in range(100)])
+			coeffs[::9,0] = 0#Polynomials of lower degree
+			expected = [reference_count(np.trim_zeros(row,'f')) for row in coeffs]
+			self.assertEqual(list(count_real_roots(coeffs,TOL)),expected)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,41 @@
+#Tests of the results store in results_db.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import tempfile
+import sqlite3
+import shutil
+import os
+
+from results_db import add_run, instance_seconds, num_instances
+
+class TimingTest(unittest.TestCase):
+	def setUp(self):
+		self.folder = tempfile.mkdtemp()
+		self.path = os.path.join(self.folder,'results.db')
+
+	def tearDown(self):
+		shutil.rmtree(self.folder)
+
+	def test_timing_by_script_and_parameters(self):
+		add_run('bertini_solve',"C3_26",{2:10},iters=10,seconds=1.0,path=self.path)
+		add_run('random_eqs',"C3_26",{2:10},mu=1,var=2,iters=10,seconds=0.1,path=self.path)
+		add_run('random_eqs',"C3_26",{2:30},mu=1,var=2,iters=30,seconds=0.5,path=self.path)
+		add_run('random_eqs',"C3_26",{2:5},mu=0,var=1,iters=5,path=self.path)
+		self.assertAlmostEqual(instance_seconds("C3_26",'bertini_solve',0,1,path=self.path),1.0)
+		self.assertAlmostEqual(instance_seconds("C3_26",'random_eqs',1,2,path=self.path),0.4)
+		self.assertIsNone(instance_seconds("C3_26",'random_eqs',0,1,path=self.path))
+
+	#Stores made before the seconds column existed get it when they are opened
+	def test_old_store(self):
+		conn = sqlite3.connect(self.path)
+		conn.executescript('''CREATE TABLE runs (run_id INTEGER PRIMARY KEY, graph_id TEXT NOT NULL, script TEXT NOT NULL,
+			mu REAL NOT NULL, var REAL NOT NULL, iters INTEGER, timestamp TEXT, source TEXT UNIQUE);''')
+		conn.close()
+		add_run('random_eqs',"C3_26",{2:10},iters=10,seconds=0.2,path=self.path)
+		self.assertAlmostEqual(instance_seconds("C3_26",'random_eqs',path=self.path),0.2)
+		self.assertEqual(num_instances("C3_26",path=self.path),10)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,49 @@
+#Tests of the run log in runlog.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import tempfile
+import shutil
+import os
+
+from runlog import RunLog, read_log, read_header, completed
+
+class ResumeTest(unittest.TestCase):
+	def setUp(self):
+		self.folder = tempfile.mkdtemp()
+		self.path = os.path.join(self.folder,'log')
+
+	def tearDown(self):
+		shutil.rmtree(self.folder)
+
+	def test_resume_after_a_cut_off_line(self):
+		log = RunLog(self.path,7)
+		log.header(n=3,edges=[(0,1),(1,2),(0,2)],seed=7)
+		for i in range(20):
+			log.record(i,[0.5,-1.0,2.0],2)
+		#A killed run leaves the start of the record of instance 20
+		with open(self.path,'a') as f:
+			f.write('{"seed": 7, "i": 20, "b": [0.1')
+
+		resumed = RunLog(self.path,7,completed(self.path))
+		self.assertEqual(len(resumed.done),20)
+		resumed.record(21,[1.0,1.0,1.0],6)
+		resumed.record(22,[1.0,1.0,1.0],2)
+
+		records = list(read_log(self.path))
+		self.assertEqual([rec['i'] for rec in records],range(20)+[21,22])
+		self.assertEqual(records[-2]['real'],6)
+		self.assertEqual(read_header(self.path)['seed'],7)
+
+	def test_resume_after_a_complete_line(self):
+		log = RunLog(self.path,7)
+		log.header(n=3,edges=[(0,1)],seed=7)
+		log.record(0,[1.0],2)
+		resumed = RunLog(self.path,7,completed(self.path))
+		resumed.record(1,[1.0],4)
+		with open(self.path,'r') as f:
+			self.assertEqual(len(f.read().splitlines()),3)#No empty line is added
+
+if __name__ == '__main__':
+	unittest.main()
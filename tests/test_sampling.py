@@ -0,0 +1,27 @@
+#Tests of the sampling of the instances in sampling.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import numpy as np
+
+from sampling import BATCH_SIZE, instance_susceptances, iter_instance_batches, iter_instances
+
+class InstanceTest(unittest.TestCase):
+	#The instances of a run do not depend on how the run is split, and any instance can be drawn on its own
+	def test_instances_do_not_depend_on_the_split(self):
+		whole = np.concatenate(list(iter_instance_batches(7,0,2*BATCH_SIZE+5,3,1,2)))
+		self.assertEqual(whole.shape,(2*BATCH_SIZE+5,3))
+		start, stop = BATCH_SIZE-4, BATCH_SIZE+6
+		self.assertTrue(np.array_equal(np.concatenate(list(iter_instance_batches(7,start,stop,3,1,2))),whole[start:stop]))
+		self.assertTrue(np.array_equal(np.array(list(iter_instances(7,start,stop,3,1,2))),whole[start:stop]))
+		indices = [2*BATCH_SIZE+4,0,BATCH_SIZE,17]
+		self.assertTrue(np.array_equal(instance_susceptances(7,indices,3,1,2),whole[indices]))
+
+	def test_batches_stay_within_blocks(self):
+		sizes = [b.shape[0] for b in iter_instance_batches(3,BATCH_SIZE-10,2*BATCH_SIZE+10,2)]
+		self.assertEqual(sizes,[10,BATCH_SIZE,10])
+		self.assertFalse(np.array_equal(instance_susceptances(3,[5],2),instance_susceptances(4,[5],2)))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,113 @@
+#Tests of the work queue of sharded runs in shards.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import multiprocessing
+import tempfile
+import shutil
+import time
+import os
+import numpy as np
+
+import shards
+from graphs import complete_graph
+from sampling import instance_susceptances
+from homotopy import solve_batch
+
+ITERS = 10
+UNIT = 4
+
+#Claims units of the queue until it is empty, and puts the names of the units it claimed on out.
+def _claim_all(queue,out):
+	names = []
+	while True:
+		path = shards.claim(queue)
+		if path is None:
+			break
+		names.append(os.path.basename(path))
+	out.put(names)
+
+class QueueTest(unittest.TestCase):
+	def setUp(self):
+		self.folder = tempfile.mkdtemp()
+		self.cwd = os.getcwd()
+		os.chdir(self.folder)#make_queue stores the root counts in Data/results.db, which is here
+		os.mkdir('Data')
+		self.queue = os.path.join(self.folder,'queue')
+		self.graph = complete_graph(3)
+		self.plan = shards.make_queue(self.queue,self.graph,'K3',ITERS,UNIT,backend='native',seed=11)
+
+	def tearDown(self):
+		os.chdir(self.cwd)
+		shutil.rmtree(self.folder)
+
+	def test_make_queue(self):
+		self.assertEqual(self.plan['num_units'],3)
+		self.assertEqual(shards.read_plan(self.queue)['seed'],11)
+		self.assertEqual(self.plan['root_counts']['generic'],6)
+		self.assertEqual(shards.status(self.queue),(3,0,0))
+		units = [shards._read_json(os.path.join(self.queue,shards.TODO,name)) for name in shards._units(self.queue,shards.TODO)]
+		self.assertEqual([(u['start'],u['stop']) for u in units],[(0,4),(4,8),(8,10)])
+
+	#A worker whose list of units is out of date skips the unit another worker renamed first
+	def test_claim_race(self):
+		listing = shards._units(self.queue,shards.TODO)
+		os.rename(os.path.join(self.queue,shards.TODO,listing[0]),os.path.join(self.queue,shards.CLAIMED,listing[0]))
+		units = shards._units
+		shards._units = lambda queue, folder: listing if folder == shards.TODO else units(queue,folder)
+		try:
+			path = shards.claim(self.queue)
+		finally:
+			shards._units = units
+		self.assertEqual(os.path.basename(path),listing[1])
+		self.assertEqual(shards.status(self.queue),(1,2,0))
+
+	#Workers claiming at the same time claim every unit exactly once
+	def test_claim_processes(self):
+		out = multiprocessing.Queue()
+		workers = [multiprocessing.Process(target=_claim_all,args=(self.queue,out)) for k in range(4)]
+		for p in workers:
+			p.start()
+		names = sum([out.get() for p in workers],[])
+		for p in workers:
+			p.join()
+		self.assertEqual(sorted(names),['unit_%06d.json' % k for k in range(3)])
+		self.assertEqual(shards.status(self.queue),(0,3,0))
+
+	def test_requeue(self):
+		stale = shards.claim(self.queue)
+		fresh = shards.claim(self.queue)
+		past = time.time()-100
+		os.utime(stale,(past,past))
+		self.assertEqual(shards.requeue(self.queue,50),1)
+		self.assertEqual(shards.status(self.queue),(2,1,0))
+		self.assertTrue(os.path.exists(os.path.join(self.queue,shards.TODO,os.path.basename(stale))))
+		self.assertTrue(os.path.exists(fresh))
+		#A claim that is already done is removed instead
+		shards._write_json(os.path.join(self.queue,shards.DONE,os.path.basename(fresh)),{})
+		self.assertEqual(shards.requeue(self.queue,50),0)
+		self.assertEqual(shards.status(self.queue),(2,0,1))
+
+	def test_work_and_merge(self):
+		self.assertEqual(shards.work(self.queue,self.folder),3)
+		self.assertEqual(shards.status(self.queue),(0,0,3))
+		results = list(shards.done_units(self.queue))
+		freq_count, instances, failures = shards.merge_units(self.queue)
+		self.assertEqual(instances,ITERS)
+		counted = [r for result in results for r in result['real'] if r is not None and r%2 == 0]
+		self.assertEqual(sum(freq_count.values()),len(counted))
+		self.assertEqual(sum(failures.values()),ITERS-len(counted))
+		for k, v in freq_count.items():
+			self.assertEqual(counted.count(k),v)
+		#The real solutions of every unit follow from the seed of the plan alone
+		for result in results:
+			b = instance_susceptances(self.plan['seed'],range(result['start'],result['stop']),len(self.graph.edges))
+			real = [int(np.sum(np.all(np.abs(sols.imag) <= self.plan['tol'],axis=1))) for sols in solve_batch(3,self.graph.edges,b)]
+			self.assertEqual(len(result['real']),result['stop']-result['start'])
+			for r, expected in zip(result['real'],real):
+				if r is not None:
+					self.assertEqual(r,expected)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,43 @@
+#Tests of the scratch folders in workspace.py.
+#Run from the top folder with: python -m unittest discover tests
+#
+
+import unittest
+import tempfile
+import shutil
+import os
+
+import workspace
+
+#Output: A process id that is not in use.
+def dead_pid():
+	pid = 4000000
+	while workspace._alive(pid):
+		pid -= 1
+	return pid
+
+class SweepTest(unittest.TestCase):
+	def setUp(self):
+		self.root = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.root)
+
+	def test_sweeps_only_this_host(self):
+		pid = dead_pid()
+		local = workspace._host_prefix()+str(pid)+'_run_x'
+		other = 'powersystems_otherhost_'+str(pid)+'_run_x'
+		for name in [local,other]:
+			os.mkdir(os.path.join(self.root,name))
+		workspace.sweep_stale(self.root)
+		self.assertEqual(os.listdir(self.root),[other])
+
+	def test_keeps_live_folders(self):
+		with workspace.Workspace(self.root) as ws:
+			workspace.sweep_stale(self.root)
+			self.assertTrue(os.path.isdir(ws.path))
+			self.assertTrue(os.path.basename(ws.path).startswith(workspace._host_prefix()+str(os.getpid())+'_'))
+		self.assertEqual(os.listdir(self.root),[])
+
+if __name__ == '__main__':
+	unittest.main()
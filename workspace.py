@@ -0,0 +1,114 @@
+#Scratch folders for the files the solvers read and write.
+#
+#Every instance writes an input file, and Bertini and PHC write several output files next to it.
+#Instead of doing this in the folder of the code and deleting the files with ./rm afterwards,
+#a run gets one scratch folder, by default under /dev/shm so the files never reach the disk,
+#and reuses it for all of its instances. Files are removed with os.unlink in-process, and the
+#whole folder is removed when the run ends, also when it ends with an exception or SIGTERM.
+#
+#The scratch folders are named after the host and the process that created them, so that the folders of
+#runs that were killed outright (eg. with SIGKILL) are removed by the next run on the same host. Only the
+#folders of the local host are checked, since the process ids of other hosts (eg. when POWERSYSTEMS_SCRATCH
+#is a shared folder) cannot be checked from here.
+#
+#The folder used can be changed with the environment variable POWERSYSTEMS_SCRATCH,
+#or with the option -scratch of the drivers.
+#
+
+import tempfile
+import shutil
+import atexit
+import signal
+import socket
+import errno
+import os
+
+#Output: The folder the scratch folders are created in.
+#This is $POWERSYSTEMS_SCRATCH if it is set, otherwise the RAM-backed /dev/shm if it is available, otherwise the system temp folder.
+def default_root():
+	if os.environ.get('POWERSYSTEMS_SCRATCH'):
+		return os.environ['POWERSYSTEMS_SCRATCH']
+	if os.path.isdir('/dev/shm') and os.access('/dev/shm',os.W_OK):
+		return '/dev/shm'
+	return tempfile.gettempdir()
+
+#Removes the files names in the folder workdir, ignoring those that do not exist.
+def remove_files(workdir,*names):
+	for name in names:
+		try:
+			os.unlink(os.path.join(workdir,name))
+		except OSError as e:
+			if e.errno != errno.ENOENT:
+				raise
+
+#Removes every file in the folder workdir, but keeps the folder (and its subfolders) for the next instances.
+def clear(workdir):
+	for name in os.listdir(workdir):
+		if not os.path.isdir(os.path.join(workdir,name)):
+			remove_files(workdir,name)
+
+#Output: True if a process with the given id is running.
+def _alive(pid):
+	try:
+		os.kill(pid,0)
+	except OSError as e:
+		return e.errno == errno.EPERM
+	return True
+
+#Output: The prefix of the names of the scratch folders made on this host.
+#Underscores separate the parts of the name, so they are replaced in the host name.
+def _host_prefix():
+	return 'powersystems_'+socket.gethostname().replace('_','-')+'_'
+
+#Removes the scratch folders in root left behind by processes of this host that no longer exist.
+#The folders of other hosts are left alone, their processes may still be running.
+def sweep_stale(root):
+	prefix = _host_prefix()
+	for name in os.listdir(root):
+		if not name.startswith(prefix):
+			continue
+		parts = name[len(prefix):].split('_')
+		if len(parts) < 2 or not parts[0].isdigit():
+			continue
+		if not _alive(int(parts[0])):
+			shutil.rmtree(os.path.join(root,name),ignore_errors=True)
+
+#SIGTERM normally ends the process without running the atexit handlers, so we turn it into SystemExit.
+def _terminate(signum,frame):
+	raise SystemExit(128+signum)
+
+class Workspace(object):
+	#Creates a new scratch folder in root (see default_root).
+	#label is added to the name of the folder, so it is clear which run it belongs to.
+	def __init__(self,root=None,label='run'):
+		if root is None:
+			root = default_root()
+		if not os.path.isdir(root):
+			os.makedirs(root)
+		sweep_stale(root)
+		self._pid = os.getpid()
+		self.path = tempfile.mkdtemp(prefix=_host_prefix()+str(self._pid)+'_'+label+'_',dir=root)
+		atexit.register(self.close)
+		if signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+			signal.signal(signal.SIGTERM,_terminate)
+
+	#Output: A subfolder of the workspace, created if needed.
+	def subdir(self,name):
+		d = os.path.join(self.path,name)
+		if not os.path.isdir(d):
+			os.mkdir(d)
+		return d
+
+	#Removes the workspace and everything in it.
+	#Forked worker processes share the object, but only the process that created the workspace removes it.
+	def close(self):
+		if os.getpid() == self._pid and self.path is not None:
+			shutil.rmtree(self.path,ignore_errors=True)
+			self.path = None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self,exc_type,exc_value,traceback):
+		self.close()
+		return False